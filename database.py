@@ -4,26 +4,207 @@ Handles SQLite connections and schema management.
 """
 
 import json
+import os
+import shutil
 import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 import numpy as np
 
+# Face encodings are stored as contiguous float32 vectors of this dimension
+ENCODING_DIM = 128
+ENCODING_DTYPE = np.float32
+ENCODING_BYTES = ENCODING_DIM * np.dtype(ENCODING_DTYPE).itemsize
+
+
+def encoding_to_blob(encoding: np.ndarray) -> bytes:
+    """Convert a face encoding to the float32 BLOB stored in the database."""
+    return np.ascontiguousarray(encoding, dtype=ENCODING_DTYPE).tobytes()
+
+
+# Databases from before the float32 format hold float64 BLOBs of this size
+LEGACY_ENCODING_BYTES = ENCODING_DIM * np.dtype(np.float64).itemsize
+
+
+def blob_to_encoding(blob: bytes) -> np.ndarray:
+    """
+    Convert a stored encoding BLOB back to a float32 numpy array.
+
+    Legacy float64 BLOBs are recognised by their length and cast down.
+    """
+    if len(blob) == LEGACY_ENCODING_BYTES:
+        return np.frombuffer(blob, dtype=np.float64).astype(ENCODING_DTYPE)
+    return np.frombuffer(blob, dtype=ENCODING_DTYPE)
+
+
+# Optional compact format: a float32 scale followed by ENCODING_DIM int8
+# values, with encoding = scale * q (symmetric quantization)
+ENCODING_FORMAT_FLOAT32 = "float32"
+ENCODING_FORMAT_INT8 = "int8-sym"
+QUANTIZED_BYTES = np.dtype(ENCODING_DTYPE).itemsize + ENCODING_DIM
+
+
+def quantize_encoding(encoding: np.ndarray) -> bytes:
+    """Convert a face encoding to the int8-sym BLOB stored in the database."""
+    vector = np.asarray(encoding, dtype=ENCODING_DTYPE)
+    scale = np.abs(vector).max() / 127 if vector.size else 0
+    scale = ENCODING_DTYPE(scale if scale > 0 else 1.0)
+    q = np.clip(np.rint(vector / scale), -127, 127).astype(np.int8)
+    return scale.tobytes() + q.tobytes()
+
+
+def dequantize_encodings(blobs: List[bytes], dim: int = ENCODING_DIM) -> np.ndarray:
+    """Convert int8-sym BLOBs back to an (N, dim) float32 matrix."""
+    itemsize = np.dtype(ENCODING_DTYPE).itemsize
+    packed = np.frombuffer(b"".join(blobs), dtype=np.uint8).reshape(-1, itemsize + dim)
+    scales = packed[:, :itemsize].copy().view(ENCODING_DTYPE)
+    return packed[:, itemsize:].view(np.int8).astype(ENCODING_DTYPE) * scales
+
+
+# Face thumbnail JPEGs are appended to this file in a thumbnail root, and
+# each face records the (offset, length) of its own
+FACE_THUMBNAIL_PACK = "faces.dat"
+
+
+def face_thumbnail_relpath(face_id: int) -> Path:
+    """Location of a pre-pack face thumbnail, relative to a thumbnail root."""
+    return Path(str(face_id // 1000)) / f"{face_id}.jpg"
+
+
+def encodings_sidecar_path(db_path) -> Path:
+    """
+    Path of the raw float32 encodings file kept beside a database file.
+
+    Project files saved by ProjectSaveWorker use the same layout, so a
+    Database opened on a project reads its encodings directly.
+    """
+    return Path(db_path).with_suffix(".encodings.bin")
+
+
+# Secondary indexes on face_instances, dropped during bulk ingest
+_FACE_INDEXES = (
+    ("idx_face_instances_person_timestamp", "person_id, timestamp"),
+    ("idx_face_instances_video", "video_id"),
+    ("idx_face_instances_timestamp", "timestamp"),
+)
+
+# Prepared statements kept per connection (sqlite3 defaults to 128)
+_CACHED_STATEMENTS = 256
+
+# Statement text is kept at module scope so sqlite3's statement cache
+# sees the same string on every call.
+_INS_VIDEO_SQL = """
+    INSERT INTO videos
+    (file_path, file_name, duration, fps, width, height, roi_x, roi_y, roi_w, roi_h)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INS_PERSON_SQL = """
+    INSERT INTO persons (video_id, cluster_id, name, thumbnail_path)
+    VALUES (?, ?, ?, ?)
+"""
+
+_INS_FACE_SQL = """
+    INSERT INTO face_instances
+    (person_id, video_id, timestamp, frame_number,
+     bbox_x, bbox_y, bbox_w, bbox_h, encoding, encoding_dtype, enc_offset, enc_dim,
+     thumb_offset, thumb_length, confidence)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _close_reader(connection, open_readers, lock):
+    """Close a reader connection unless Database.close() already has."""
+    with lock:
+        if connection not in open_readers:
+            return
+        open_readers.discard(connection)
+    connection.close()
+
+
+class _ThreadReader:
+    """
+    One thread's reader connection, kept in a threading.local.
+
+    The local drops it when its thread exits, so readers opened by
+    short-lived QThreads and pool threads are closed with their thread
+    rather than accumulating until Database.close().
+    """
+
+    def __init__(self, connection, open_readers, lock):
+        self.connection = connection
+        weakref.finalize(self, _close_reader, connection, open_readers, lock)
+
 
 class Database:
     """Manages all database operations for the application."""
 
-    def __init__(self, db_path: str = "faceindex.db"):
+    def __init__(
+        self,
+        db_path: str = "faceindex.db",
+        encoding_format: str = ENCODING_FORMAT_FLOAT32,
+    ):
+        if encoding_format not in (ENCODING_FORMAT_FLOAT32, ENCODING_FORMAT_INT8):
+            raise ValueError(f"Unknown encoding format: {encoding_format}")
+
         self.db_path = db_path
+        self.encoding_format = encoding_format
+        self.thumbnail_root = Path(db_path).parent / "thumbs"
+        self.thumbnail_pack_path = self.thumbnail_root / FACE_THUMBNAIL_PACK
         self.connection = None
+        self.encodings_path = None  # Sidecar file, set by initialize()
+        self._quantize = False
+        # The writer connection is shared by every thread: one thread at a
+        # time holds the write lock for its whole outermost transaction(),
+        # and each thread tracks its own nesting depth
+        self._write_lock = threading.RLock()
+        self._transaction_state = threading.local()
+
+        # Read-only connections, one per live thread that reads
+        self._readers = threading.local()
+        self._reader_connections = set()
+        self._reader_lock = threading.Lock()
+
         self.initialize()
 
     def initialize(self):
-        """Create database connection and tables if they don't exist."""
-        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        """
+        Create database connection and tables if they don't exist.
+
+        The database runs in WAL mode so readers don't block the writer and
+        commits only append to the log. WAL requires the database file to
+        live on a local filesystem (not a network share).
+        """
+        self.connection = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+        )
         self.connection.row_factory = sqlite3.Row
+        self._configure_connection()
+        self.create_schema()
+
+    def create_schema(self):
+        """Create any missing tables, indexes and triggers."""
         self._create_tables()
+        self._configure_encoding_storage()
+
+    def _configure_connection(self):
+        """Apply journal and cache PRAGMAs to the connection."""
+        # Only takes effect on a new, empty database, and must come before
+        # the switch to WAL; freed pages are returned by incremental_vacuum
+        self.connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.execute("PRAGMA temp_store = MEMORY")
+        self.connection.execute("PRAGMA cache_size = -65536")  # 64 MB
+        self.connection.execute("PRAGMA mmap_size = 268435456")  # 256 MB
+        self.connection.execute("PRAGMA busy_timeout = 5000")
+        self.connection.execute("PRAGMA foreign_keys = ON")
 
     def _create_tables(self):
         """Create all necessary tables."""
@@ -65,7 +246,7 @@ class Database:
         """)
 
         # Face Instances table
-        cursor.execute("""
+        cursor.execute(f"""
             CREATE TABLE IF NOT EXISTS face_instances (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 person_id INTEGER NOT NULL,
@@ -76,33 +257,413 @@ class Database:
                 bbox_y INTEGER,
                 bbox_w INTEGER,
                 bbox_h INTEGER,
-                encoding BLOB NOT NULL,
+                encoding BLOB CHECK (
+                    encoding IS NULL
+                    OR length(encoding) IN ({ENCODING_BYTES}, {QUANTIZED_BYTES})
+                ),
+                encoding_dtype TEXT,
+                enc_offset INTEGER,
+                enc_dim INTEGER,
+                thumb_offset INTEGER,
+                thumb_length INTEGER,
                 confidence REAL,
-                thumbnail_path TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (person_id) REFERENCES persons (id) ON DELETE CASCADE,
                 FOREIGN KEY (video_id) REFERENCES videos (id) ON DELETE CASCADE
             )
         """)
 
-        # Create indices for faster queries
+        # Databases created before the encodings sidecar lack its columns
+        self._ensure_column("face_instances", "enc_offset", "INTEGER")
+        self._ensure_column("face_instances", "enc_dim", "INTEGER")
+        self._ensure_column("face_instances", "encoding_dtype", "TEXT")
+        # ... and those from before the thumbnail pack its span columns
+        self._ensure_column("face_instances", "thumb_offset", "INTEGER")
+        self._ensure_column("face_instances", "thumb_length", "INTEGER")
+        self._drop_face_thumbnail_column()
+
+        # Create indices for faster queries. The (person_id, timestamp)
+        # index also serves person_id-only lookups, so it replaces the
+        # old single-column idx_face_instances_person.
+        cursor.execute("DROP INDEX IF EXISTS idx_face_instances_person")
+        self._create_face_indexes()
+
+        # get_persons_by_video is served by the UNIQUE(video_id, cluster_id)
+        # index. The covering index earlier versions kept on face_count was
+        # rewritten by the triggers below on every face insert and delete.
+        cursor.execute("DROP INDEX IF EXISTS idx_persons_video_facecount")
+
+        # Keep persons.face_count in sync inside the engine
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_face_instances_person
-            ON face_instances(person_id)
+            CREATE TRIGGER IF NOT EXISTS trg_face_instances_insert
+            AFTER INSERT ON face_instances
+            BEGIN
+                UPDATE persons SET face_count = face_count + 1
+                WHERE id = NEW.person_id;
+            END
         """)
 
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_face_instances_video
-            ON face_instances(video_id)
+            CREATE TRIGGER IF NOT EXISTS trg_face_instances_delete
+            AFTER DELETE ON face_instances
+            BEGIN
+                UPDATE persons SET face_count = face_count - 1
+                WHERE id = OLD.person_id;
+            END
         """)
 
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_face_instances_timestamp
-            ON face_instances(timestamp)
+            CREATE TRIGGER IF NOT EXISTS trg_face_instances_reassign
+            AFTER UPDATE OF person_id ON face_instances
+            WHEN OLD.person_id IS NOT NEW.person_id
+            BEGIN
+                UPDATE persons SET face_count = face_count - 1
+                WHERE id = OLD.person_id;
+                UPDATE persons SET face_count = face_count + 1
+                WHERE id = NEW.person_id;
+            END
         """)
 
         self.connection.commit()
 
+    def _create_face_indexes(self):
+        """Create the secondary indexes on face_instances."""
+        for name, columns in _FACE_INDEXES:
+            self.connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {name} ON face_instances({columns})"
+            )
+
+    def prepare_bulk_ingest(self) -> bool:
+        """
+        Drop the face_instances secondary indexes before a first import.
+
+        Only an empty table has them dropped: inserts then skip per-row
+        B-tree maintenance and finalize_bulk_ingest() builds the indexes in
+        one sorted pass over just the imported rows. Rebuilding them over a
+        populated table would cost more than the ingest saves, so they are
+        kept then. Returns whether the indexes were dropped.
+        """
+        with self.transaction():
+            if self.connection.execute(
+                "SELECT 1 FROM face_instances LIMIT 1"
+            ).fetchone():
+                return False
+            for name, _ in _FACE_INDEXES:
+                self.connection.execute(f"DROP INDEX IF EXISTS {name}")
+        return True
+
+    def finalize_bulk_ingest(self):
+        """Rebuild the indexes dropped by prepare_bulk_ingest() and ANALYZE."""
+        with self.transaction():
+            self._create_face_indexes()
+        self.maintenance()
+
+    @contextmanager
+    def bulk_ingest(self):
+        """
+        Run a large ingest as one transaction.
+
+        On a first import the face indexes are dropped for the block and
+        rebuilt at its end, inside the same transaction, so a block that
+        raises rolls back the dropped indexes along with its rows.
+        """
+        with self.transaction():
+            dropped = self.prepare_bulk_ingest()
+            yield self.connection
+            if dropped:
+                self.finalize_bulk_ingest()
+
+    def _ensure_column(self, table: str, column: str, declaration: str):
+        """Add a column to an existing table if it is missing."""
+        cursor = self.connection.execute(f"PRAGMA table_info({table})")
+        if column not in {row["name"] for row in cursor}:
+            self.connection.execute(
+                f"ALTER TABLE {table} ADD COLUMN {column} {declaration}"
+            )
+
+    def _drop_face_thumbnail_column(self):
+        """
+        Migrate face thumbnails from stored paths to thumbnail_path_for().
+
+        Older databases kept a thumbnail_path string on every face
+        instance. The files are moved to their id-derived location and
+        the column is dropped (DROP COLUMN needs SQLite 3.35+; older
+        libraries keep the unused column).
+        """
+        cursor = self.connection.execute("PRAGMA table_info(face_instances)")
+        if "thumbnail_path" not in {row["name"] for row in cursor}:
+            return
+
+        rows = self.connection.execute(
+            """
+            SELECT id, thumbnail_path FROM face_instances
+            WHERE thumbnail_path IS NOT NULL
+        """
+        ).fetchall()
+        for row in rows:
+            source = Path(row["thumbnail_path"])
+            target = self.thumbnail_path_for(row["id"])
+            if source.exists() and source != target:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.move(str(source), str(target))
+
+        if sqlite3.sqlite_version_info >= (3, 35, 0):
+            self.connection.execute(
+                "ALTER TABLE face_instances DROP COLUMN thumbnail_path"
+            )
+        else:
+            self.connection.execute("UPDATE face_instances SET thumbnail_path = NULL")
+
+    def thumbnail_path_for(self, face_id: int) -> Path:
+        """Return where a face saved before the thumbnail pack keeps its image."""
+        return self.thumbnail_root / face_thumbnail_relpath(face_id)
+
+    def _append_thumbnails(
+        self, thumbnails: List[Optional[bytes]]
+    ) -> List[Tuple[Optional[int], Optional[int]]]:
+        """
+        Append JPEG thumbnails to the pack file in one sequential write.
+
+        Returns the (offset, length) span of each thumbnail, or
+        (None, None) where there is none. Like _append_encodings(), it
+        must be called inside the write transaction and syncs the file
+        before the rows that reference it can commit.
+        """
+        spans = [(None, None)] * len(thumbnails)
+        if all(thumbnail is None for thumbnail in thumbnails):
+            return spans
+
+        self.thumbnail_root.mkdir(parents=True, exist_ok=True)
+        with open(self.thumbnail_pack_path, "ab") as f:
+            offset = f.seek(0, os.SEEK_END)
+            for i, thumbnail in enumerate(thumbnails):
+                if thumbnail is not None:
+                    spans[i] = (offset, len(thumbnail))
+                    offset += len(thumbnail)
+            f.write(b"".join(t for t in thumbnails if t is not None))
+            f.flush()
+            os.fsync(f.fileno())
+        return spans
+
+    def get_face_thumbnail(self, face_id: int) -> Optional[bytes]:
+        """Return the JPEG bytes of a face thumbnail, or None if it has none."""
+        row = (
+            self._get_reader()
+            .execute(
+                "SELECT thumb_offset, thumb_length FROM face_instances WHERE id = ?",
+                (face_id,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+
+        offset, length = row
+        if offset is None:
+            path = self.thumbnail_path_for(face_id)
+            return path.read_bytes() if path.exists() else None
+        with open(self.thumbnail_pack_path, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+
+    def _configure_encoding_storage(self):
+        """
+        Decide where new face encodings are written.
+
+        Encodings go to a flat float32 file next to the database, one
+        ENCODING_DIM row per face, and face_instances only records the row
+        offset. Bulk loads then read one contiguous memory map instead of
+        a BLOB per B-tree row. Databases whose schema still declares
+        encoding NOT NULL, and in-memory databases, keep storing BLOBs.
+
+        With encoding_format="int8-sym" new encodings are instead stored
+        inline as QUANTIZED_BYTES BLOBs, a quarter of the float32 size.
+        The old NOT NULL schema only accepts float32 BLOBs, so it keeps
+        using float32 regardless of the setting.
+        """
+        columns = {
+            row["name"]: row
+            for row in self.connection.execute("PRAGMA table_info(face_instances)")
+        }
+        legacy_schema = bool(columns["encoding"]["notnull"])
+
+        self._quantize = (
+            self.encoding_format == ENCODING_FORMAT_INT8 and not legacy_schema
+        )
+        self.encodings_path = None
+        if self.db_path != ":memory:" and not legacy_schema:
+            self.encodings_path = encodings_sidecar_path(self.db_path)
+
+    def _append_encodings(self, blobs: List[bytes]) -> int:
+        """
+        Append encodings to the sidecar file and return the first row offset.
+
+        Must be called while holding the write transaction so offsets are
+        not handed out twice. The file is synced before the rows that
+        reference it can commit.
+        """
+        with open(self.encodings_path, "ab") as f:
+            size = f.seek(0, os.SEEK_END)
+            # A torn earlier append leaves a partial row; skip past it
+            first = -(-size // ENCODING_BYTES)
+            f.write(b"\0" * (first * ENCODING_BYTES - size))
+            f.write(b"".join(blobs))
+            f.flush()
+            os.fsync(f.fileno())
+        return first
+
+    def _open_encodings(self, dim: int) -> Optional[np.ndarray]:
+        """Memory-map the sidecar file as an (N, dim) float32 array."""
+        if self.encodings_path is None or not self.encodings_path.exists():
+            return None
+        row_bytes = dim * np.dtype(ENCODING_DTYPE).itemsize
+        rows = self.encodings_path.stat().st_size // row_bytes
+        if rows == 0:
+            return None
+        return np.memmap(
+            self.encodings_path, dtype=ENCODING_DTYPE, mode="r", shape=(rows, dim)
+        )
+
+    def compact_encodings(self):
+        """
+        Rewrite the sidecar file without the rows of deleted faces.
+
+        Live encodings are copied in face id order to a new file and their
+        offsets renumbered in the same transaction. Run it when no other
+        process is writing to the database.
+        """
+        if self.encodings_path is None:
+            return
+
+        with self.transaction():
+            rows = self.connection.execute(
+                """
+                SELECT id, enc_offset FROM face_instances
+                WHERE enc_offset IS NOT NULL
+                ORDER BY id
+            """
+            ).fetchall()
+            offsets = np.fromiter((row[1] for row in rows), dtype=np.int64)
+
+            tmp_path = self.encodings_path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                if len(offsets):
+                    source = self._open_encodings(ENCODING_DIM)
+                    f.write(np.ascontiguousarray(source[offsets]).tobytes())
+                    del source
+                f.flush()
+                os.fsync(f.fileno())
+
+            self.connection.executemany(
+                "UPDATE face_instances SET enc_offset = ? WHERE id = ?",
+                ((new, row[0]) for new, row in enumerate(rows)),
+            )
+            os.replace(tmp_path, self.encodings_path)
+
+    def _get_reader(self) -> sqlite3.Connection:
+        """
+        Return the calling thread's read-only connection.
+
+        Each thread gets its own connection, opened on first use and closed
+        when the thread exits, so reads from the UI and from workers run in
+        parallel instead of queueing on the writer's lock. WAL lets them
+        proceed while a write is in flight. A thread inside transaction()
+        reads through the writer so it sees its own uncommitted rows.
+        In-memory databases are private to one connection and always use
+        the writer.
+        """
+        if (
+            self.db_path == ":memory:"
+            or getattr(self._transaction_state, "depth", 0) > 0
+        ):
+            return self.connection
+
+        slot = getattr(self._readers, "reader", None)
+        if slot is None:
+            uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+            reader = sqlite3.connect(
+                uri,
+                uri=True,
+                check_same_thread=False,
+                cached_statements=_CACHED_STATEMENTS,
+            )
+            reader.row_factory = sqlite3.Row
+            reader.execute("PRAGMA temp_store = MEMORY")
+            reader.execute("PRAGMA cache_size = -16384")  # 16 MB
+            reader.execute("PRAGMA mmap_size = 268435456")  # 256 MB
+            reader.execute("PRAGMA busy_timeout = 5000")
+            with self._reader_lock:
+                self._reader_connections.add(reader)
+            slot = _ThreadReader(reader, self._reader_connections, self._reader_lock)
+            self._readers.reader = slot
+        return slot.connection
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group writes into a single BEGIN IMMEDIATE ... COMMIT.
+
+        The write methods open their own transaction when called alone and
+        join the enclosing one when called inside this block, so a batch
+        of writes costs one commit:
+
+            with db.transaction():
+                for row in rows:
+                    db.add_face_instance(**row)
+
+        Blocks may be nested; only the outermost one commits. Any exception
+        rolls the whole transaction back. Nesting is per thread: a block
+        opened on another thread waits for the current one to finish
+        instead of joining it.
+        """
+        state = self._transaction_state
+        depth = getattr(state, "depth", 0)
+        if depth == 0:
+            self._write_lock.acquire()
+            try:
+                if not self.connection.in_transaction:
+                    self.connection.execute("BEGIN IMMEDIATE")
+            except BaseException:
+                self._write_lock.release()
+                raise
+        state.depth = depth + 1
+        try:
+            yield self.connection
+        except BaseException:
+            state.depth = depth
+            if depth == 0:
+                try:
+                    self.connection.rollback()
+                finally:
+                    self._write_lock.release()
+            raise
+        else:
+            state.depth = depth
+            if depth == 0:
+                try:
+                    self.connection.commit()
+                except BaseException:
+                    self.connection.rollback()
+                    raise
+                finally:
+                    self._write_lock.release()
+
+    def _insert_many(self, sql: str, params: List[tuple]) -> List[int]:
+        """Insert one row per parameter tuple and return their ids in order."""
+        if not params:
+            return []
+
+        # The write lock keeps other inserts out of the transaction, so
+        # AUTOINCREMENT hands the batch consecutive ids ending at the last
+        # rowid; one executemany() plus one query replaces a RETURNING
+        # round trip per row.
+        with self.transaction():
+            self.connection.executemany(sql, params)
+            (last_id,) = self.connection.execute(
+                "SELECT last_insert_rowid()"
+            ).fetchone()
+        return list(range(last_id - len(params) + 1, last_id + 1))
+
     def add_video(
         self,
         file_path: str,
@@ -114,41 +675,55 @@ class Database:
         roi: Tuple[int, int, int, int],
     ) -> int:
         """Add a new video to the database."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """
-            INSERT INTO videos
-            (file_path, file_name, duration, fps, width, height, roi_x, roi_y, roi_w, roi_h)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+        return self.add_videos(
+            [
+                {
+                    "file_path": file_path,
+                    "file_name": file_name,
+                    "duration": duration,
+                    "fps": fps,
+                    "width": width,
+                    "height": height,
+                    "roi": roi,
+                }
+            ]
+        )[0]
+
+    def add_videos(self, rows: Iterable[dict]) -> List[int]:
+        """
+        Add many videos in a single transaction.
+
+        Each row is a dict with the same keys as the arguments of
+        add_video(). Returns the new row ids in input order.
+        """
+        params = [
             (
-                file_path,
-                file_name,
-                duration,
-                fps,
-                width,
-                height,
-                roi[0],
-                roi[1],
-                roi[2],
-                roi[3],
-            ),
-        )
-        self.connection.commit()
-        return cursor.lastrowid
+                row["file_path"],
+                row["file_name"],
+                row["duration"],
+                row["fps"],
+                row["width"],
+                row["height"],
+                row["roi"][0],
+                row["roi"][1],
+                row["roi"][2],
+                row["roi"][3],
+            )
+            for row in rows
+        ]
+        return self._insert_many(_INS_VIDEO_SQL, params)
 
     def update_video_status(self, video_id: int, status: str):
         """Update processing status of a video."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """
-            UPDATE videos
-            SET processing_status = ?, processed_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """,
-            (status, video_id),
-        )
-        self.connection.commit()
+        with self.transaction():
+            self.connection.execute(
+                """
+                UPDATE videos
+                SET processing_status = ?, processed_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """,
+                (status, video_id),
+            )
 
     def add_person(
         self,
@@ -158,16 +733,34 @@ class Database:
         thumbnail_path: Optional[str] = None,
     ) -> int:
         """Add a new person (cluster) to the database."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """
-            INSERT INTO persons (video_id, cluster_id, name, thumbnail_path)
-            VALUES (?, ?, ?, ?)
-        """,
-            (video_id, cluster_id, name, thumbnail_path),
-        )
-        self.connection.commit()
-        return cursor.lastrowid
+        return self.add_persons(
+            [
+                {
+                    "video_id": video_id,
+                    "cluster_id": cluster_id,
+                    "name": name,
+                    "thumbnail_path": thumbnail_path,
+                }
+            ]
+        )[0]
+
+    def add_persons(self, rows: Iterable[dict]) -> List[int]:
+        """
+        Add many persons (clusters) in a single transaction.
+
+        Each row is a dict with the same keys as the arguments of
+        add_person(). Returns the new row ids in input order.
+        """
+        params = [
+            (
+                row["video_id"],
+                row["cluster_id"],
+                row.get("name"),
+                row.get("thumbnail_path"),
+            )
+            for row in rows
+        ]
+        return self._insert_many(_INS_PERSON_SQL, params)
 
     def add_face_instance(
         self,
@@ -178,64 +771,123 @@ class Database:
         bbox: Tuple[int, int, int, int],
         encoding: np.ndarray,
         confidence: float = 1.0,
-        thumbnail_path: Optional[str] = None,
+        thumbnail: Optional[bytes] = None,
     ) -> int:
-        """Add a face instance to the database."""
-        # Convert numpy array to bytes for storage
-        encoding_bytes = encoding.tobytes()
+        """
+        Add a face instance to the database.
 
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """
-            INSERT INTO face_instances
-            (person_id, video_id, timestamp, frame_number,
-             bbox_x, bbox_y, bbox_w, bbox_h, encoding, confidence, thumbnail_path)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                person_id,
-                video_id,
-                timestamp,
-                frame_number,
-                bbox[0],
-                bbox[1],
-                bbox[2],
-                bbox[3],
-                encoding_bytes,
-                confidence,
-                thumbnail_path,
-            ),
-        )
+        The encoding is stored as a contiguous float32 vector of
+        ENCODING_DIM values, whatever dtype it is passed in as. A thumbnail,
+        given as JPEG bytes, is appended to the thumbnail pack file.
+        """
+        return self.add_face_instances(
+            [
+                {
+                    "person_id": person_id,
+                    "video_id": video_id,
+                    "timestamp": timestamp,
+                    "frame_number": frame_number,
+                    "bbox": bbox,
+                    "encoding": encoding,
+                    "confidence": confidence,
+                    "thumbnail": thumbnail,
+                }
+            ]
+        )[0]
 
-        # Update person face count
-        cursor.execute(
-            """
-            UPDATE persons
-            SET face_count = face_count + 1
-            WHERE id = ?
-        """,
-            (person_id,),
-        )
+    def add_face_instances(self, rows: Iterable[dict]) -> List[int]:
+        """
+        Add many face instances in a single transaction.
 
-        self.connection.commit()
-        return cursor.lastrowid
+        Each row is a dict with the same keys as the arguments of
+        add_face_instance(). Returns the new row ids in input order.
+        persons.face_count is maintained by trg_face_instances_insert.
+        """
+        rows = list(rows)
+        if not rows:
+            return []
+
+        with self.transaction():
+            if self._quantize:
+                storage = [
+                    (quantize_encoding(row["encoding"]), ENCODING_FORMAT_INT8)
+                    + (None, None)
+                    for row in rows
+                ]
+            elif self.encodings_path is not None:
+                first = self._append_encodings(
+                    [encoding_to_blob(row["encoding"]) for row in rows]
+                )
+                storage = [
+                    (None, ENCODING_FORMAT_FLOAT32, first + i, ENCODING_DIM)
+                    for i in range(len(rows))
+                ]
+            else:
+                storage = [
+                    (encoding_to_blob(row["encoding"]), ENCODING_FORMAT_FLOAT32)
+                    + (None, None)
+                    for row in rows
+                ]
+            thumbnail_spans = self._append_thumbnails(
+                [row.get("thumbnail") for row in rows]
+            )
+
+            params = [
+                (
+                    row["person_id"],
+                    row["video_id"],
+                    row["timestamp"],
+                    row["frame_number"],
+                    row["bbox"][0],
+                    row["bbox"][1],
+                    row["bbox"][2],
+                    row["bbox"][3],
+                    *stored,
+                    *span,
+                    row.get("confidence", 1.0),
+                )
+                for row, stored, span in zip(rows, storage, thumbnail_spans)
+            ]
+            return self._insert_many(_INS_FACE_SQL, params)
 
     def get_persons_by_video(self, video_id: int) -> List[sqlite3.Row]:
-        """Get all persons for a specific video."""
-        cursor = self.connection.cursor()
-        cursor.execute(
+        """
+        Get all persons for a specific video, largest cluster first.
+
+        Rows are found through the UNIQUE(video_id, cluster_id) index; a
+        video has few persons, so sorting them costs less than keeping an
+        index on face_count, which changes with every face written.
+        """
+        return self._get_reader().execute(
             """
-            SELECT * FROM persons
+            SELECT id, cluster_id, name, thumbnail_path, face_count
+            FROM persons
             WHERE video_id = ?
             ORDER BY face_count DESC
         """,
             (video_id,),
-        )
-        return cursor.fetchall()
+        ).fetchall()
 
     def get_face_instances_by_person(self, person_id: int) -> List[sqlite3.Row]:
-        """Get all face instances for a person, ordered by timestamp."""
-        cursor = self.connection.cursor()
+        """
+        Get all face instances for a person, ordered by timestamp.
+
+        The encoding column is NULL for faces kept in the sidecar file;
+        use get_face_encoding() to read any face's vector.
+        """
+        return list(self.iter_face_instances_by_person(person_id))
+
+    def iter_face_instances_by_person(self, person_id: int) -> Iterator[sqlite3.Row]:
+        """
+        Yield the face instances for a person, ordered by timestamp.
+
+        Rows are fetched from the cursor in batches as the caller consumes
+        them, so memory stays bounded however large the cluster is. As with
+        get_face_instances_by_person(), read encodings with
+        get_face_encoding().
+        """
+        cursor = self._get_reader().cursor()
+        cursor.arraysize = 256
         cursor.execute(
             """
             SELECT * FROM face_instances
@@ -244,63 +896,225 @@ class Database:
         """,
             (person_id,),
         )
-        return cursor.fetchall()
+        yield from cursor
 
-    def get_video_by_id(self, video_id: int) -> Optional[sqlite3.Row]:
-        """Get video information by ID."""
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT * FROM videos WHERE id = ?", (video_id,))
-        return cursor.fetchone()
-
-    def get_all_videos(self) -> List[sqlite3.Row]:
-        """Get all videos."""
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT * FROM videos ORDER BY created_at DESC")
-        return cursor.fetchall()
+    def get_face_instances_meta_by_person(self, person_id: int) -> List[sqlite3.Row]:
+        """
+        Get the face instances for a person without their encodings.
 
-    def update_person_name(self, person_id: int, name: str):
-        """Update the name of a person."""
-        cursor = self.connection.cursor()
+        Use this for UI work like the timeline, which never needs the
+        encoding; recognition code reads encodings with get_face_encoding()
+        or load_embeddings_by_video().
+        """
+        cursor = self._get_reader().cursor()
+        cursor.arraysize = 256
         cursor.execute(
             """
-            UPDATE persons SET name = ? WHERE id = ?
+            SELECT id, video_id, timestamp, frame_number,
+                   bbox_x, bbox_y, bbox_w, bbox_h, confidence
+            FROM face_instances
+            WHERE person_id = ?
+            ORDER BY timestamp ASC
         """,
-            (name, person_id),
+            (person_id,),
         )
-        self.connection.commit()
+        return cursor.fetchall()
 
-    def merge_persons(self, source_person_id: int, target_person_id: int):
-        """Merge two persons by moving all face instances from source to target."""
-        cursor = self.connection.cursor()
+    def get_face_encoding(self, face_id: int) -> Optional[np.ndarray]:
+        """
+        Return the float32 encoding of one face instance, or None.
 
-        # Move all face instances
+        Resolves every storage format: a sidecar row offset, an int8-sym
+        BLOB, or a float32 (or legacy float64) BLOB.
+        """
+        row = (
+            self._get_reader()
+            .execute(
+                """
+                SELECT encoding, encoding_dtype, enc_offset, enc_dim
+                FROM face_instances WHERE id = ?
+            """,
+                (face_id,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+
+        blob, dtype, offset, dim = row
+        if offset is not None:
+            encodings = self._open_encodings(dim or ENCODING_DIM)
+            if encodings is None or offset >= len(encodings):
+                return None
+            return np.array(encodings[offset])
+        if blob is None:
+            return None
+        if dtype == ENCODING_FORMAT_INT8:
+            return dequantize_encodings([blob])[0]
+        return blob_to_encoding(blob).copy()
+
+    def load_embeddings_by_video(
+        self, video_id: int, dim: int = ENCODING_DIM
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Load every face encoding of a video into one contiguous matrix.
+
+        Returns (ids, person_ids, embeddings) where ids and person_ids are
+        int64 arrays and embeddings is a float32 array of shape (N, dim),
+        all in face instance id order. Sidecar encodings are gathered from
+        the memory-mapped file in one fancy-indexing step, and int8-sym
+        encodings are dequantized together in one vectorized pass.
+        """
+        cursor = self._get_reader().cursor()
         cursor.execute(
-            """
-            UPDATE face_instances
-            SET person_id = ?
-            WHERE person_id = ?
-        """,
-            (target_person_id, source_person_id),
+            "SELECT COUNT(*) FROM face_instances WHERE video_id = ?", (video_id,)
         )
+        n = cursor.fetchone()[0]
+
+        ids = np.empty(n, dtype=np.int64)
+        person_ids = np.empty(n, dtype=np.int64)
+        embeddings = np.empty((n, dim), dtype=ENCODING_DTYPE)
 
-        # Update target person face count
+        cursor.arraysize = 256
         cursor.execute(
             """
-            UPDATE persons
-            SET face_count = (
-                SELECT COUNT(*) FROM face_instances WHERE person_id = ?
-            )
-            WHERE id = ?
+            SELECT id, person_id, encoding, enc_offset, encoding_dtype
+            FROM face_instances
+            WHERE video_id = ?
+            ORDER BY id
         """,
-            (target_person_id, target_person_id),
+            (video_id,),
         )
+        offsets = np.full(n, -1, dtype=np.int64)
+        quantized_rows = []
+        quantized_blobs = []
+        count = 0
+        for row in cursor:
+            if count == n:
+                break
+            ids[count] = row[0]
+            person_ids[count] = row[1]
+            if row[3] is not None:
+                offsets[count] = row[3]
+            elif row[4] == ENCODING_FORMAT_INT8:
+                quantized_rows.append(count)
+                quantized_blobs.append(row[2])
+            else:
+                embeddings[count] = blob_to_encoding(row[2])
+            count += 1
 
-        # Delete source person
-        cursor.execute("DELETE FROM persons WHERE id = ?", (source_person_id,))
+        # Another writer may have changed the row count between statements
+        ids, person_ids = ids[:count], person_ids[:count]
+        embeddings, offsets = embeddings[:count], offsets[:count]
 
-        self.connection.commit()
+        in_sidecar = offsets >= 0
+        if in_sidecar.any():
+            encodings = self._open_encodings(dim)
+            if encodings is None:
+                raise FileNotFoundError(
+                    f"Face encodings file is missing: {self.encodings_path}"
+                )
+            embeddings[in_sidecar] = encodings[offsets[in_sidecar]]
+        if quantized_rows:
+            embeddings[quantized_rows] = dequantize_encodings(quantized_blobs, dim)
+
+        return ids, person_ids, embeddings
+
+    def get_video_by_id(self, video_id: int) -> Optional[sqlite3.Row]:
+        """Get video information by ID."""
+        return (
+            self._get_reader()
+            .execute("SELECT * FROM videos WHERE id = ?", (video_id,))
+            .fetchone()
+        )
+
+    def get_all_videos(self) -> List[sqlite3.Row]:
+        """Get all videos."""
+        return (
+            self._get_reader()
+            .execute("SELECT * FROM videos ORDER BY created_at DESC")
+            .fetchall()
+        )
+
+    def update_person_name(self, person_id: int, name: str):
+        """Update the name of a person."""
+        with self.transaction():
+            self.connection.execute(
+                """
+                UPDATE persons SET name = ? WHERE id = ?
+            """,
+                (name, person_id),
+            )
+
+    def merge_persons(self, source_person_id: int, target_person_id: int):
+        """Merge two persons by moving all face instances from source to target."""
+        with self.transaction():
+            # Move all face instances; trg_face_instances_reassign moves
+            # the face counts along with them
+            self.connection.execute(
+                """
+                UPDATE face_instances
+                SET person_id = ?
+                WHERE person_id = ?
+            """,
+                (target_person_id, source_person_id),
+            )
+
+            # Delete source person
+            self.connection.execute(
+                "DELETE FROM persons WHERE id = ?", (source_person_id,)
+            )
+
+        # Give the pages freed by the delete back to the filesystem
+        with self._write_lock:
+            self.connection.execute("PRAGMA incremental_vacuum").fetchall()
+
+    def reset(self):
+        """
+        Remove every video, person and face.
+
+        The tables are dropped and recreated rather than deleted row by row,
+        which also restarts their ids, and the freed pages are returned to
+        the filesystem.
+        """
+        # The whole reset holds the write lock, as create_schema() writes
+        # outside transaction()
+        with self._write_lock:
+            with self.transaction():
+                for table in ("face_instances", "persons", "videos"):
+                    self.connection.execute(f"DROP TABLE IF EXISTS {table}")
+            self.create_schema()
+            self.compact_encodings()
+            self.thumbnail_pack_path.unlink(missing_ok=True)
+            self.connection.execute("PRAGMA incremental_vacuum").fetchall()
+
+    def maintenance(self):
+        """Refresh planner statistics; run after large ingests."""
+        with self.transaction():
+            self.connection.execute("ANALYZE main.face_instances")
+            self.connection.execute("ANALYZE main.persons")
+
+    def backup(self, target: sqlite3.Connection):
+        """
+        Copy the whole database, schema included, into target.
+
+        Runs under the write lock, so no transaction on the shared writer
+        connection is in flight or starts mid-copy; SQLite will not back up
+        from a connection that is writing.
+        """
+        with self._write_lock:
+            self.connection.backup(target)
 
     def close(self):
         """Close database connection."""
+        with self._reader_lock:
+            for reader in self._reader_connections:
+                reader.close()
+            self._reader_connections.clear()
+        self._readers = threading.local()
+
         if self.connection:
-            self.connection.close()
+            with self._write_lock:
+                # Cheap incremental ANALYZE of whatever the session queried
+                self.connection.execute("PRAGMA optimize")
+                self.connection.close()
@@ -3,14 +3,18 @@ FaceIndex Local - Main Application Entry Point
 A desktop application for face detection, clustering, and video navigation.
 """
 
+import os
+import shutil
 import sys
+import time
+from functools import partial
 from pathlib import Path
 
-import qdarktheme
+import numpy as np
 
 # Import custom modules
 from database import Database
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction, QColor, QPalette
 from PyQt6.QtWidgets import (
     QApplication,
@@ -30,7 +34,93 @@ from PyQt6.QtWidgets import (
 from widgets.gallery import EmptyGalleryWidget, GalleryWidget
 from widgets.roi_selector import ROISelectorDialog
 from widgets.video_player import VideoPlayerWidget
-from workers import FaceProcessingWorker
+
+
+# Minimum time between progress dialog repaints (~30 Hz)
+PROGRESS_INTERVAL_MS = 33
+
+# Styles for the main window's own widgets, applied once at the window level
+# on top of the dark theme. Widgets opt in through their object names.
+APP_QSS = """
+#leftPanel, #leftPanel QWidget,
+#rightPanel, #rightPanel QWidget {
+    background-color: #1e1e1e;
+}
+QFrame#toolbar {
+    background-color: #252525;
+    padding: 10px;
+}
+QPushButton#addVideoBtn {
+    background-color: #007acc;
+    border: none;
+    border-radius: 4px;
+    padding: 10px 20px;
+    color: #ffffff;
+    font-weight: bold;
+    font-size: 13px;
+}
+QPushButton#addVideoBtn:hover {
+    background-color: #005a9e;
+}
+QLabel#playerHeader {
+    font-size: 16px;
+    font-weight: bold;
+    color: #fff;
+    padding: 10px;
+}
+QWidget#processingOverlay {
+    background-color: rgba(0, 0, 0, 0.8);
+}
+QFrame#processingDialog {
+    background-color: #2d2d2d;
+    border: 2px solid #3d3d3d;
+    border-radius: 8px;
+    padding: 20px;
+}
+QLabel#processingTitle {
+    background-color: transparent;
+    font-size: 16px;
+    font-weight: bold;
+    color: #fff;
+}
+QLabel#processingStatus {
+    background-color: transparent;
+    color: #aaa;
+    margin-top: 10px;
+}
+QProgressBar#processingProgress {
+    border: 1px solid #3d3d3d;
+    border-radius: 4px;
+    text-align: center;
+    color: #fff;
+    background-color: #1e1e1e;
+    height: 24px;
+}
+QProgressBar#processingProgress::chunk {
+    background-color: #007acc;
+    border-radius: 3px;
+}
+QPushButton#processingCancelBtn {
+    background-color: #3d3d3d;
+    border: none;
+    border-radius: 4px;
+    padding: 8px 16px;
+    color: #fff;
+    margin-top: 10px;
+}
+QPushButton#processingCancelBtn:hover {
+    background-color: #4d4d4d;
+}
+"""
+
+
+def _list_dir_names(directory) -> set:
+    """Names of the entries in a directory, read with one scandir call."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
 
 
 class ProcessingDialog(QFrame):
@@ -41,65 +131,31 @@ class ProcessingDialog(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFrameStyle(QFrame.Shape.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #2d2d2d;
-                border: 2px solid #3d3d3d;
-                border-radius: 8px;
-                padding: 20px;
-            }
-        """)
+        self.setObjectName("processingDialog")
 
         layout = QVBoxLayout(self)
 
         # Title
         self.title_label = QLabel("Processing Video")
-        self.title_label.setStyleSheet(
-            "font-size: 16px; font-weight: bold; color: #fff;"
-        )
+        self.title_label.setObjectName("processingTitle")
         layout.addWidget(self.title_label)
 
         # Status
         self.status_label = QLabel("Initializing...")
-        self.status_label.setStyleSheet("color: #aaa; margin-top: 10px;")
+        self.status_label.setObjectName("processingStatus")
         layout.addWidget(self.status_label)
 
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                text-align: center;
-                color: #fff;
-                background-color: #1e1e1e;
-                height: 24px;
-            }
-            QProgressBar::chunk {
-                background-color: #007acc;
-                border-radius: 3px;
-            }
-        """)
+        self.progress_bar.setObjectName("processingProgress")
         layout.addWidget(self.progress_bar)
 
         # Cancel button
         self.cancel_btn = QPushButton("Cancel")
         self.cancel_btn.clicked.connect(self.cancel_requested.emit)
-        self.cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3d3d3d;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                color: #fff;
-                margin-top: 10px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """)
+        self.cancel_btn.setObjectName("processingCancelBtn")
         layout.addWidget(self.cancel_btn)
 
     def update_progress(self, value: int, status: str):
@@ -122,12 +178,24 @@ class MainWindow(QMainWindow):
 
         # Worker reference
         self.current_worker = None
+        self.save_worker = None
+        self.gallery_loader = None  # Reads a project being loaded
+        self._cancelled_loaders = set()  # Abandoned loads still returning
+
+        # Worker progress is coalesced: the dialog shows the latest update
+        # at most every PROGRESS_INTERVAL_MS instead of repainting per signal
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._apply_pending_progress)
         self.current_video_id = None
 
         # In-memory storage for current session
         self.current_cluster_data = None
-        self.current_person_timestamps = {}  # person_id -> list of timestamps
+        self.current_person_timestamps = {}  # person_id -> sorted timestamp array
         self.current_person_names = {}  # person_id -> custom name
+        self._cluster_face_counts = {}  # cluster_id -> face count
 
         self._setup_window()
         self._setup_ui()
@@ -140,8 +208,16 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("FaceIndex Local")
         self.setMinimumSize(1200, 800)
 
-        # Apply dark theme
-        self.setStyleSheet(qdarktheme.load_stylesheet("dark"))
+        # Apply the app styles now and the dark theme once the event loop
+        # runs, so the window paints before the theme is imported and parsed
+        self.setStyleSheet(APP_QSS)
+        QTimer.singleShot(0, self._apply_theme)
+
+    def _apply_theme(self):
+        """Load and apply the dark theme stylesheet."""
+        import qdarktheme
+
+        self.setStyleSheet(qdarktheme.load_stylesheet("dark") + APP_QSS)
 
     def _setup_ui(self):
         """Set up the main UI layout."""
@@ -172,32 +248,19 @@ class MainWindow(QMainWindow):
     def _create_left_panel(self):
         """Create the left panel with gallery and controls."""
         panel = QWidget()
-        panel.setStyleSheet("background-color: #1e1e1e;")
+        panel.setObjectName("leftPanel")
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
         # Toolbar
         toolbar = QFrame()
-        toolbar.setStyleSheet("background-color: #252525; padding: 10px;")
+        toolbar.setObjectName("toolbar")
         toolbar_layout = QHBoxLayout(toolbar)
 
         self.add_video_btn = QPushButton("+ Add Video")
         self.add_video_btn.clicked.connect(self._add_video)
-        self.add_video_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007acc;
-                border: none;
-                border-radius: 4px;
-                padding: 10px 20px;
-                color: #ffffff;
-                font-weight: bold;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #005a9e;
-            }
-        """)
+        self.add_video_btn.setObjectName("addVideoBtn")
         toolbar_layout.addWidget(self.add_video_btn)
 
         toolbar_layout.addStretch()
@@ -221,7 +284,7 @@ class MainWindow(QMainWindow):
 
         # Processing overlay (hidden by default)
         self.processing_overlay = QWidget(panel)
-        self.processing_overlay.setStyleSheet("background-color: rgba(0, 0, 0, 0.8);")
+        self.processing_overlay.setObjectName("processingOverlay")
         overlay_layout = QVBoxLayout(self.processing_overlay)
         overlay_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
@@ -237,15 +300,13 @@ class MainWindow(QMainWindow):
     def _create_right_panel(self):
         """Create the right panel with video player."""
         panel = QWidget()
-        panel.setStyleSheet("background-color: #1e1e1e;")
+        panel.setObjectName("rightPanel")
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(10, 10, 10, 10)
 
         # Header
         header = QLabel("Video Player")
-        header.setStyleSheet(
-            "font-size: 16px; font-weight: bold; color: #fff; padding: 10px;"
-        )
+        header.setObjectName("playerHeader")
         layout.addWidget(header)
 
         # Video player
@@ -268,10 +329,10 @@ class MainWindow(QMainWindow):
 
         file_menu.addSeparator()
 
-        save_project_action = QAction("Save Project...", self)
-        save_project_action.setShortcut("Ctrl+S")
-        save_project_action.triggered.connect(self._save_project)
-        file_menu.addAction(save_project_action)
+        self.save_project_action = QAction("Save Project...", self)
+        self.save_project_action.setShortcut("Ctrl+S")
+        self.save_project_action.triggered.connect(self._save_project)
+        file_menu.addAction(self.save_project_action)
 
         load_project_action = QAction("Load Project...", self)
         load_project_action.setShortcut("Ctrl+L")
@@ -295,23 +356,26 @@ class MainWindow(QMainWindow):
     def _clear_session_data(self):
         """Clear all session data for fresh start."""
         # Clear all database tables
-        self.database.connection.execute("DELETE FROM face_instances")
-        self.database.connection.execute("DELETE FROM persons")
-        self.database.connection.execute("DELETE FROM videos")
-        self.database.connection.commit()
-
-        # Clear thumbnails directory
-        import shutil
-
-        thumbnails_dir = Path("thumbnails")
-        if thumbnails_dir.exists():
-            shutil.rmtree(thumbnails_dir)
-        thumbnails_dir.mkdir(exist_ok=True)
+        self.database.reset()
+
+        # Clear thumbnail directories: move them aside so new thumbnails can
+        # be written at once, and delete the old files on a pool thread
+        for thumbnails_dir in (Path("thumbnails"), self.database.thumbnail_root):
+            if thumbnails_dir.exists():
+                stale_dir = thumbnails_dir.with_name(
+                    f"{thumbnails_dir.name}.stale-{os.getpid()}-{time.monotonic_ns()}"
+                )
+                thumbnails_dir.rename(stale_dir)
+                QThreadPool.globalInstance().start(
+                    partial(shutil.rmtree, stale_dir, ignore_errors=True)
+                )
+        Path("thumbnails").mkdir(exist_ok=True)
 
         # Clear in-memory data
         self.current_cluster_data = None
         self.current_person_timestamps = {}
         self.current_person_names = {}
+        self._cluster_face_counts = {}
 
     def _load_existing_data(self):
         """Load existing videos and persons from database."""
@@ -338,13 +402,15 @@ class MainWindow(QMainWindow):
             self.stack.setCurrentIndex(0)
             return
 
-        for person in persons:
-            self.gallery.add_person(
-                person_id=person["id"],
-                name=person["name"] or f"Person {person['cluster_id'] + 1}",
-                thumbnail_path=person["thumbnail_path"],
-                face_count=person["face_count"],
-            )
+        self.gallery.add_persons(
+            {
+                "person_id": person["id"],
+                "name": person["name"] or f"Person {person['cluster_id'] + 1}",
+                "thumbnail_path": person["thumbnail_path"],
+                "face_count": person["face_count"],
+            }
+            for person in persons
+        )
 
         self.stack.setCurrentIndex(1)  # Show gallery
 
@@ -370,7 +436,12 @@ class MainWindow(QMainWindow):
         frame_skip = roi_dialog.get_frame_skip()
         time_range = roi_dialog.get_time_range()
 
+        # The dialog's open capture is reused by the worker
+        capture = roi_dialog.take_capture()
+
         if not roi or not video_info:
+            if capture is not None:
+                capture.release()
             return
 
         # Don't save to database - just process in memory
@@ -382,7 +453,9 @@ class MainWindow(QMainWindow):
         self.current_roi = roi
 
         # Start processing
-        self._start_processing(file_path, roi, video_id, frame_skip, time_range)
+        self._start_processing(
+            file_path, roi, video_id, frame_skip, time_range, capture=capture
+        )
 
     def _start_processing(
         self,
@@ -391,15 +464,21 @@ class MainWindow(QMainWindow):
         video_id: int,
         frame_skip: int = 15,
         time_range: tuple = (0, None),
+        capture=None,
     ):
         """Start background processing of video."""
         # Show processing overlay
+        self.processing_dialog.title_label.setText("Processing Video")
+        self.processing_dialog.cancel_btn.show()
         self.processing_overlay.show()
         self.processing_overlay.setGeometry(self.left_panel.geometry())
 
-        # Create and start worker
+        # Create and start worker; workers pulls in face_recognition and
+        # sklearn, so it is imported on first use rather than at startup
+        from workers import FaceProcessingWorker
+
         self.current_worker = FaceProcessingWorker(
-            video_path, roi, video_id, self.database
+            video_path, roi, video_id, self.database, capture=capture
         )
 
         # Set the frame skip value and time range
@@ -431,7 +510,15 @@ class MainWindow(QMainWindow):
 
     def _on_progress_update(self, percentage: int, status: str):
         """Handle progress updates from worker."""
-        self.processing_dialog.update_progress(percentage, status)
+        self._pending_progress = (percentage, status)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _apply_pending_progress(self):
+        """Show the most recent worker progress update."""
+        if self._pending_progress is not None:
+            self.processing_dialog.update_progress(*self._pending_progress)
+            self._pending_progress = None
 
     def _on_clusters_ready(self, cluster_data):
         """Handle cluster data ready for display."""
@@ -441,16 +528,19 @@ class MainWindow(QMainWindow):
         # Build person timestamps map
         self.current_person_timestamps = {}
         person_map = cluster_data["person_map"]
-        labels = cluster_data["labels"]
-        timestamps = cluster_data["face_timestamps"]
+        timestamps = np.asarray(cluster_data["face_timestamps"], dtype=np.float64)
+        from workers import group_cluster_indices
+
+        cluster_indices = group_cluster_indices(cluster_data["labels"])
+        self._cluster_face_counts = {
+            cluster_id: len(indices) for cluster_id, indices in cluster_indices.items()
+        }
 
         for cluster_id, person_id in person_map.items():
             # Find all face instances for this person
-            cluster_indices = [
-                i for i, label in enumerate(labels) if label == cluster_id
-            ]
-            person_timestamps = [timestamps[i] for i in cluster_indices]
-            self.current_person_timestamps[person_id] = sorted(person_timestamps)
+            self.current_person_timestamps[person_id] = np.sort(
+                timestamps[cluster_indices[cluster_id]]
+            )
 
         # Display persons in gallery
         self._display_clusters_in_gallery(cluster_data)
@@ -473,26 +563,34 @@ class MainWindow(QMainWindow):
 
         person_map = cluster_data["person_map"]
         thumbnail_dir = cluster_data["thumbnail_dir"]
-        labels = cluster_data["labels"]
 
         if not person_map:
             self.stack.setCurrentIndex(0)  # Show empty state
             return
 
-        # Add each person to gallery
-        for cluster_id, person_id in person_map.items():
-            thumbnail_path = thumbnail_dir / f"person_{cluster_id}.jpg"
+        # Face counts were gathered with the timestamps in _on_clusters_ready
+        face_counts = self._cluster_face_counts
 
-            # Count faces for this person
-            face_count = sum(1 for label in labels if label == cluster_id)
+        # List the thumbnail directory once instead of a stat per person
+        existing = _list_dir_names(thumbnail_dir)
+        thumbnail_prefix = os.path.join(str(thumbnail_dir), "")
 
-            if thumbnail_path.exists():
-                self.gallery.add_person(
-                    person_id=person_id,
-                    name=f"Person {cluster_id + 1}",
-                    thumbnail_path=str(thumbnail_path),
-                    face_count=face_count,
+        # Add each person to gallery
+        records = []
+        for cluster_id, person_id in person_map.items():
+            thumbnail_name = f"person_{cluster_id}.jpg"
+            face_count = face_counts[cluster_id]
+
+            if thumbnail_name in existing:
+                records.append(
+                    {
+                        "person_id": person_id,
+                        "name": f"Person {cluster_id + 1}",
+                        "thumbnail_path": thumbnail_prefix + thumbnail_name,
+                        "face_count": face_count,
+                    }
                 )
+        self.gallery.add_persons(records)
 
         # Switch to gallery view
         self.stack.setCurrentIndex(1)
@@ -506,12 +604,16 @@ class MainWindow(QMainWindow):
         ):
             timestamps = self.current_person_timestamps[person_id]
 
-            if timestamps and self.current_video_path:
-                # Load video with timestamps
-                self.video_player.load_video(self.current_video_path, timestamps)
+            if len(timestamps) and self.current_video_path:
+                # Load video with timestamps, opening at the first appearance
+                self.video_player.load_video(
+                    self.current_video_path,
+                    timestamps,
+                    start_time=timestamps[0],
+                )
         else:
             # Fallback to database (for saved projects)
-            instances = self.database.get_face_instances_by_person(person_id)
+            instances = self.database.get_face_instances_meta_by_person(person_id)
 
             if not instances:
                 return
@@ -526,12 +628,10 @@ class MainWindow(QMainWindow):
             # Extract timestamps
             timestamps = [inst["timestamp"] for inst in instances]
 
-            # Load video with timestamps
-            self.video_player.load_video(video["file_path"], timestamps)
-
-        # Seek to first timestamp
-        if timestamps:
-            self.video_player._seek_to_timestamp(timestamps[0])
+            # Load video with timestamps, opening at the first appearance
+            self.video_player.load_video(
+                video["file_path"], timestamps, start_time=timestamps[0]
+            )
 
     def _on_person_renamed(self, person_id: int, new_name: str):
         """Handle person rename."""
@@ -558,6 +658,10 @@ class MainWindow(QMainWindow):
 
     def _save_project(self):
         """Save current project to an external database file."""
+        # One save at a time; the running worker is waited on when it ends
+        if self.save_worker is not None:
+            return
+
         if not self.current_cluster_data:
             QMessageBox.warning(
                 self,
@@ -577,140 +681,49 @@ class MainWindow(QMainWindow):
         if not file_path:
             return
 
-        try:
-            import shutil
-            import sqlite3
+        # Save in the background, reusing the processing overlay
+        self.processing_dialog.title_label.setText("Saving Project")
+        self.processing_dialog.cancel_btn.hide()
+        self.processing_dialog.update_progress(0, "Starting...")
+        self.processing_overlay.show()
+        self.processing_overlay.setGeometry(self.left_panel.geometry())
 
-            # Create a new database for this project
-            project_db = sqlite3.connect(file_path)
-            project_db.row_factory = sqlite3.Row
+        from workers import ProjectSaveWorker
 
-            # Copy schema from current database
-            for line in self.database.connection.iterdump():
-                if line not in ("BEGIN;", "COMMIT;"):
-                    project_db.execute(line)
+        self.save_worker = ProjectSaveWorker(
+            self.current_cluster_data,
+            self.current_video_info,
+            self.current_roi,
+            self.current_video_path,
+            file_path,
+            self.current_person_names,
+            self.database,
+        )
+        self.save_worker.progress_update.connect(self._on_progress_update)
+        self.save_worker.save_finished.connect(self._on_save_finished)
+        self.save_project_action.setEnabled(False)
+        self.save_worker.start()
 
-            # Store video metadata including path
-            cursor = project_db.cursor()
-            cursor.execute(
-                """
-                INSERT INTO videos (file_path, file_name, duration, fps, width, height,
-                                   roi_x, roi_y, roi_w, roi_h, processing_status)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'completed')
-            """,
-                (
-                    self.current_video_path,
-                    Path(self.current_video_path).name,
-                    self.current_video_info["duration"],
-                    self.current_video_info["fps"],
-                    self.current_video_info["width"],
-                    self.current_video_info["height"],
-                    self.current_roi[0],
-                    self.current_roi[1],
-                    self.current_roi[2],
-                    self.current_roi[3],
-                ),
-            )
-            video_id = cursor.lastrowid
-
-            # Save persons and faces
-            cluster_data = self.current_cluster_data
-            person_map = cluster_data["person_map"]
-            labels = cluster_data["labels"]
-            face_images = cluster_data["face_images"]
-            face_timestamps = cluster_data["face_timestamps"]
-            face_locations = cluster_data["face_locations"]
-            face_encodings = cluster_data["face_encodings"]
-            thumbnail_dir = cluster_data["thumbnail_dir"]
-
-            # Create thumbnails directory in project file location
-            project_thumbnails = (
-                Path(file_path).parent / f"{Path(file_path).stem}_thumbnails"
-            )
-            project_thumbnails.mkdir(exist_ok=True)
-
-            for cluster_id, person_id in person_map.items():
-                # Copy person thumbnail
-                src_thumb = thumbnail_dir / f"person_{cluster_id}.jpg"
-                dest_thumb = project_thumbnails / f"person_{cluster_id}.jpg"
-                if src_thumb.exists():
-                    shutil.copy(src_thumb, dest_thumb)
-
-                # Get custom name if user renamed this person
-                person_name = self.current_person_names.get(
-                    person_id, f"Person {cluster_id + 1}"
-                )
+    def _on_save_finished(self, success: bool, message: str):
+        """Handle project save completion."""
+        self.processing_overlay.hide()
 
-                # Add person to database
-                cursor.execute(
-                    """
-                    INSERT INTO persons (video_id, cluster_id, name, thumbnail_path)
-                    VALUES (?, ?, ?, ?)
-                """,
-                    (
-                        video_id,
-                        int(cluster_id),
-                        person_name,
-                        str(dest_thumb),
-                    ),
-                )
-                db_person_id = cursor.lastrowid
-
-                # Add face instances
-                cluster_indices = [
-                    i for i, label in enumerate(labels) if label == cluster_id
-                ]
-                for idx in cluster_indices:
-                    # Copy face thumbnail
-                    src_face = thumbnail_dir / f"face_{idx}.jpg"
-                    dest_face = project_thumbnails / f"face_{idx}.jpg"
-                    if src_face.exists():
-                        shutil.copy(src_face, dest_face)
-
-                    # Get bbox
-                    top, right, bottom, left = face_locations[idx]
-                    bbox = (left, top, right - left, bottom - top)
-
-                    # Get encoding
-                    encoding = face_encodings[idx]
-                    encoding_bytes = encoding.tobytes()
-
-                    cursor.execute(
-                        """
-                        INSERT INTO face_instances (person_id, video_id, timestamp, frame_number,
-                                                   bbox_x, bbox_y, bbox_w, bbox_h, encoding, confidence, thumbnail_path)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                        (
-                            db_person_id,
-                            video_id,
-                            face_timestamps[idx],
-                            0,
-                            bbox[0],
-                            bbox[1],
-                            bbox[2],
-                            bbox[3],
-                            encoding_bytes,
-                            1.0,
-                            str(dest_face),
-                        ),
-                    )
-
-            project_db.commit()
-            project_db.close()
+        if success:
+            self.statusBar().showMessage(message, 5000)
+        else:
+            self._show_error("Save Failed", message)
 
-            QMessageBox.information(
-                self,
-                "Project Saved",
-                f"Project saved successfully to:\n{file_path}",
-            )
+        # The signal is emitted from the end of run(); let it return first
+        self.save_worker.wait()
+        self.save_worker = None
+        self.save_project_action.setEnabled(True)
 
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Save Failed",
-                f"Failed to save project:\n{str(e)}",
-            )
+    def _show_error(self, title: str, message: str):
+        """Show an error without blocking the event loop."""
+        box = QMessageBox(QMessageBox.Icon.Critical, title, message, parent=self)
+        box.setWindowModality(Qt.WindowModality.NonModal)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.show()
 
     def _load_project(self):
         """Load a project from an external database file."""
@@ -769,76 +782,122 @@ class MainWindow(QMainWindow):
             else:
                 video_path = stored_video_path
 
-            # Load persons
-            cursor.execute(
-                "SELECT * FROM persons WHERE video_id = ?", (video_row["id"],)
-            )
-            persons = cursor.fetchall()
-
-            # Clear current gallery
-            self.gallery.clear()
+            project_db.close()
 
-            # Store video info
-            self.current_video_path = video_path
-            self.current_video_info = {
+            video_info = {
                 "duration": video_row["duration"],
                 "fps": video_row["fps"],
                 "width": video_row["width"],
                 "height": video_row["height"],
             }
-            self.current_roi = (
+            roi = (
                 video_row["roi_x"],
                 video_row["roi_y"],
                 video_row["roi_w"],
                 video_row["roi_h"],
             )
 
-            # Build person timestamps from face instances
-            self.current_person_timestamps = {}
-            self.current_person_names = {}
+            # Persons and face timestamps are read on a worker thread; the
+            # gallery fills when they arrive
+            from workers import GalleryLoadWorker
 
-            for person in persons:
-                person_id = person["id"]
+            self._cancel_gallery_loader()
+            self.gallery_loader = GalleryLoadWorker(file_path, video_row["id"])
+            self.gallery_loader.persons_loaded.connect(
+                partial(self._on_project_persons_loaded, video_path, video_info, roi)
+            )
+            self.gallery_loader.load_failed.connect(self._on_project_load_failed)
+            self.statusBar().showMessage("Loading project...")
+            self.gallery_loader.start()
 
-                # Get face instances for this person
-                cursor.execute(
-                    "SELECT timestamp FROM face_instances WHERE person_id = ? ORDER BY timestamp",
-                    (person_id,),
-                )
-                timestamps = [row["timestamp"] for row in cursor.fetchall()]
-                self.current_person_timestamps[person_id] = timestamps
-
-                # Store custom name in memory
-                self.current_person_names[person_id] = person["name"]
-
-                # Add to gallery
-                thumbnail_path = person["thumbnail_path"]
-                if Path(thumbnail_path).exists():
-                    self.gallery.add_person(
-                        person_id=person_id,
-                        name=person["name"],
-                        thumbnail_path=thumbnail_path,
-                        face_count=len(timestamps),
-                    )
+        except Exception as e:
+            self._show_error("Load Failed", f"Failed to load project:\n{str(e)}")
 
-            project_db.close()
+    def _on_project_persons_loaded(
+        self,
+        video_path: str,
+        video_info: dict,
+        roi: tuple,
+        persons: list,
+        timestamps_by_person: dict,
+    ):
+        """Show the persons of a loaded project in the gallery."""
+        # The signal is emitted from the end of run(); let it return first
+        self.gallery_loader.wait()
+        self.gallery_loader = None
 
-            # Switch to gallery view
-            self.stack.setCurrentIndex(1)
+        # Clear current gallery
+        self.gallery.clear()
 
-            QMessageBox.information(
-                self,
-                "Project Loaded",
-                f"Project loaded successfully!\n\n"
-                f"Found {len(persons)} person(s) in the video.",
-            )
+        # Store video info
+        self.current_video_path = video_path
+        self.current_video_info = video_info
+        self.current_roi = roi
 
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Load Failed",
-                f"Failed to load project:\n{str(e)}",
-            )
+        # Build person timestamps from face instances
+        self.current_person_timestamps = {}
+        self.current_person_names = {}
+        dir_entries = {}  # thumbnail directory -> names it contains
+
+        records = []
+        for person in persons:
+            person_id = person["id"]
+
+            timestamps = timestamps_by_person.get(person_id, np.empty(0))
+            self.current_person_timestamps[person_id] = timestamps
+
+            # Store custom name in memory
+            self.current_person_names[person_id] = person["name"]
+
+            # Add to gallery
+            thumbnail_path = person["thumbnail_path"]
+            thumbnail_dir, thumbnail_name = os.path.split(thumbnail_path)
+            if thumbnail_dir not in dir_entries:
+                dir_entries[thumbnail_dir] = _list_dir_names(thumbnail_dir or ".")
+            if thumbnail_name in dir_entries[thumbnail_dir]:
+                records.append(
+                    {
+                        "person_id": person_id,
+                        "name": person["name"],
+                        "thumbnail_path": thumbnail_path,
+                        "face_count": len(timestamps),
+                    }
+                )
+        self.gallery.add_persons(records)
+
+        # Switch to gallery view
+        self.stack.setCurrentIndex(1)
+
+        self.statusBar().showMessage(
+            f"Project loaded: found {len(persons)} person(s) in the video.",
+            5000,
+        )
+
+    def _on_project_load_failed(self, message: str):
+        """Report a project whose persons could not be read."""
+        self.gallery_loader.wait()
+        self.gallery_loader = None
+        self.statusBar().clearMessage()
+        self._show_error("Load Failed", message)
+
+    def _cancel_gallery_loader(self):
+        """
+        Abandon the running project load, if any, without blocking.
+
+        Its signals are disconnected and its query interrupted; the thread
+        stays referenced until it has returned.
+        """
+        loader = self.gallery_loader
+        if loader is None:
+            return
+        self.gallery_loader = None
+        loader.persons_loaded.disconnect()
+        loader.load_failed.disconnect()
+        loader.cancel()
+        self._cancelled_loaders.add(loader)
+        loader.finished.connect(partial(self._cancelled_loaders.discard, loader))
+        if loader.isFinished():
+            self._cancelled_loaders.discard(loader)
 
     def resizeEvent(self, event):
         """Handle window resize to update overlay position."""
@@ -852,6 +911,13 @@ class MainWindow(QMainWindow):
         if self.current_worker:
             self.current_worker.stop()
 
+        # Let a project save finish writing before the database closes
+        if self.save_worker:
+            self.save_worker.wait()
+        self._cancel_gallery_loader()
+        for loader in list(self._cancelled_loaders):
+            loader.wait()
+
         # Cleanup video player
         self.video_player.cleanup()
 
@@ -0,0 +1,391 @@
+"""
+Tests for database.py against databases written by older versions.
+"""
+
+import gc
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from database import ENCODING_DIM, Database
+
+# face_instances as created before the float32 encoding format
+_LEGACY_SCHEMA = """
+    CREATE TABLE videos (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        file_path TEXT UNIQUE NOT NULL,
+        file_name TEXT NOT NULL,
+        duration REAL,
+        fps REAL,
+        width INTEGER,
+        height INTEGER,
+        roi_x INTEGER,
+        roi_y INTEGER,
+        roi_w INTEGER,
+        roi_h INTEGER,
+        processing_status TEXT DEFAULT 'pending',
+        processed_at TIMESTAMP,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE persons (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        video_id INTEGER NOT NULL,
+        cluster_id INTEGER NOT NULL,
+        name TEXT,
+        thumbnail_path TEXT,
+        face_count INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (video_id) REFERENCES videos (id) ON DELETE CASCADE,
+        UNIQUE(video_id, cluster_id)
+    );
+    CREATE TABLE face_instances (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        person_id INTEGER NOT NULL,
+        video_id INTEGER NOT NULL,
+        timestamp REAL NOT NULL,
+        frame_number INTEGER NOT NULL,
+        bbox_x INTEGER,
+        bbox_y INTEGER,
+        bbox_w INTEGER,
+        bbox_h INTEGER,
+        encoding BLOB NOT NULL,
+        confidence REAL,
+        thumbnail_path TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (person_id) REFERENCES persons (id) ON DELETE CASCADE,
+        FOREIGN KEY (video_id) REFERENCES videos (id) ON DELETE CASCADE
+    );
+"""
+
+
+class LegacyDatabaseTest(unittest.TestCase):
+    """Open a database written with float64 encoding BLOBs."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self._tmp.name) / "faceindex.db")
+        rng = np.random.default_rng(0)
+        self.encodings = rng.standard_normal((3, ENCODING_DIM))
+
+        connection = sqlite3.connect(self.db_path)
+        connection.executescript(_LEGACY_SCHEMA)
+        connection.execute(
+            "INSERT INTO videos (file_path, file_name) VALUES ('/v.mp4', 'v.mp4')"
+        )
+        connection.execute("INSERT INTO persons (video_id, cluster_id) VALUES (1, 0)")
+        connection.executemany(
+            """
+            INSERT INTO face_instances
+            (person_id, video_id, timestamp, frame_number, encoding)
+            VALUES (1, 1, ?, ?, ?)
+        """,
+            [(float(i), i, e.tobytes()) for i, e in enumerate(self.encodings)],
+        )
+        connection.commit()
+        connection.close()
+
+        self.db = Database(self.db_path)
+
+    def tearDown(self):
+        self.db.close()
+        self._tmp.cleanup()
+
+    def test_load_embeddings_reads_float64_rows(self):
+        ids, person_ids, embeddings = self.db.load_embeddings_by_video(1)
+        self.assertEqual(embeddings.shape, (3, ENCODING_DIM))
+        self.assertEqual(embeddings.dtype, np.float32)
+        np.testing.assert_allclose(embeddings, self.encodings, rtol=1e-6)
+
+    def test_new_rows_round_trip_beside_legacy_rows(self):
+        self.db.add_face_instance(1, 1, 3.0, 3, (0, 0, 10, 10), self.encodings[0])
+        ids, person_ids, embeddings = self.db.load_embeddings_by_video(1)
+        self.assertEqual(embeddings.shape, (4, ENCODING_DIM))
+        np.testing.assert_allclose(embeddings[3], self.encodings[0], rtol=1e-6)
+
+
+class FaceEncodingTest(unittest.TestCase):
+    """Read single encodings back from each storage format."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self._tmp.name) / "faceindex.db")
+        self.encoding = np.random.default_rng(1).standard_normal(ENCODING_DIM)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _round_trip(self, **kwargs):
+        db = Database(self.db_path, **kwargs)
+        try:
+            video_id = db.add_video(
+                "/v.mp4", "v.mp4", 10.0, 25.0, 640, 480, (0, 0, 640, 480)
+            )
+            person_id = db.add_person(video_id, 0)
+            face_id = db.add_face_instance(
+                person_id, video_id, 1.0, 25, (0, 0, 10, 10), self.encoding
+            )
+            return db.get_face_encoding(face_id)
+        finally:
+            db.close()
+
+    def test_sidecar_encoding(self):
+        encoding = self._round_trip()
+        self.assertEqual(encoding.dtype, np.float32)
+        np.testing.assert_allclose(encoding, self.encoding, rtol=1e-6)
+
+    def test_quantized_encoding(self):
+        encoding = self._round_trip(encoding_format="int8-sym")
+        np.testing.assert_allclose(encoding, self.encoding, atol=0.05)
+
+    def test_missing_face(self):
+        db = Database(self.db_path)
+        try:
+            self.assertIsNone(db.get_face_encoding(1))
+        finally:
+            db.close()
+
+
+class TransactionThreadTest(unittest.TestCase):
+    """Transactions opened on different threads stay separate."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db = Database(str(Path(self._tmp.name) / "faceindex.db"))
+
+    def tearDown(self):
+        self.db.close()
+        self._tmp.cleanup()
+
+    def _add_video(self, name):
+        return self.db.add_video(name, name, 1.0, 25.0, 64, 48, (0, 0, 64, 48))
+
+    def test_rollback_keeps_other_threads_rows(self):
+        inside = threading.Event()
+        release = threading.Event()
+
+        def failing_writer():
+            try:
+                with self.db.transaction():
+                    self._add_video("/rolled-back.mp4")
+                    inside.set()
+                    release.wait(5)
+                    raise RuntimeError("abort")
+            except RuntimeError:
+                pass
+
+        writer = threading.Thread(target=failing_writer)
+        writer.start()
+        self.assertTrue(inside.wait(5))
+
+        # Blocks until the failing transaction is over rather than joining it
+        other = threading.Thread(target=self._add_video, args=("/kept.mp4",))
+        other.start()
+        other.join(0.2)
+        self.assertTrue(other.is_alive())
+        release.set()
+        writer.join(5)
+        other.join(5)
+
+        paths = [row["file_path"] for row in self.db.get_all_videos()]
+        self.assertEqual(paths, ["/kept.mp4"])
+
+    def test_reader_closed_when_thread_exits(self):
+        readers = [threading.Thread(target=self.db.get_all_videos) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join(5)
+        gc.collect()
+        self.assertEqual(len(self.db._reader_connections), 0)
+
+
+class TransactionNestingTest(unittest.TestCase):
+    """Nested transaction() blocks on one thread share a single transaction."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db = Database(str(Path(self._tmp.name) / "faceindex.db"))
+
+    def tearDown(self):
+        self.db.close()
+        self._tmp.cleanup()
+
+    def _add_video(self, name):
+        return self.db.add_video(name, name, 1.0, 25.0, 64, 48, (0, 0, 64, 48))
+
+    def _paths(self):
+        return [row["file_path"] for row in self.db.get_all_videos()]
+
+    def test_inner_block_commits_with_outer(self):
+        with self.db.transaction():
+            self._add_video("/outer.mp4")
+            with self.db.transaction():
+                self._add_video("/inner.mp4")
+            # The inner block did not commit on its own
+            self.assertTrue(self.db.connection.in_transaction)
+        self.assertFalse(self.db.connection.in_transaction)
+        self.assertEqual(sorted(self._paths()), ["/inner.mp4", "/outer.mp4"])
+
+    def test_inner_failure_rolls_back_outer(self):
+        with self.assertRaises(RuntimeError):
+            with self.db.transaction():
+                self._add_video("/outer.mp4")
+                with self.db.transaction():
+                    self._add_video("/inner.mp4")
+                    raise RuntimeError("abort")
+        self.assertEqual(self._paths(), [])
+
+        # The failed block left no depth behind: the next write commits
+        self._add_video("/after.mp4")
+        self.assertFalse(self.db.connection.in_transaction)
+        self.assertEqual(self._paths(), ["/after.mp4"])
+
+
+class BatchInsertTest(unittest.TestCase):
+    """Batch inserts return ids in input order and keep face_count in sync."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db = Database(str(Path(self._tmp.name) / "faceindex.db"))
+        self.video_id = self.db.add_video(
+            "/v.mp4", "v.mp4", 10.0, 25.0, 64, 48, (0, 0, 64, 48)
+        )
+
+    def tearDown(self):
+        self.db.close()
+        self._tmp.cleanup()
+
+    def _add_faces(self, person_ids):
+        rng = np.random.default_rng(3)
+        return self.db.add_face_instances(
+            {
+                "person_id": person_id,
+                "video_id": self.video_id,
+                "timestamp": float(i),
+                "frame_number": i,
+                "bbox": (i, 0, 10, 10),
+                "encoding": rng.standard_normal(ENCODING_DIM),
+            }
+            for i, person_id in enumerate(person_ids)
+        )
+
+    def _face_counts(self):
+        return {
+            row["id"]: row["face_count"]
+            for row in self.db.get_persons_by_video(self.video_id)
+        }
+
+    def test_ids_follow_input_order(self):
+        person_ids = self.db.add_persons(
+            {"video_id": self.video_id, "cluster_id": cluster, "name": f"P{cluster}"}
+            for cluster in (5, 2, 7)
+        )
+        names = {
+            row["id"]: row["name"]
+            for row in self.db.get_persons_by_video(self.video_id)
+        }
+        self.assertEqual([names[i] for i in person_ids], ["P5", "P2", "P7"])
+
+        face_ids = self._add_faces([person_ids[0]] * 4)
+        frames = {
+            row["id"]: row["frame_number"]
+            for row in self.db.get_face_instances_by_person(person_ids[0])
+        }
+        self.assertEqual([frames[i] for i in face_ids], [0, 1, 2, 3])
+
+    def test_failed_batch_inserts_nothing(self):
+        self.db.add_person(self.video_id, 0)
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.add_persons(
+                {"video_id": self.video_id, "cluster_id": cluster}
+                for cluster in (1, 0)
+            )
+        self.assertEqual(len(self.db.get_persons_by_video(self.video_id)), 1)
+
+    def test_face_count_trigger(self):
+        first, second = self.db.add_persons(
+            {"video_id": self.video_id, "cluster_id": cluster} for cluster in (0, 1)
+        )
+        face_ids = self._add_faces([first, first, second, first])
+        self.assertEqual(self._face_counts(), {first: 3, second: 1})
+
+        with self.db.transaction() as connection:
+            connection.execute(
+                "DELETE FROM face_instances WHERE id = ?", (face_ids[0],)
+            )
+        self.assertEqual(self._face_counts(), {first: 2, second: 1})
+
+        self.db.merge_persons(second, first)
+        self.assertEqual(self._face_counts(), {first: 3})
+
+
+class BulkIngestTest(unittest.TestCase):
+    """bulk_ingest() drops the face indexes only for a first import."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db = Database(str(Path(self._tmp.name) / "faceindex.db"))
+        self.video_id = self.db.add_video(
+            "/v.mp4", "v.mp4", 10.0, 25.0, 64, 48, (0, 0, 64, 48)
+        )
+        self.person_id = self.db.add_person(self.video_id, 0)
+
+    def tearDown(self):
+        self.db.close()
+        self._tmp.cleanup()
+
+    def _face_indexes(self):
+        return {
+            row[0]
+            for row in self.db.connection.execute(
+                "SELECT name FROM sqlite_master"
+                " WHERE type = 'index' AND tbl_name = 'face_instances'"
+            )
+        }
+
+    def _add_faces(self, count):
+        encoding = np.zeros(ENCODING_DIM)
+        return self.db.add_face_instances(
+            {
+                "person_id": self.person_id,
+                "video_id": self.video_id,
+                "timestamp": float(i),
+                "frame_number": i,
+                "bbox": (0, 0, 10, 10),
+                "encoding": encoding,
+            }
+            for i in range(count)
+        )
+
+    def test_first_import_rebuilds_indexes(self):
+        indexes = self._face_indexes()
+        with self.db.bulk_ingest():
+            self.assertEqual(self._face_indexes(), set())
+            self._add_faces(3)
+        self.assertEqual(self._face_indexes(), indexes)
+        self.assertEqual(len(self.db.get_face_instances_by_person(self.person_id)), 3)
+
+    def test_populated_table_keeps_indexes(self):
+        self._add_faces(1)
+        indexes = self._face_indexes()
+        with self.db.bulk_ingest():
+            self.assertEqual(self._face_indexes(), indexes)
+            self._add_faces(2)
+        self.assertEqual(len(self.db.get_face_instances_by_person(self.person_id)), 3)
+
+    def test_failed_import_restores_indexes(self):
+        indexes = self._face_indexes()
+        with self.assertRaises(RuntimeError):
+            with self.db.bulk_ingest():
+                self._add_faces(2)
+                raise RuntimeError("abort")
+        self.assertEqual(self._face_indexes(), indexes)
+        self.assertEqual(self.db.get_face_instances_by_person(self.person_id), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
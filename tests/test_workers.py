@@ -0,0 +1,102 @@
+"""
+Tests for workers.py that run without a display or a video file.
+"""
+
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from database import ENCODING_DIM, Database
+
+_HAVE_WORKER_DEPS = all(
+    importlib.util.find_spec(name) is not None
+    for name in ("dlib", "face_recognition", "PyQt6")
+)
+
+
+@unittest.skipUnless(_HAVE_WORKER_DEPS, "dlib, face_recognition and PyQt6 needed")
+class ProjectSaveTest(unittest.TestCase):
+    """A saved project reopens as a Database with its encodings."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.workdir = Path(self._tmp.name)
+        self.db = Database(str(self.workdir / "faceindex.db"))
+
+    def tearDown(self):
+        self.db.close()
+        self._tmp.cleanup()
+
+    def _cluster_data(self, n_faces=12):
+        rng = np.random.default_rng(2)
+        thumbnail_dir = self.workdir / "thumbnails" / "0"
+        thumbnail_dir.mkdir(parents=True)
+        labels = np.array([i % 3 - 1 for i in range(n_faces)])
+
+        spans = []
+        with open(thumbnail_dir / "faces.dat", "wb") as pack:
+            for i in range(n_faces):
+                jpeg = cv2.imencode(".jpg", np.full((20, 20, 3), i, np.uint8))[1]
+                spans.append((pack.tell(), len(jpeg)))
+                pack.write(jpeg.tobytes())
+        for cluster in (0, 1):
+            cv2.imwrite(
+                str(thumbnail_dir / f"person_{cluster}.jpg"),
+                np.zeros((20, 20, 3), np.uint8),
+            )
+
+        return {
+            "person_map": {0: 0, 1: 1},
+            "labels": labels,
+            "face_thumbnail_pack": thumbnail_dir / "faces.dat",
+            "face_thumbnail_spans": spans,
+            "face_timestamps": [i * 0.5 for i in range(n_faces)],
+            "face_locations": [(0, 20, 20, 0)] * n_faces,
+            "face_encodings": list(rng.standard_normal((n_faces, ENCODING_DIM))),
+            "thumbnail_dir": thumbnail_dir,
+        }
+
+    def test_saved_encodings_load_from_project(self):
+        from workers import ProjectSaveWorker
+
+        cluster_data = self._cluster_data()
+        dest_path = str(self.workdir / "project.fip")
+        results = []
+        worker = ProjectSaveWorker(
+            cluster_data,
+            {"duration": 6.0, "fps": 25.0, "width": 20, "height": 20},
+            (0, 0, 20, 20),
+            "/v.mp4",
+            dest_path,
+            {},
+            self.db,
+        )
+        worker.save_finished.connect(lambda ok, message: results.append(ok))
+        worker.run()
+        self.assertEqual(results, [True])
+
+        project = Database(dest_path)
+        try:
+            video_id = project.get_all_videos()[0]["id"]
+            ids, person_ids, embeddings = project.load_embeddings_by_video(video_id)
+            for face_id, embedding in zip(ids, embeddings):
+                np.testing.assert_array_equal(
+                    project.get_face_encoding(int(face_id)), embedding
+                )
+        finally:
+            project.close()
+
+        clustered = cluster_data["labels"] != -1
+        expected = np.asarray(cluster_data["face_encodings"], np.float32)[clustered]
+        self.assertEqual(embeddings.shape, expected.shape)
+        order = np.lexsort(embeddings.T[::-1])
+        expected_order = np.lexsort(expected.T[::-1])
+        np.testing.assert_array_equal(embeddings[order], expected[expected_order])
+
+
+if __name__ == "__main__":
+    unittest.main()
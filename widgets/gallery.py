@@ -2,11 +2,11 @@
 Gallery Widget - Displays face thumbnails in a grid layout.
 """
 
-from pathlib import Path
+import os
 
 import cv2
-from PyQt6.QtCore import QSize, Qt, pyqtSignal
-from PyQt6.QtGui import QImage, QPainter, QPainterPath, QPixmap
+from PyQt6.QtCore import QObject, QRunnable, QSize, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QImage, QPainter, QPixmap, QPixmapCache
 from PyQt6.QtWidgets import (
     QFrame,
     QGridLayout,
@@ -22,15 +22,65 @@ from PyQt6.QtWidgets import (
 )
 
 
+class _ThumbnailSignals(QObject):
+    """Signals of a ThumbnailLoader, which cannot define its own."""
+
+    loaded = pyqtSignal(object)  # QImage, or None if it could not be read
+
+
+class ThumbnailLoader(QRunnable):
+    """Read a thumbnail file on a pool thread and hand back a QImage."""
+
+    def __init__(self, path: str, signals: _ThumbnailSignals):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        """Decode the file; unlike QPixmap, QImage is safe off the GUI thread."""
+        image = None
+        img = cv2.imread(self.path)
+        if img is not None:
+            # Qt reads OpenCV's BGR order directly; copy() detaches the
+            # QImage from img's buffer before img goes away
+            h, w = img.shape[:2]
+            image = QImage(
+                img.data, w, h, img.strides[0], QImage.Format.Format_BGR888
+            ).copy()
+        try:
+            self.signals.loaded.emit(image)
+        except RuntimeError:
+            pass  # The card was deleted while the file was being read
+
+
 class CircularLabel(QLabel):
     """Custom QLabel that displays images in circular frame."""
 
+    # Circular alpha masks shared by every label of the same size
+    _masks = {}
+
     def __init__(self, size=120, parent=None):
         super().__init__(parent)
         self.image_size = size
         self.setFixedSize(size, size)
         self._pixmap = None
 
+    @classmethod
+    def _circle_mask(cls, size: int) -> QImage:
+        """Return the antialiased circular alpha mask for size, built once."""
+        mask = cls._masks.get(size)
+        if mask is None:
+            mask = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+            mask.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(mask)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(Qt.GlobalColor.white)
+            painter.drawEllipse(0, 0, size, size)
+            painter.end()
+            cls._masks[size] = mask
+        return mask
+
     def set_circular_pixmap(self, pixmap: QPixmap):
         """Set pixmap and crop to circular shape."""
         if pixmap.isNull():
@@ -44,23 +94,21 @@ class CircularLabel(QLabel):
             Qt.TransformationMode.SmoothTransformation,
         )
 
-        # Create circular mask
         target = QPixmap(self.image_size, self.image_size)
         target.fill(Qt.GlobalColor.transparent)
 
         painter = QPainter(target)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Create circular path
-        path = QPainterPath()
-        path.addEllipse(0, 0, self.image_size, self.image_size)
-
-        painter.setClipPath(path)
 
         # Center the image
         x = (self.image_size - scaled.width()) // 2
         y = (self.image_size - scaled.height()) // 2
         painter.drawPixmap(x, y, scaled)
+
+        # Keep only the pixels inside the shared circular mask
+        painter.setCompositionMode(
+            QPainter.CompositionMode.CompositionMode_DestinationIn
+        )
+        painter.drawImage(0, 0, self._circle_mask(self.image_size))
         painter.end()
 
         self._pixmap = target
@@ -87,6 +135,7 @@ class PersonCard(QFrame):
         self.name = name
         self.thumbnail_path = thumbnail_path
         self.face_count = face_count
+        self._thumbnail_key = None  # QPixmapCache key of a pending load
 
         self._setup_ui()
         self._setup_style()
@@ -128,23 +177,43 @@ class PersonCard(QFrame):
 
     def _load_thumbnail(self):
         """Load and display the thumbnail image."""
-        if Path(self.thumbnail_path).exists():
-            # Load with OpenCV and convert to Qt
-            img = cv2.imread(self.thumbnail_path)
-            if img is not None:
-                rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-                h, w, ch = rgb.shape
-                bytes_per_line = ch * w
-                q_img = QImage(
-                    rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888
-                )
-                pixmap = QPixmap.fromImage(q_img)
-                self.thumbnail.set_circular_pixmap(pixmap)
+        try:
+            mtime = os.stat(self.thumbnail_path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        if mtime is not None:
+            # Reuse the rendered thumbnail from the app-wide pixmap cache;
+            # the mtime in the key drops entries for rewritten files
+            key = f"person:{self.thumbnail_path}:{mtime}:{self.thumbnail.image_size}"
+            cached = QPixmapCache.find(key)
+            if cached is not None:
+                self.thumbnail._pixmap = cached
+                self.thumbnail.setPixmap(cached)
+                return
+
+            # Read the file on the shared pool so adding many cards does not
+            # block the UI; the thumbnail stays empty until it arrives. The
+            # signals object is the card's child, so it goes with the card.
+            self._thumbnail_key = key
+            signals = _ThumbnailSignals(self)
+            signals.loaded.connect(self._on_thumbnail_loaded)
+            QThreadPool.globalInstance().start(
+                ThumbnailLoader(self.thumbnail_path, signals)
+            )
         else:
             # Placeholder if thumbnail doesn't exist
             self.thumbnail.setText("No Image")
             self.thumbnail.setStyleSheet("background-color: #3d3d3d; color: #888;")
 
+    def _on_thumbnail_loaded(self, image):
+        """Show a thumbnail read by ThumbnailLoader and cache the result."""
+        if image is None:
+            return
+        self.thumbnail.set_circular_pixmap(QPixmap.fromImage(image))
+        if self.thumbnail._pixmap is not None:
+            QPixmapCache.insert(self._thumbnail_key, self.thumbnail._pixmap)
+
     def _setup_style(self):
         """Set up the card styling."""
         self.setFrameStyle(QFrame.Shape.Box)
@@ -208,9 +277,20 @@ class GalleryWidget(QWidget):
     person_selected = pyqtSignal(int)  # person_id
     person_renamed = pyqtSignal(int, str)  # person_id, new_name
 
+    # Room for the rendered card thumbnails of a large gallery, in KB
+    PIXMAP_CACHE_LIMIT_KB = 65536
+
+    # Cards created at once; the rest wait in _pending_records until the
+    # view scrolls near the end of the grid
+    CARD_PAGE_SIZE = 40
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.person_cards = {}
+        self._pending_records = []
+        QPixmapCache.setCacheLimit(
+            max(QPixmapCache.cacheLimit(), self.PIXMAP_CACHE_LIMIT_KB)
+        )
         self._setup_ui()
 
     def _setup_ui(self):
@@ -237,7 +317,7 @@ class GalleryWidget(QWidget):
         main_layout.addWidget(header)
 
         # Scroll area for grid
-        scroll = QScrollArea()
+        self.scroll_area = scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setStyleSheet("""
             QScrollArea {
@@ -266,10 +346,86 @@ class GalleryWidget(QWidget):
         scroll.setWidget(self.container)
         main_layout.addWidget(scroll)
 
+        # Range changes too, so a grid shorter than the view keeps filling
+        scroll_bar = scroll.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._on_scroll)
+        scroll_bar.rangeChanged.connect(self._on_scroll)
+
     def add_person(
         self, person_id: int, name: str, thumbnail_path: str, face_count: int
     ):
         """Add a person card to the gallery."""
+        if self._pending_records:
+            # Keep the grid order; the card is created with its page
+            self._pending_records.append(
+                {
+                    "person_id": person_id,
+                    "name": name,
+                    "thumbnail_path": thumbnail_path,
+                    "face_count": face_count,
+                }
+            )
+        else:
+            self._add_card(person_id, name, thumbnail_path, face_count)
+
+        # Update count
+        self._update_count()
+
+    def add_persons(self, records):
+        """
+        Add many person cards at once.
+
+        Each record is a dict with the keyword arguments of add_person().
+        Only the first CARD_PAGE_SIZE cards are created now; the others
+        are created a page at a time as the view scrolls down to them.
+        """
+        self._pending_records.extend(records)
+        self._update_count()
+        self._load_more_cards()
+
+    def _load_more_cards(self):
+        """
+        Create the next page of pending cards.
+
+        Repaints are suspended while the cards are added, so the grid is
+        laid out and drawn once instead of once per card.
+        """
+        if not self._pending_records:
+            return
+        page = self._pending_records[: self.CARD_PAGE_SIZE]
+        del self._pending_records[: self.CARD_PAGE_SIZE]
+
+        self.setUpdatesEnabled(False)
+        try:
+            for record in page:
+                self._add_card(**record)
+        finally:
+            self.setUpdatesEnabled(True)
+        self.grid_layout.activate()
+
+        # A grid still shorter than the view gets no scroll signals; check
+        # again once the scroll area has taken the new size
+        QTimer.singleShot(0, self._on_scroll)
+
+    def showEvent(self, event):
+        """Fill the view with cards once the gallery is shown."""
+        super().showEvent(event)
+        QTimer.singleShot(0, self._on_scroll)
+
+    def _on_scroll(self, *_):
+        """Create more cards once the view is within a page of the end."""
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        if (
+            self._pending_records
+            and self.isVisible()
+            and scroll_bar.value() >= scroll_bar.maximum() - scroll_bar.pageStep()
+        ):
+            self._load_more_cards()
+
+    def _add_card(
+        self, person_id: int, name: str, thumbnail_path: str, face_count: int
+    ):
+        """Create a person card and place it in the next grid cell."""
         card = PersonCard(person_id, name, thumbnail_path, face_count)
         card.clicked.connect(self.person_selected.emit)
         card.rename_requested.connect(self._handle_rename)
@@ -284,19 +440,17 @@ class GalleryWidget(QWidget):
 
         self.grid_layout.addWidget(card, row, col)
 
-        # Update count
-        self._update_count()
-
     def clear(self):
         """Clear all person cards."""
         for card in self.person_cards.values():
             card.deleteLater()
         self.person_cards.clear()
+        self._pending_records.clear()
         self._update_count()
 
     def _update_count(self):
         """Update the people count label."""
-        count = len(self.person_cards)
+        count = len(self.person_cards) + len(self._pending_records)
         text = f"{count} {'person' if count == 1 else 'people'} found"
         self.count_label.setText(text)
 
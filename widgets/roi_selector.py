@@ -2,10 +2,28 @@
 ROI Selector Widget - Allows user to draw a region of interest on a video frame.
 """
 
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
 import cv2
 import numpy as np
-from PyQt6.QtCore import QPoint, QRect, Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QImage, QPainter, QPen, QPixmap
+from PyQt6.QtCore import QEvent, QPoint, QRect, Qt, QThread, QTimer, pyqtSignal
+from PyQt6.QtGui import (
+    QBrush,
+    QColor,
+    QFontMetrics,
+    QImage,
+    QPainter,
+    QPainterPath,
+    QPen,
+    QPixmap,
+    QPolygon,
+    QStaticText,
+    QTransform,
+)
 from PyQt6.QtWidgets import (
     QDialog,
     QHBoxLayout,
@@ -13,10 +31,187 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QPushButton,
     QSpinBox,
+    QStyle,
+    QStyleOption,
     QVBoxLayout,
     QWidget,
 )
 
+# Decoded first frames of recently opened videos
+FIRST_FRAME_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "faceindex"
+    / "first_frame"
+)
+
+# Bytes of cached first frames kept; the least recently used go first
+FIRST_FRAME_CACHE_BYTES = 64 * 1024 * 1024
+
+# Largest frame ROISelectorLabel keeps in memory; larger frames are
+# downscaled once when set
+MAX_DISPLAY_WIDTH = 1920
+MAX_DISPLAY_HEIGHT = 1080
+
+# ROI outline width and corner handle radius, in display pixels
+ROI_PEN_WIDTH = 3
+ROI_HANDLE_SIZE = 8
+
+# ROI outline and handle fill, and the dimming drawn over the frame
+# outside the ROI
+ROI_PEN = QPen(QColor(0, 255, 0), ROI_PEN_WIDTH, Qt.PenStyle.SolidLine)
+ROI_HANDLE_BRUSH = QBrush(QColor(0, 255, 0))
+DIM_COLOR = QColor(0, 0, 0, 120)
+
+# TimelineWidget colours and pens, built once instead of on every paint
+TIMELINE_BACKGROUND = QColor("#2d2d2d")
+TIMELINE_BAR = QColor("#3d3d3d")
+TIMELINE_TICK_PEN = QPen(QColor("#666666"))
+TIMELINE_TICK_TEXT_PEN = QPen(QColor("#888888"))
+TIMELINE_RANGE = QColor("#007acc")
+TIMELINE_LABEL_BACKGROUND = QColor("#1a1a1a")
+TIMELINE_START = QColor("#00ff00")
+TIMELINE_START_PEN = QPen(TIMELINE_START)
+TIMELINE_END = QColor("#ff0000")
+TIMELINE_END_PEN = QPen(TIMELINE_END)
+TIMELINE_MARKER_PEN = QPen(QColor("#ffffff"), 2)
+
+# Marker triangles relative to (marker x, top of bar) and (marker x,
+# bottom of bar); paintEvent only translates them
+TIMELINE_START_MARKER = QPolygon([QPoint(0, -10), QPoint(-8, -20), QPoint(8, -20)])
+TIMELINE_END_MARKER = QPolygon([QPoint(0, 10), QPoint(-8, 20), QPoint(8, 20)])
+
+# Styles for ROISelectorDialog's widgets, applied once at the dialog level.
+# Widgets opt in through their object names; the preset and secondary
+# buttons share one rule each.
+ROI_DIALOG_QSS = """
+QLabel#roiInstructions {
+    color: #aaa;
+    padding: 10px;
+}
+#roiSettings, #roiSettings QWidget {
+    background-color: #2d2d2d;
+    border: 1px solid #3d3d3d;
+    border-radius: 4px;
+    padding: 10px;
+}
+#roiSettings QLabel {
+    color: #ccc;
+    font-size: 12px;
+    background: none;
+    border: none;
+    padding: 0;
+}
+QLabel#roiSettingsTitle {
+    color: #fff;
+    font-weight: bold;
+    font-size: 13px;
+}
+QLabel#roiVideoFps {
+    color: #aaa;
+}
+QLabel#roiScanFps {
+    color: #00ff00;
+}
+QLabel#roiTimeRangeTitle {
+    margin-top: 8px;
+}
+QLabel#roiDurationInfo {
+    color: #888;
+    font-size: 11px;
+}
+QSpinBox#roiFrameSkip {
+    background-color: #3d3d3d;
+    border: 1px solid #555;
+    border-radius: 4px;
+    color: #fff;
+    padding: 4px 8px;
+    min-width: 100px;
+}
+QSpinBox#roiFrameSkip::up-button, QSpinBox#roiFrameSkip::down-button {
+    background-color: #4d4d4d;
+    border: none;
+    width: 16px;
+}
+QSpinBox#roiFrameSkip::up-button:hover, QSpinBox#roiFrameSkip::down-button:hover {
+    background-color: #5d5d5d;
+}
+QPushButton#roiPresetBtn {
+    padding: 4px 12px;
+    background-color: #3d3d3d;
+    border: 1px solid #555;
+    border-radius: 3px;
+    color: #fff;
+    font-size: 11px;
+}
+QPushButton#roiPresetBtn:hover {
+    background-color: #4d4d4d;
+}
+QPushButton#roiSecondaryBtn {
+    padding: 8px 16px;
+    background-color: #3d3d3d;
+    border: 1px solid #555;
+    border-radius: 4px;
+    color: #fff;
+}
+QPushButton#roiSecondaryBtn:hover {
+    background-color: #4d4d4d;
+}
+QPushButton#roiProcessBtn {
+    padding: 8px 16px;
+    background-color: #007acc;
+    border: none;
+    border-radius: 4px;
+    color: #fff;
+    font-weight: bold;
+}
+QPushButton#roiProcessBtn:hover {
+    background-color: #005a9e;
+}
+QPushButton#roiProcessBtn:disabled {
+    background-color: #2d2d2d;
+    color: #666;
+}
+"""
+
+
+def _fit_display(image: np.ndarray) -> np.ndarray:
+    """Downscale image to fit MAX_DISPLAY_WIDTH x MAX_DISPLAY_HEIGHT."""
+    h, w = image.shape[:2]
+    scale = min(MAX_DISPLAY_WIDTH / w, MAX_DISPLAY_HEIGHT / h)
+    if scale >= 1.0:
+        return image
+    return cv2.resize(
+        image,
+        (max(1, round(w * scale)), max(1, round(h * scale))),
+        interpolation=cv2.INTER_AREA,
+    )
+
+
+def _evict_first_frames():
+    """Delete the least recently used first frames beyond the cache budget."""
+    entries = []
+    for info_path in FIRST_FRAME_CACHE_DIR.glob("*.json"):
+        image_path = info_path.with_suffix(".jpg")
+        try:
+            info_stat = info_path.stat()
+            size = info_stat.st_size + image_path.stat().st_size
+        except OSError:
+            continue
+        entries.append((info_stat.st_mtime_ns, size, info_path, image_path))
+
+    total = sum(entry[1] for entry in entries)
+    for _, size, info_path, image_path in sorted(entries):
+        if total <= FIRST_FRAME_CACHE_BYTES:
+            break
+        # The .json goes first, so a half-deleted entry reads as a miss
+        info_path.unlink(missing_ok=True)
+        image_path.unlink(missing_ok=True)
+        total -= size
+
+    # Full-resolution PNGs written by earlier versions
+    for legacy_path in FIRST_FRAME_CACHE_DIR.glob("*.png"):
+        legacy_path.unlink(missing_ok=True)
+
 
 class TimelineWidget(QWidget):
     """Visual timeline with draggable start/end markers."""
@@ -32,6 +227,20 @@ class TimelineWidget(QWidget):
         self.dragging_start = False
         self.dragging_end = False
 
+        # Pixels per second along the bar and its inverse, kept in step
+        # with the width and duration by _recompute_scale()
+        self._scale = 0.0
+        self._inv_scale = 0.0
+        self._fm = QFontMetrics(self.font())
+        # Tick marks as one path, and their labels as pre-laid-out text:
+        # (left, right, top, QStaticText) per tick
+        self._tick_path = QPainterPath()
+        self._tick_labels = []
+        # Background, bar and ticks, rendered once per size, pixel ratio and
+        # duration; the range and its markers are drawn over it per paint
+        self._cache_pixmap: Optional[QPixmap] = None
+        self._cache_key: Optional[tuple] = None
+
         self.setStyleSheet(
             "background-color: #2d2d2d; border: 1px solid #3d3d3d; border-radius: 4px;"
         )
@@ -41,12 +250,14 @@ class TimelineWidget(QWidget):
         """Set the video duration in seconds."""
         self.duration = duration
         self.end_time = duration
+        self._recompute_scale()
         self.update()
 
     def set_range(self, start, end):
         """Set the time range."""
         self.start_time = start
         self.end_time = end if end is not None else self.duration
+        self._recompute_scale()
         self.update()
 
     def get_range(self):
@@ -56,16 +267,92 @@ class TimelineWidget(QWidget):
             self.end_time if self.end_time < self.duration else None,
         )
 
+    def _recompute_scale(self):
+        """Cache the time/pixel mapping, font metrics and tick layout."""
+        bar_width = self.width() - 20
+        if self.duration > 0 and bar_width > 0:
+            self._scale = bar_width / self.duration
+            self._inv_scale = self.duration / bar_width
+        else:
+            self._scale = self._inv_scale = 0.0
+        self._fm = QFontMetrics(self.font())
+        self._layout_ticks()
+
+    def _layout_ticks(self):
+        """Build the tick path and labels for the current size and duration."""
+        self._tick_path = QPainterPath()
+        self._tick_labels = []
+        if self.duration <= 0:
+            return
+
+        height = self.height()
+        bar_height = 20
+        bar_y = (height - bar_height) // 2
+        label_top = height - 5 - self._fm.ascent()
+
+        num_ticks = min(10, int(self.duration / 10) + 1)  # Show up to 10 ticks
+        interval = self.duration / max(num_ticks - 1, 1)
+        for i in range(num_ticks):
+            time = i * interval
+            x = self._time_to_x(time)
+            self._tick_path.moveTo(x, bar_y - 5)
+            self._tick_path.lineTo(x, bar_y)
+            self._tick_path.moveTo(x, bar_y + bar_height)
+            self._tick_path.lineTo(x, bar_y + bar_height + 5)
+
+            time_text = self._format_time(time)
+            text_width = self._fm.horizontalAdvance(time_text)
+            label = QStaticText(time_text)
+            label.prepare(QTransform(), self.font())
+            left = x - text_width // 2
+            self._tick_labels.append((left, left + text_width, label_top, label))
+
+    def _time_to_x(self, time: float) -> int:
+        """Widget x coordinate of a time on the bar."""
+        return int(10 + time * self._scale)
+
+    def resizeEvent(self, event):
+        """Rescale the timeline to the new width."""
+        super().resizeEvent(event)
+        self._recompute_scale()
+
+    def changeEvent(self, event):
+        """Lay the tick labels out again when the font changes."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange:
+            self._recompute_scale()
+            self._cache_key = None
+            self.update()
+
     def paintEvent(self, event):
-        """Draw the timeline with markers."""
+        """Draw the cached track, then the range and markers over it."""
+        ratio = self.devicePixelRatioF()
+        key = (self.width(), self.height(), ratio, self.duration)
+        if key != self._cache_key:
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            self._render_track(pixmap)
+            self._cache_pixmap = pixmap
+            self._cache_key = key
+
+        # Qt clips both the blit and the markers to the area being
+        # repainted, so a drag only redraws the band it moved through
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cache_pixmap)
+        if self.duration > 0:
+            self._draw_range(painter)
+        painter.end()
+
+    def _render_track(self, device):
+        """Draw the background, bar, ticks and tick labels onto device."""
+        painter = QPainter(device)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         width = self.width()
         height = self.height()
 
         # Draw background
-        painter.fillRect(0, 0, width, height, QColor("#2d2d2d"))
+        painter.fillRect(0, 0, width, height, TIMELINE_BACKGROUND)
 
         if self.duration <= 0:
             painter.end()
@@ -74,58 +361,46 @@ class TimelineWidget(QWidget):
         # Draw timeline bar
         bar_height = 20
         bar_y = (height - bar_height) // 2
-        painter.fillRect(10, bar_y, width - 20, bar_height, QColor("#3d3d3d"))
+        painter.fillRect(10, bar_y, width - 20, bar_height, TIMELINE_BAR)
 
-        # Draw time tick marks along the timeline
-        painter.setPen(QColor("#666666"))
-        num_ticks = min(10, int(self.duration / 10) + 1)  # Show up to 10 ticks
-        interval = self.duration / max(num_ticks - 1, 1)
+        # Draw all time tick marks in one call, then their labels
+        painter.setPen(TIMELINE_TICK_PEN)
+        painter.drawPath(self._tick_path)
+        painter.setPen(TIMELINE_TICK_TEXT_PEN)
+        for left, _right, top, label in self._tick_labels:
+            painter.drawStaticText(left, top, label)
 
-        for i in range(num_ticks):
-            time = i * interval
-            x = int(10 + (time / self.duration) * (width - 20))
-
-            # Draw tick
-            painter.drawLine(x, bar_y - 5, x, bar_y)
-            painter.drawLine(x, bar_y + bar_height, x, bar_y + bar_height + 5)
+        painter.end()
 
-            # Draw time label below
-            time_text = self._format_time(time)
-            text_width = painter.fontMetrics().horizontalAdvance(time_text)
-            painter.setPen(QColor("#888888"))
-            painter.drawText(x - text_width // 2, height - 5, time_text)
-            painter.setPen(QColor("#666666"))
+    def _draw_range(self, painter: QPainter):
+        """Draw the selected range, its markers and their time labels."""
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        fm = self._fm
+        bar_height = 20
+        bar_y = (self.height() - bar_height) // 2
 
         # Calculate marker positions
-        start_x = int(10 + (self.start_time / self.duration) * (width - 20))
-        end_x = int(10 + (self.end_time / self.duration) * (width - 20))
+        start_x = self._time_to_x(self.start_time)
+        end_x = self._time_to_x(self.end_time)
 
         # Draw selected range
-        painter.fillRect(start_x, bar_y, end_x - start_x, bar_height, QColor("#007acc"))
+        painter.fillRect(start_x, bar_y, end_x - start_x, bar_height, TIMELINE_RANGE)
 
         # Draw start marker
-        painter.setBrush(QColor("#00ff00"))
-        painter.setPen(QPen(QColor("#ffffff"), 2))
-        start_marker = [
-            QPoint(start_x, bar_y - 10),
-            QPoint(start_x - 8, bar_y - 20),
-            QPoint(start_x + 8, bar_y - 20),
-        ]
-        painter.drawPolygon(start_marker)
+        painter.setBrush(TIMELINE_START)
+        painter.setPen(TIMELINE_MARKER_PEN)
+        painter.drawPolygon(TIMELINE_START_MARKER.translated(start_x, bar_y))
 
         # Draw end marker
-        painter.setBrush(QColor("#ff0000"))
-        end_marker = [
-            QPoint(end_x, bar_y + bar_height + 10),
-            QPoint(end_x - 8, bar_y + bar_height + 20),
-            QPoint(end_x + 8, bar_y + bar_height + 20),
-        ]
-        painter.drawPolygon(end_marker)
+        painter.setBrush(TIMELINE_END)
+        painter.drawPolygon(
+            TIMELINE_END_MARKER.translated(end_x, bar_y + bar_height)
+        )
 
         # Draw start time label (above marker, with background)
-        painter.setPen(QColor("#00ff00"))
+        painter.setPen(TIMELINE_START_PEN)
         start_text = self._format_time(self.start_time)
-        start_text_width = painter.fontMetrics().horizontalAdvance(start_text)
+        start_text_width = fm.horizontalAdvance(start_text)
 
         # Background for start label
         painter.fillRect(
@@ -133,14 +408,14 @@ class TimelineWidget(QWidget):
             5,
             start_text_width + 6,
             16,
-            QColor("#1a1a1a"),
+            TIMELINE_LABEL_BACKGROUND,
         )
         painter.drawText(start_x - start_text_width // 2, 17, start_text)
 
         # Draw end time label (below marker, with background)
-        painter.setPen(QColor("#ff0000"))
+        painter.setPen(TIMELINE_END_PEN)
         end_text = self._format_time(self.end_time)
-        end_text_width = painter.fontMetrics().horizontalAdvance(end_text)
+        end_text_width = fm.horizontalAdvance(end_text)
 
         # Background for end label
         painter.fillRect(
@@ -148,12 +423,10 @@ class TimelineWidget(QWidget):
             bar_y + bar_height + 25,
             end_text_width + 6,
             16,
-            QColor("#1a1a1a"),
+            TIMELINE_LABEL_BACKGROUND,
         )
         painter.drawText(end_x - end_text_width // 2, bar_y + bar_height + 37, end_text)
 
-        painter.end()
-
     def _format_time(self, seconds):
         """Format seconds as MM:SS."""
         mins = int(seconds // 60)
@@ -165,21 +438,21 @@ class TimelineWidget(QWidget):
         if event.button() != Qt.MouseButton.LeftButton or self.duration <= 0:
             return
 
-        width = self.width()
         bar_y = (self.height() - 20) // 2
 
-        start_x = int(10 + (self.start_time / self.duration) * (width - 20))
-        end_x = int(10 + (self.end_time / self.duration) * (width - 20))
+        start_x = self._time_to_x(self.start_time)
+        end_x = self._time_to_x(self.end_time)
 
         pos = event.pos()
 
-        # Check if clicking near start marker
-        if abs(pos.x() - start_x) <= 15 and abs(pos.y() - (bar_y - 15)) <= 25:
+        # Check if clicking near start marker: within 15 px of it
+        # horizontally and 25 px of the point above the bar vertically
+        if QRect(start_x - 15, bar_y - 40, 31, 51).contains(pos):
             self.dragging_start = True
             return
 
         # Check if clicking near end marker
-        if abs(pos.x() - end_x) <= 15 and abs(pos.y() - (bar_y + 35)) <= 25:
+        if QRect(end_x - 15, bar_y + 10, 31, 51).contains(pos):
             self.dragging_end = True
             return
 
@@ -192,15 +465,35 @@ class TimelineWidget(QWidget):
         pos_x = max(10, min(event.pos().x(), width - 10))
 
         # Calculate time from position
-        time = ((pos_x - 10) / (width - 20)) * self.duration
+        time = (pos_x - 10) * self._inv_scale
         time = max(0, min(time, self.duration))
 
         if self.dragging_start:
+            old_time = self.start_time
             self.start_time = min(time, self.end_time - 1)  # Keep at least 1 second
+            new_time = self.start_time
         elif self.dragging_end:
+            old_time = self.end_time
             self.end_time = max(time, self.start_time + 1)  # Keep at least 1 second
-
-        self.update()
+            new_time = self.end_time
+
+        # Repaint only the band the marker, its label and the range edge
+        # moved through; the label is the widest of them
+        old_x = self._time_to_x(old_time)
+        new_x = self._time_to_x(new_time)
+        label_width = max(
+            self._fm.horizontalAdvance(self._format_time(t))
+            for t in (old_time, new_time)
+        )
+        margin = max(label_width // 2 + 4, 10)
+        self.update(
+            QRect(
+                min(old_x, new_x) - margin,
+                0,
+                abs(new_x - old_x) + 2 * margin + 1,
+                self.height(),
+            )
+        )
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release to stop dragging."""
@@ -208,8 +501,8 @@ class TimelineWidget(QWidget):
         self.dragging_end = False
 
 
-class ROISelectorLabel(QLabel):
-    """Custom QLabel that handles mouse events for drawing ROI rectangle."""
+class ROISelectorLabel(QWidget):
+    """Widget that shows a frame and handles mouse events for drawing the ROI."""
 
     roi_selected = pyqtSignal(tuple)  # Emits (x, y, w, h) in image coordinates
 
@@ -231,155 +524,262 @@ class ROISelectorLabel(QLabel):
         # Original image and pixmap
         self.original_pixmap = None
         self.image_size = None  # Original image size (width, height)
+        self._scaled_base = None  # original_pixmap scaled to the widget
+        self._display_size = None  # (width, height) of _scaled_base
+        self._xform = None  # (scale_x, scale_y, offset_x, offset_y)
+
+        # Mouse moves only update the rectangle; this timer redraws at most
+        # once per ~16 ms (60 Hz) however fast the events arrive
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self._update_roi_area)
+        self._painted_rect = QRect()  # current_rect as last painted
+        self._placeholder = ""  # Text shown until a frame is set
 
         # Style
         self.setStyleSheet("border: 2px solid #3d3d3d;")
 
-    def set_image(self, image: np.ndarray):
-        """Set the image to display (OpenCV BGR format)."""
-        # Convert BGR to RGB
-        rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_image.shape
-        bytes_per_line = ch * w
+    def set_placeholder(self, text: str):
+        """Show text in place of the frame until set_image() is called."""
+        self._placeholder = text
+        self.update()
+
+    def set_image(self, image: np.ndarray, source_size=None):
+        """
+        Set the image to display (OpenCV BGR format).
+
+        source_size is the (width, height) of the video frame image shows,
+        when image was already downscaled; ROI coordinates are in it.
+        """
+        h, w = image.shape[:2]
 
         # Store original image size
-        self.image_size = (w, h)
+        if source_size and all(source_size):
+            self.image_size = tuple(source_size)
+        else:
+            self.image_size = (w, h)
+        self._placeholder = ""
+
+        # Keep at most a display-sized frame: the widget never shows more,
+        # and ROI coordinates are mapped back through image_size. OpenCV's
+        # area resize is done once, before the frame reaches Qt.
+        image = _fit_display(image)
 
-        # Create QImage and QPixmap
+        # Qt reads BGR rows directly; no color conversion pass is needed
+        bgr_image = np.ascontiguousarray(image)
+        display_h, display_w, ch = bgr_image.shape
+
+        # Create QImage and QPixmap; fromImage copies the pixels, so the
+        # QImage only has to outlive bgr_image within this method
         q_image = QImage(
-            rgb_image.data, w, h, bytes_per_line, QImage.Format.Format_RGB888
+            bgr_image.data,
+            display_w,
+            display_h,
+            bgr_image.strides[0],
+            QImage.Format.Format_BGR888,
         )
         self.original_pixmap = QPixmap.fromImage(q_image)
 
         # Scale to fit widget while maintaining aspect ratio
-        self._update_display()
+        self._rescale_base()
+        self.update()
+
+    def _rescale_base(self):
+        """
+        Scale the original frame to the widget size.
 
-    def _update_display(self):
-        """Update the displayed pixmap with current ROI rectangle."""
+        Done only when the frame or the widget size changes; paintEvent
+        draws this pixmap without rescaling it.
+        """
         if self.original_pixmap is None:
+            self._scaled_base = None
+            self._display_size = None
+            self._xform = None
             return
 
-        # Scale to fit widget first
-        scaled_pixmap = self.original_pixmap.scaled(
+        self._scaled_base = self.original_pixmap.scaled(
             self.size(),
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.SmoothTransformation,
         )
 
-        # Draw the rectangle if it exists
-        if not self.current_rect.isNull():
-            # Create a transparent overlay pixmap
-            overlay = QPixmap(scaled_pixmap.size())
-            overlay.fill(Qt.GlobalColor.transparent)
+        # Cache the display-to-image transform used by every mouse event
+        display_w = self._scaled_base.width()
+        display_h = self._scaled_base.height()
+        self._display_size = (display_w, display_h)
+        self._xform = (
+            self.image_size[0] / display_w if display_w else 1.0,
+            self.image_size[1] / display_h if display_h else 1.0,
+            (self.width() - display_w) // 2,
+            (self.height() - display_h) // 2,
+        )
 
-            painter = QPainter(overlay)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def _update_roi_area(self):
+        """Repaint only the area the ROI rectangle covered or now covers."""
+        if self._scaled_base is None:
+            return
 
-            # Draw semi-transparent overlay outside ROI
-            painter.fillRect(overlay.rect(), QColor(0, 0, 0, 120))
+        if self._painted_rect.isNull() != self.current_rect.isNull():
+            # The dimming outside the ROI appears or goes away everywhere
+            self.update()
+            return
 
-            # Clear the ROI area to make it transparent
-            painter.setCompositionMode(
-                QPainter.CompositionMode.CompositionMode_SourceOut
-            )
-            painter.fillRect(self.current_rect, QColor(0, 0, 0, 255))
+        dirty = self._roi_paint_bounds(self._painted_rect).united(
+            self._roi_paint_bounds(self.current_rect)
+        )
+        self.update(dirty)
 
-            painter.setCompositionMode(
-                QPainter.CompositionMode.CompositionMode_SourceOver
-            )
+    def _roi_paint_bounds(self, rect: QRect) -> QRect:
+        """Widget area touched when drawing an ROI rect, handles included."""
+        if rect.isNull():
+            return QRect()
 
-            # Green border for ROI
-            pen = QPen(QColor(0, 255, 0), 3, Qt.PenStyle.SolidLine)
-            painter.setPen(pen)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawRect(self.current_rect)
+        offset_x, offset_y = self._get_image_offset()
+        margin = ROI_HANDLE_SIZE + ROI_PEN_WIDTH
+        return rect.translated(offset_x, offset_y).adjusted(
+            -margin, -margin, margin, margin
+        )
 
-            # Draw corner handles
-            handle_size = 8
-            painter.setBrush(QColor(0, 255, 0))
-            corners = [
-                self.current_rect.topLeft(),
-                self.current_rect.topRight(),
-                self.current_rect.bottomLeft(),
-                self.current_rect.bottomRight(),
-            ]
-            for corner in corners:
-                painter.drawEllipse(corner, handle_size, handle_size)
+    def paintEvent(self, event):
+        """Draw the frame, then the ROI rectangle on top of it."""
+        painter = QPainter(self)
 
+        # Plain QWidget subclasses draw their style sheet border themselves
+        option = QStyleOption()
+        option.initFrom(self)
+        self.style().drawPrimitive(
+            QStyle.PrimitiveElement.PE_Widget, option, painter, self
+        )
+
+        if self._scaled_base is None:
+            if self._placeholder:
+                painter.drawText(
+                    self.rect(), Qt.AlignmentFlag.AlignCenter, self._placeholder
+                )
             painter.end()
+            return
 
-            # Composite the overlay onto the scaled image
-            final_painter = QPainter(scaled_pixmap)
-            final_painter.drawPixmap(0, 0, overlay)
-            final_painter.end()
+        # Qt clips painting to the dirty region, so a drag only redraws
+        # the pixels around the rectangle rather than the whole frame
+        painter.translate(*self._get_image_offset())
+        painter.drawPixmap(0, 0, self._scaled_base)
 
-        self.setPixmap(scaled_pixmap)
+        # Draw the rectangle if it exists
+        if not self.current_rect.isNull():
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+            # Dim everything outside the ROI with four strips around it
+            frame = self._scaled_base.rect()
+            roi = self.current_rect.intersected(frame)
+            if roi.isEmpty():
+                strips = [frame]
+            else:
+                strips = [
+                    QRect(frame.left(), frame.top(), frame.width(), roi.top()),
+                    QRect(
+                        frame.left(),
+                        roi.bottom() + 1,
+                        frame.width(),
+                        frame.bottom() - roi.bottom(),
+                    ),
+                    QRect(frame.left(), roi.top(), roi.left(), roi.height()),
+                    QRect(
+                        roi.right() + 1,
+                        roi.top(),
+                        frame.right() - roi.right(),
+                        roi.height(),
+                    ),
+                ]
+            for strip in strips:
+                if not strip.isEmpty():
+                    painter.fillRect(strip, DIM_COLOR)
+
+            # Green border for ROI
+            painter.setPen(ROI_PEN)
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRect(self.current_rect)
+
+            # Draw the corner handles as one path
+            painter.setBrush(ROI_HANDLE_BRUSH)
+            handles = QPainterPath()
+            left, top, right, bottom = self.current_rect.getCoords()
+            for x, y in ((left, top), (right, top), (left, bottom), (right, bottom)):
+                handles.addEllipse(
+                    x - ROI_HANDLE_SIZE,
+                    y - ROI_HANDLE_SIZE,
+                    2 * ROI_HANDLE_SIZE,
+                    2 * ROI_HANDLE_SIZE,
+                )
+            painter.drawPath(handles)
+
+        painter.end()
+        self._painted_rect = QRect(self.current_rect)
 
     def _get_image_offset(self):
         """Get the offset of the scaled image within the widget."""
-        if not self.pixmap():
+        if self._xform is None:
             return (0, 0)
 
-        pixmap_width = self.pixmap().width()
-        pixmap_height = self.pixmap().height()
+        return self._xform[2:]
 
-        offset_x = (self.width() - pixmap_width) // 2
-        offset_y = (self.height() - pixmap_height) // 2
+    def _map_to_pixmap_xy(self, widget_pos):
+        """Map widget coordinates to clamped pixmap coordinates as ints."""
+        pixmap_x = widget_pos.x()
+        pixmap_y = widget_pos.y()
+        if self._xform is None:
+            return pixmap_x, pixmap_y
 
-        return (offset_x, offset_y)
+        # Shift by the cached image offset and clamp to pixmap bounds
+        pixmap_x -= self._xform[2]
+        pixmap_y -= self._xform[3]
+        display_w, display_h = self._display_size
+        return (
+            max(0, min(pixmap_x, display_w)),
+            max(0, min(pixmap_y, display_h)),
+        )
 
     def _map_to_pixmap_coords(self, widget_pos):
         """Map widget coordinates to pixmap coordinates."""
-        offset_x, offset_y = self._get_image_offset()
-
-        pixmap_x = widget_pos.x() - offset_x
-        pixmap_y = widget_pos.y() - offset_y
-
-        # Clamp to pixmap bounds
-        if self.pixmap():
-            pixmap_x = max(0, min(pixmap_x, self.pixmap().width()))
-            pixmap_y = max(0, min(pixmap_y, self.pixmap().height()))
+        return QPoint(*self._map_to_pixmap_xy(widget_pos))
 
-        return QPoint(pixmap_x, pixmap_y)
-
-    def _get_resize_handle(self, pos):
+    def _get_resize_handle(self, px, py):
         """Check if position is over a resize handle. Returns handle type or None."""
         if self.current_rect.isNull():
             return None
 
         handle_size = 12
-        rect = self.current_rect
-
-        # Check corners
-        corners = {
-            "top_left": rect.topLeft(),
-            "top_right": rect.topRight(),
-            "bottom_left": rect.bottomLeft(),
-            "bottom_right": rect.bottomRight(),
-        }
-
-        for handle_name, corner in corners.items():
-            if (
-                abs(pos.x() - corner.x()) <= handle_size
-                and abs(pos.y() - corner.y()) <= handle_size
-            ):
-                return handle_name
+        left, top, right, bottom = self.current_rect.getCoords()
+
+        near_left = abs(px - left) <= handle_size
+        near_right = abs(px - right) <= handle_size
+        if abs(py - top) <= handle_size:
+            if near_left:
+                return "top_left"
+            if near_right:
+                return "top_right"
+        if abs(py - bottom) <= handle_size:
+            if near_left:
+                return "bottom_left"
+            if near_right:
+                return "bottom_right"
 
         return None
 
-    def _is_inside_rect(self, pos):
+    def _is_inside_rect(self, px, py):
         """Check if position is inside the rectangle."""
         if self.current_rect.isNull():
             return False
-        return self.current_rect.contains(pos)
+        return self.current_rect.contains(px, py)
 
     def mousePressEvent(self, event):
         """Handle mouse press to start drawing, moving, or resizing."""
         if event.button() == Qt.MouseButton.LeftButton and self.original_pixmap:
-            pixmap_pos = self._map_to_pixmap_coords(event.pos())
+            px, py = self._map_to_pixmap_xy(event.pos())
+            pixmap_pos = QPoint(px, py)
 
             # Check if clicking on resize handle
-            resize_handle = self._get_resize_handle(pixmap_pos)
+            resize_handle = self._get_resize_handle(px, py)
             if resize_handle:
                 self.resizing = True
                 self.resize_handle = resize_handle
@@ -387,7 +787,7 @@ class ROISelectorLabel(QLabel):
                 return
 
             # Check if clicking inside existing rectangle to move it
-            if self._is_inside_rect(pixmap_pos):
+            if self._is_inside_rect(px, py):
                 self.moving = True
                 self.drag_offset = pixmap_pos - self.current_rect.topLeft()
                 self.setCursor(Qt.CursorShape.SizeAllCursor)
@@ -397,52 +797,73 @@ class ROISelectorLabel(QLabel):
             self.drawing = True
             self.start_point = pixmap_pos
             self.current_rect = QRect(self.start_point, self.start_point)
-            self._update_display()
+            self._update_roi_area()
 
     def mouseMoveEvent(self, event):
         """Handle mouse move to update rectangle, move it, or resize it."""
-        pixmap_pos = self._map_to_pixmap_coords(event.pos())
+        px, py = self._map_to_pixmap_xy(event.pos())
+
+        if not (self.drawing or self.moving or self.resizing):
+            # Hovering: update the cursor using plain int hit tests
+            if not self.current_rect.isNull():
+                if self._get_resize_handle(px, py):
+                    self.setCursor(Qt.CursorShape.SizeFDiagCursor)
+                elif self._is_inside_rect(px, py):
+                    self.setCursor(Qt.CursorShape.SizeAllCursor)
+                else:
+                    self.setCursor(Qt.CursorShape.CrossCursor)
+            return
 
+        pixmap_pos = QPoint(px, py)
+        # Moves that leave the rectangle where it is (common once the
+        # position is clamped at the frame edge) need no repaint
         if self.drawing and self.original_pixmap:
             # Drawing new rectangle
             self.end_point = pixmap_pos
-            self.current_rect = QRect(self.start_point, self.end_point).normalized()
-            self._update_display()
+            new_rect = QRect(self.start_point, self.end_point).normalized()
+            if new_rect == self.current_rect:
+                return
+            self.current_rect = new_rect
+            self._schedule_repaint()
         elif self.moving:
             # Moving existing rectangle
             new_top_left = pixmap_pos - self.drag_offset
+            if new_top_left == self.current_rect.topLeft():
+                return
             self.current_rect.moveTo(new_top_left)
-            self._update_display()
+            self._schedule_repaint()
         elif self.resizing:
             # Resizing rectangle
+            new_rect = QRect(self.current_rect)
             if self.resize_handle == "top_left":
-                self.current_rect.setTopLeft(pixmap_pos)
+                new_rect.setTopLeft(pixmap_pos)
             elif self.resize_handle == "top_right":
-                self.current_rect.setTopRight(pixmap_pos)
+                new_rect.setTopRight(pixmap_pos)
             elif self.resize_handle == "bottom_left":
-                self.current_rect.setBottomLeft(pixmap_pos)
+                new_rect.setBottomLeft(pixmap_pos)
             elif self.resize_handle == "bottom_right":
-                self.current_rect.setBottomRight(pixmap_pos)
-            self.current_rect = self.current_rect.normalized()
-            self._update_display()
-        else:
-            # Update cursor based on position
-            if not self.current_rect.isNull():
-                if self._get_resize_handle(pixmap_pos):
-                    self.setCursor(Qt.CursorShape.SizeFDiagCursor)
-                elif self._is_inside_rect(pixmap_pos):
-                    self.setCursor(Qt.CursorShape.SizeAllCursor)
-                else:
-                    self.setCursor(Qt.CursorShape.CrossCursor)
+                new_rect.setBottomRight(pixmap_pos)
+            new_rect = new_rect.normalized()
+            if new_rect == self.current_rect:
+                return
+            self.current_rect = new_rect
+            self._schedule_repaint()
+
+    def _schedule_repaint(self):
+        """Redraw on the next repaint timer tick, coalescing mouse moves."""
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release to finish drawing, moving, or resizing."""
         if event.button() == Qt.MouseButton.LeftButton:
+            # Paint the final rectangle now rather than on the timer
+            self._repaint_timer.stop()
             if self.drawing:
                 self.drawing = False
                 self.end_point = self._map_to_pixmap_coords(event.pos())
                 self.current_rect = QRect(self.start_point, self.end_point).normalized()
-                self._update_display()
+                self._update_roi_area()
 
                 # Emit the ROI in original image coordinates
                 roi = self._get_roi_in_image_coords()
@@ -451,6 +872,7 @@ class ROISelectorLabel(QLabel):
             elif self.moving:
                 self.moving = False
                 self.setCursor(Qt.CursorShape.CrossCursor)
+                self._update_roi_area()
                 # Emit updated ROI
                 roi = self._get_roi_in_image_coords()
                 if roi:
@@ -459,6 +881,7 @@ class ROISelectorLabel(QLabel):
                 self.resizing = False
                 self.resize_handle = None
                 self.setCursor(Qt.CursorShape.CrossCursor)
+                self._update_roi_area()
                 # Emit updated ROI
                 roi = self._get_roi_in_image_coords()
                 if roi:
@@ -470,24 +893,24 @@ class ROISelectorLabel(QLabel):
             return None
 
         # Get the scale factor between display and original image
-        display_pixmap = self.pixmap()
-        if not display_pixmap:
+        if self._xform is None:
             return None
 
-        scale_x = self.image_size[0] / display_pixmap.width()
-        scale_y = self.image_size[1] / display_pixmap.height()
+        scale_x, scale_y = self._xform[:2]
+        image_w, image_h = self.image_size
 
         # Convert to image coordinates (no offset needed as we're already in pixmap coords)
-        x = int(self.current_rect.x() * scale_x)
-        y = int(self.current_rect.y() * scale_y)
-        w = int(self.current_rect.width() * scale_x)
-        h = int(self.current_rect.height() * scale_y)
+        rect_x, rect_y, rect_w, rect_h = self.current_rect.getRect()
+        x = int(rect_x * scale_x)
+        y = int(rect_y * scale_y)
+        w = int(rect_w * scale_x)
+        h = int(rect_h * scale_y)
 
         # Clamp to image bounds
-        x = max(0, min(x, self.image_size[0]))
-        y = max(0, min(y, self.image_size[1]))
-        w = max(0, min(w, self.image_size[0] - x))
-        h = max(0, min(h, self.image_size[1] - y))
+        x = max(0, min(x, image_w))
+        y = max(0, min(y, image_h))
+        w = max(0, min(w, image_w - x))
+        h = max(0, min(h, image_h - y))
 
         return (x, y, w, h)
 
@@ -498,12 +921,129 @@ class ROISelectorLabel(QLabel):
     def clear_roi(self):
         """Clear the current ROI selection."""
         self.current_rect = QRect()
-        self._update_display()
+        self._update_roi_area()
 
     def resizeEvent(self, event):
         """Handle widget resize."""
         super().resizeEvent(event)
-        self._update_display()
+        self._rescale_base()
+        self.update()
+
+
+class FirstFrameLoader(QThread):
+    """
+    Opens a video and decodes its first frame off the GUI thread.
+
+    Decoded frames are cached on disk under FIRST_FRAME_CACHE_DIR, keyed by
+    the video path and modification time, so reopening a video skips the
+    decoder entirely. Entries are display-size JPEGs, evicted least
+    recently used first beyond FIRST_FRAME_CACHE_BYTES. When the video is
+    decoded, the open capture is kept in self.capture so processing can
+    reuse it instead of reopening.
+    """
+
+    frame_loaded = pyqtSignal(object, dict)  # (frame, video_info)
+    load_failed = pyqtSignal(str)  # error message
+
+    def __init__(self, video_path: str, parent=None):
+        super().__init__(parent)
+        self.video_path = video_path
+        self.capture = None
+
+    def run(self):
+        """Read the video properties and its first frame."""
+        cache_stem = self._cache_stem()
+        cached = self._read_cache(cache_stem) if cache_stem else None
+        if cached is not None:
+            self.frame_loaded.emit(*cached)
+            return
+
+        # The capture is handed on to face processing, so open it with
+        # hardware decoding when FFmpeg has a device for it
+        cap = cv2.VideoCapture(
+            self.video_path,
+            cv2.CAP_FFMPEG,
+            [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+        )
+        if not cap.isOpened():
+            cap = cv2.VideoCapture(self.video_path)
+        ret = False
+        try:
+            if not cap.isOpened():
+                self.load_failed.emit("Failed to open video file.")
+                return
+
+            # Get video info
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            video_info = {
+                "fps": fps,
+                "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                "frame_count": frame_count,
+                "duration": frame_count / fps if fps > 0 else 0,
+            }
+
+            # Read first frame: a fresh capture is already at frame 0, so
+            # grab the one packet and decode it, without seeking first
+            ret = cap.grab()
+            frame = cap.retrieve()[1] if ret else None
+        finally:
+            if ret:
+                self.capture = cap
+            else:
+                cap.release()
+
+        if ret:
+            self.frame_loaded.emit(frame, video_info)
+            if cache_stem:
+                self._write_cache(cache_stem, frame, video_info)
+        else:
+            self.load_failed.emit("Failed to read first frame.")
+
+    def _cache_stem(self) -> Optional[Path]:
+        """Cache path (without suffix) for this video, or None if unreadable."""
+        try:
+            mtime = os.stat(self.video_path).st_mtime_ns
+        except OSError:
+            return None
+
+        source = f"{os.path.abspath(self.video_path)}:{mtime}".encode()
+        key = hashlib.blake2b(source, digest_size=8).hexdigest()
+        return FIRST_FRAME_CACHE_DIR / key
+
+    def _read_cache(self, stem: Path):
+        """Return the cached (frame, video_info), or None on a miss."""
+        info_path = stem.with_suffix(".json")
+        try:
+            video_info = json.loads(info_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        frame = cv2.imread(str(stem.with_suffix(".jpg")))
+        if frame is None:
+            return None
+        try:
+            os.utime(info_path)  # Mark the entry recently used
+        except OSError:
+            pass
+        return frame, video_info
+
+    def _write_cache(self, stem: Path, frame: np.ndarray, video_info: dict):
+        """Store the frame and video info; a failed write only loses the cache."""
+        try:
+            stem.parent.mkdir(parents=True, exist_ok=True)
+            # Only the display-size frame the ROI selector shows is kept
+            if cv2.imwrite(
+                str(stem.with_suffix(".jpg")),
+                _fit_display(frame),
+                [cv2.IMWRITE_JPEG_QUALITY, 90],
+            ):
+                # Written last, so a present .json means a complete entry
+                stem.with_suffix(".json").write_text(json.dumps(video_info))
+            _evict_first_frames()
+        except (OSError, cv2.error):
+            pass
 
 
 class ROISelectorDialog(QDialog):
@@ -528,6 +1068,7 @@ class ROISelectorDialog(QDialog):
     def _setup_ui(self):
         """Set up the dialog UI."""
         layout = QVBoxLayout(self)
+        self.setStyleSheet(ROI_DIALOG_QSS)
 
         # ROI Selector
         self.roi_label = ROISelectorLabel()
@@ -540,35 +1081,24 @@ class ROISelectorDialog(QDialog):
             "Click and drag to draw a rectangle around the area where faces should be detected.\n"
             "This helps improve performance and accuracy by focusing on relevant regions."
         )
-        instructions.setStyleSheet("color: #aaa; padding: 10px;")
         instructions.setWordWrap(True)
+        instructions.setObjectName("roiInstructions")
         layout.addWidget(instructions)
 
         # FPS Settings Section
         fps_settings_widget = QWidget()
-        fps_settings_widget.setStyleSheet("""
-            QWidget {
-                background-color: #2d2d2d;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 10px;
-            }
-        """)
+        fps_settings_widget.setObjectName("roiSettings")
         fps_settings_layout = QVBoxLayout(fps_settings_widget)
         fps_settings_layout.setSpacing(8)
 
         # Title
         fps_title = QLabel("Processing Settings")
-        fps_title.setStyleSheet(
-            "color: #fff; font-weight: bold; font-size: 13px; background: none; border: none; padding: 0;"
-        )
+        fps_title.setObjectName("roiSettingsTitle")
         fps_settings_layout.addWidget(fps_title)
 
         # Video FPS info
         self.video_fps_label = QLabel("Video FPS: Detecting...")
-        self.video_fps_label.setStyleSheet(
-            "color: #aaa; font-size: 12px; background: none; border: none; padding: 0;"
-        )
+        self.video_fps_label.setObjectName("roiVideoFps")
         fps_settings_layout.addWidget(self.video_fps_label)
 
         # Frame skip settings
@@ -576,9 +1106,6 @@ class ROISelectorDialog(QDialog):
         frame_skip_layout.setSpacing(10)
 
         frame_skip_label = QLabel("Frame Skip:")
-        frame_skip_label.setStyleSheet(
-            "color: #ccc; font-size: 12px; background: none; border: none; padding: 0;"
-        )
         frame_skip_layout.addWidget(frame_skip_label)
 
         self.frame_skip_spinbox = QSpinBox()
@@ -586,90 +1113,32 @@ class ROISelectorDialog(QDialog):
         self.frame_skip_spinbox.setMaximum(120)
         self.frame_skip_spinbox.setValue(15)
         self.frame_skip_spinbox.setSuffix(" frames")
-        self.frame_skip_spinbox.setStyleSheet("""
-            QSpinBox {
-                background-color: #3d3d3d;
-                border: 1px solid #555;
-                border-radius: 4px;
-                color: #fff;
-                padding: 4px 8px;
-                min-width: 100px;
-            }
-            QSpinBox::up-button, QSpinBox::down-button {
-                background-color: #4d4d4d;
-                border: none;
-                width: 16px;
-            }
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-                background-color: #5d5d5d;
-            }
-        """)
+        self.frame_skip_spinbox.setObjectName("roiFrameSkip")
         self.frame_skip_spinbox.valueChanged.connect(self._update_scan_fps)
         frame_skip_layout.addWidget(self.frame_skip_spinbox)
 
         self.scan_fps_label = QLabel("→ Scan Rate: Calculating...")
-        self.scan_fps_label.setStyleSheet(
-            "color: #00ff00; font-size: 12px; background: none; border: none; padding: 0;"
-        )
+        self.scan_fps_label.setObjectName("roiScanFps")
         frame_skip_layout.addWidget(self.scan_fps_label)
 
         frame_skip_layout.addStretch()
 
         # Preset buttons
         preset_label = QLabel("Presets:")
-        preset_label.setStyleSheet(
-            "color: #ccc; font-size: 12px; background: none; border: none; padding: 0;"
-        )
         frame_skip_layout.addWidget(preset_label)
 
         fast_btn = QPushButton("Fast (30)")
-        fast_btn.setStyleSheet("""
-            QPushButton {
-                padding: 4px 12px;
-                background-color: #3d3d3d;
-                border: 1px solid #555;
-                border-radius: 3px;
-                color: #fff;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """)
+        fast_btn.setObjectName("roiPresetBtn")
         fast_btn.clicked.connect(lambda: self.frame_skip_spinbox.setValue(30))
         frame_skip_layout.addWidget(fast_btn)
 
         balanced_btn = QPushButton("Balanced (15)")
-        balanced_btn.setStyleSheet("""
-            QPushButton {
-                padding: 4px 12px;
-                background-color: #3d3d3d;
-                border: 1px solid #555;
-                border-radius: 3px;
-                color: #fff;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """)
+        balanced_btn.setObjectName("roiPresetBtn")
         balanced_btn.clicked.connect(lambda: self.frame_skip_spinbox.setValue(15))
         frame_skip_layout.addWidget(balanced_btn)
 
         accurate_btn = QPushButton("Accurate (5)")
-        accurate_btn.setStyleSheet("""
-            QPushButton {
-                padding: 4px 12px;
-                background-color: #3d3d3d;
-                border: 1px solid #555;
-                border-radius: 3px;
-                color: #fff;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """)
+        accurate_btn.setObjectName("roiPresetBtn")
         accurate_btn.clicked.connect(lambda: self.frame_skip_spinbox.setValue(5))
         frame_skip_layout.addWidget(accurate_btn)
 
@@ -677,9 +1146,7 @@ class ROISelectorDialog(QDialog):
 
         # Time range settings with visual timeline
         time_range_label = QLabel("Scan Time Range:")
-        time_range_label.setStyleSheet(
-            "color: #ccc; font-size: 12px; background: none; border: none; padding: 0; margin-top: 8px;"
-        )
+        time_range_label.setObjectName("roiTimeRangeTitle")
         fps_settings_layout.addWidget(time_range_label)
 
         # Visual timeline
@@ -690,9 +1157,7 @@ class ROISelectorDialog(QDialog):
         self.duration_info_label = QLabel(
             "Drag the green (start) and red (end) markers to select time range"
         )
-        self.duration_info_label.setStyleSheet(
-            "color: #888; font-size: 11px; background: none; border: none; padding: 0;"
-        )
+        self.duration_info_label.setObjectName("roiDurationInfo")
         fps_settings_layout.addWidget(self.duration_info_label)
 
         layout.addWidget(fps_settings_widget)
@@ -701,70 +1166,21 @@ class ROISelectorDialog(QDialog):
         button_layout = QHBoxLayout()
 
         self.clear_btn = QPushButton("Clear Selection")
+        self.clear_btn.setObjectName("roiSecondaryBtn")
         self.clear_btn.clicked.connect(self.roi_label.clear_roi)
-        self.clear_btn.setStyleSheet("""
-            QPushButton {
-                padding: 8px 16px;
-                background-color: #3d3d3d;
-                border: 1px solid #555;
-                border-radius: 4px;
-                color: #fff;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """)
 
         self.full_frame_btn = QPushButton("Use Full Frame")
+        self.full_frame_btn.setObjectName("roiSecondaryBtn")
         self.full_frame_btn.clicked.connect(self._use_full_frame)
-        self.full_frame_btn.setStyleSheet("""
-            QPushButton {
-                padding: 8px 16px;
-                background-color: #3d3d3d;
-                border: 1px solid #555;
-                border-radius: 4px;
-                color: #fff;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """)
 
         self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setObjectName("roiSecondaryBtn")
         self.cancel_btn.clicked.connect(self.reject)
-        self.cancel_btn.setStyleSheet("""
-            QPushButton {
-                padding: 8px 16px;
-                background-color: #3d3d3d;
-                border: 1px solid #555;
-                border-radius: 4px;
-                color: #fff;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """)
 
         self.process_btn = QPushButton("Start Processing")
+        self.process_btn.setObjectName("roiProcessBtn")
         self.process_btn.clicked.connect(self._start_processing)
         self.process_btn.setEnabled(False)
-        self.process_btn.setStyleSheet("""
-            QPushButton {
-                padding: 8px 16px;
-                background-color: #007acc;
-                border: none;
-                border-radius: 4px;
-                color: #fff;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #005a9e;
-            }
-            QPushButton:disabled {
-                background-color: #2d2d2d;
-                color: #666;
-            }
-        """)
 
         button_layout.addWidget(self.clear_btn)
         button_layout.addWidget(self.full_frame_btn)
@@ -775,45 +1191,54 @@ class ROISelectorDialog(QDialog):
         layout.addLayout(button_layout)
 
     def _load_first_frame(self):
-        """Load the first frame of the video."""
-        cap = cv2.VideoCapture(self.video_path)
+        """Start loading the first frame of the video in the background."""
+        self.roi_label.set_placeholder("Loading…")
+        self.full_frame_btn.setEnabled(False)
 
-        if not cap.isOpened():
-            QMessageBox.critical(self, "Error", "Failed to open video file.")
-            self.reject()
-            return
+        self._frame_loader = FirstFrameLoader(self.video_path, self)
+        self._frame_loader.frame_loaded.connect(self._on_first_frame_loaded)
+        self._frame_loader.load_failed.connect(self._on_first_frame_failed)
+        self._frame_loader.start()
 
-        # Get video info
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        duration = frame_count / fps if fps > 0 else 0
-
-        self.video_info = {
-            "fps": fps,
-            "width": width,
-            "height": height,
-            "frame_count": frame_count,
-            "duration": duration,
-        }
+    def _on_first_frame_loaded(self, frame: np.ndarray, video_info: dict):
+        """Show the decoded first frame and the video's properties."""
+        self.video_info = video_info
 
         # Update FPS display
-        self.video_fps_label.setText(f"Video FPS: {fps:.2f} fps")
+        self.video_fps_label.setText(f"Video FPS: {video_info['fps']:.2f} fps")
         self._update_scan_fps()
 
         # Initialize timeline widget
-        self.timeline_widget.set_duration(duration)
-
-        # Read first frame
-        ret, frame = cap.read()
-        cap.release()
-
-        if ret:
-            self.roi_label.set_image(frame)
-        else:
-            QMessageBox.critical(self, "Error", "Failed to read first frame.")
-            self.reject()
+        self.timeline_widget.set_duration(video_info["duration"])
+
+        # A cached frame is display-size; ROIs are in the video's pixels
+        self.roi_label.set_image(frame, (video_info["width"], video_info["height"]))
+        self.full_frame_btn.setEnabled(True)
+
+    def _on_first_frame_failed(self, message: str):
+        """Report a video that could not be opened or decoded."""
+        QMessageBox.critical(self, "Error", message)
+        self.reject()
+
+    def done(self, result):
+        """Close the dialog once the frame loader has stopped."""
+        self._frame_loader.wait()
+        if result != QDialog.DialogCode.Accepted:
+            capture = self.take_capture()
+            if capture is not None:
+                capture.release()
+        super().done(result)
+
+    def take_capture(self):
+        """
+        Hand over the loader's open cv2.VideoCapture, or None.
+
+        The caller owns the capture and must release it. It is None when
+        the first frame came from the cache.
+        """
+        capture = self._frame_loader.capture
+        self._frame_loader.capture = None
+        return capture
 
     def _update_scan_fps(self):
         """Update the scan FPS label based on current frame skip setting."""
@@ -2,11 +2,22 @@
 Video Player Widget - Custom video player with timeline visualization using OpenCV.
 """
 
-from typing import List
+import queue
+from collections import OrderedDict
+from typing import List, Optional, Sequence
 
 import cv2
 import numpy as np
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import (
+    QElapsedTimer,
+    QLineF,
+    QRect,
+    QRectF,
+    Qt,
+    QThread,
+    QTimer,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QColor, QImage, QPainter, QPen, QPixmap
 from PyQt6.QtWidgets import (
     QFrame,
@@ -18,6 +29,236 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+# Seconds of playback between timeline cursor repaints
+TIMELINE_UPDATE_INTERVAL = 0.1
+
+# Forward steps up to this many frames grab through the gap instead of
+# seeking, which would restart decoding from the previous keyframe
+GRAB_SKIP_LIMIT = 60
+
+# Previous/next jumps pre-decoded in each direction from the current frame
+MARKER_PREFETCH_STEPS = 8
+
+# Bytes of display-size pixmaps kept for pre-decoded jump targets
+MARKER_CACHE_BYTES = 128 * 1024 * 1024
+
+# Preformatted MM:SS labels covering the first hour
+_TIME_STRINGS = [f"{s // 60:02d}:{s % 60:02d}" for s in range(3600)]
+
+
+def _pixmap_bytes(pixmap: QPixmap) -> int:
+    """Approximate memory held by pixmap's pixels."""
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+def _create_gpu_reader(video_path: str, first_frame: int = 0):
+    """
+    Open video_path on NVDEC via cv2.cudacodec, or return None.
+
+    Returns None unless OpenCV was built with cudacodec and a CUDA device
+    is present, so CPU-only installs never touch the GPU path. Starting
+    past frame 0 needs VideoReaderInitParams.firstFrameIdx (OpenCV 4.8+).
+    """
+    if not hasattr(cv2, "cudacodec"):
+        return None
+    try:
+        if cv2.cuda.getCudaEnabledDeviceCount() <= 0:
+            return None
+        if not first_frame:
+            return cv2.cudacodec.createVideoReader(video_path)
+        params = cv2.cudacodec.VideoReaderInitParams()
+        params.firstFrameIdx = first_frame
+        return cv2.cudacodec.createVideoReader(video_path, params=params)
+    except (cv2.error, AttributeError):
+        return None
+
+
+class FrameDecoderThread(QThread):
+    """
+    Decodes playback frames ahead of the GUI into a small bounded queue.
+
+    Items are (generation, frame_number, bgr_frame); a frame of None marks
+    the end of the stream. seek() bumps the generation, so frames decoded
+    before the seek can be told apart and dropped by the consumer.
+    """
+
+    QUEUE_SIZE = 2  # Double buffer: one frame displayed, one decoding
+
+    def __init__(self, video_path: str, start_frame: int, parent=None):
+        super().__init__(parent)
+        self.video_path = video_path
+        self.start_frame = start_frame
+        self.frames = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self.seek_q = queue.Queue()
+        self.generation = 0
+        self.target_size = None  # (w, h) of the display, for GPU resize
+        self.skip_to = 0  # Frames before this are late; grab, don't retrieve
+        self._is_running = True
+
+    def run(self):
+        """Decode sequentially, applying the latest seek request."""
+        cap = cv2.VideoCapture(self.video_path)
+        frame_number = self.start_frame
+        gpu_reader = _create_gpu_reader(self.video_path, frame_number)
+        use_gpu = gpu_reader is not None
+        if frame_number and not use_gpu:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+        generation = 0
+
+        try:
+            while self._is_running:
+                seek = None
+                while not self.seek_q.empty():
+                    seek = self.seek_q.get_nowait()
+                if seek is not None:
+                    generation, frame_number = seek
+                    # NVDEC cannot seek; reopen it at the new position
+                    gpu_reader = (
+                        _create_gpu_reader(self.video_path, frame_number)
+                        if use_gpu
+                        else None
+                    )
+                    if gpu_reader is None:
+                        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+
+                frame = None
+                if gpu_reader is not None:
+                    frame = self._read_gpu_frame(gpu_reader)
+                    if frame is None:
+                        gpu_reader = None
+                        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+                if frame is None:
+                    while (
+                        frame_number < self.skip_to
+                        and self.seek_q.empty()
+                        and cap.grab()
+                    ):
+                        frame_number += 1
+                    ret, frame = cap.read()
+                    if not ret:
+                        frame = None
+
+                self._put((generation, frame_number, frame))
+                if frame is None:
+                    # End of stream; wait for a seek or stop
+                    while self._is_running and self.seek_q.empty():
+                        self.msleep(20)
+                frame_number += 1
+        finally:
+            cap.release()
+
+    def _put(self, item):
+        """Queue item, giving up if stopped or a seek makes it stale."""
+        while self._is_running and self.seek_q.empty():
+            try:
+                self.frames.put(item, timeout=0.05)
+                return
+            except queue.Full:
+                pass
+
+    def _read_gpu_frame(self, gpu_reader) -> Optional[np.ndarray]:
+        """
+        Decode the next frame on the GPU and return it as host BGR.
+
+        The frame is resized to target_size on-device, so only the displayed
+        pixels are downloaded. Returns None when the reader is exhausted or
+        fails, after which decoding continues on the CPU capture.
+        """
+        try:
+            ret, d_frame = gpu_reader.nextFrame()
+            if not ret:
+                return None
+            if self.target_size:
+                w, h = d_frame.size()
+                scale = min(self.target_size[0] / w, self.target_size[1] / h, 1.0)
+                if scale < 1.0:
+                    d_frame = cv2.cuda.resize(
+                        d_frame,
+                        (max(1, int(w * scale)), max(1, int(h * scale))),
+                        interpolation=cv2.INTER_AREA,
+                    )
+            return cv2.cuda.cvtColor(d_frame, cv2.COLOR_BGRA2BGR).download()
+        except cv2.error:
+            return None
+
+    def seek(self, frame_number: int):
+        """Continue decoding from frame_number, discarding queued frames."""
+        self.skip_to = 0
+        self.generation += 1
+        self.seek_q.put((self.generation, frame_number))
+
+    def stop(self):
+        """Stop decoding and wait for the thread to finish."""
+        self._is_running = False
+        self.wait()
+
+
+class MarkerFrameLoader(QThread):
+    """
+    Decodes the frames previous/next navigation can jump to from here.
+
+    request() replaces the pending frame list, so after a seek only the
+    new neighbourhood is decoded. Frames are resized to fit target_size
+    and emitted as BGR arrays; the GUI thread turns them into QPixmaps.
+    """
+
+    frame_ready = pyqtSignal(int, object)  # (frame_number, bgr_frame)
+
+    def __init__(self, video_path: str, target_size, parent=None):
+        super().__init__(parent)
+        self.video_path = video_path
+        self.target_size = target_size
+        self.requests = queue.Queue()
+        self._is_running = True
+
+    def request(self, frame_numbers: List[int]):
+        """Decode frame_numbers next, in order, dropping any older request."""
+        self.requests.put(list(frame_numbers))
+
+    def run(self):
+        """Decode requested frames, grabbing forward over short gaps."""
+        cap = cv2.VideoCapture(self.video_path)
+        position = 0
+        try:
+            while self._is_running:
+                try:
+                    frame_numbers = self.requests.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+                for frame_number in frame_numbers:
+                    if not self._is_running or not self.requests.empty():
+                        break
+                    gap = frame_number - position
+                    if 0 <= gap <= GRAB_SKIP_LIMIT:
+                        for _ in range(gap):
+                            cap.grab()
+                    else:
+                        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+                    ret, frame = cap.read()
+                    position = frame_number + 1 if ret else -1
+                    if ret:
+                        self.frame_ready.emit(frame_number, self._fit(frame))
+        finally:
+            cap.release()
+
+    def _fit(self, frame: np.ndarray) -> np.ndarray:
+        """Resize frame as VideoPlayerWidget._display_frame would."""
+        h, w = frame.shape[:2]
+        scale = min(self.target_size[0] / w, self.target_size[1] / h)
+        target = (max(1, int(w * scale)), max(1, int(h * scale)))
+        if target == (w, h):
+            return frame
+        return cv2.resize(
+            frame,
+            target,
+            interpolation=cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR,
+        )
+
+    def stop(self):
+        """Stop decoding and wait for the thread to finish."""
+        self._is_running = False
+        self.wait()
+
 
 class TimelineWidget(QWidget):
     """Custom timeline visualization showing where a person appears."""
@@ -29,56 +270,101 @@ class TimelineWidget(QWidget):
         self.setMinimumHeight(40)
         self.duration = 0
         self.timestamps = []  # List of timestamps where person appears
+        self._ts_array = np.empty(0, dtype=np.float32)
+        # Background and markers rendered once per size, ratio and duration
+        self._marker_pixmap = None
+        self._marker_key = None
         self.current_position = 0
 
+        # Paint resources, built once rather than per paint
+        self._background = QColor("#2d2d2d")
+        self._marker_pen = QPen(QColor("#007acc"), 2)
+        self._cursor_pen = QPen(QColor("#00ff00"), 3)
+
         self.setStyleSheet("background-color: #2d2d2d; border-radius: 4px;")
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
     def set_duration(self, duration: float):
         """Set the total video duration in seconds."""
         self.duration = duration
+        self._marker_pixmap = None
         self.update()
 
-    def set_timestamps(self, timestamps: List[float]):
-        """Set the timestamps where the person appears."""
+    def set_timestamps(self, timestamps: Sequence[float]):
+        """Set the timestamps where the person appears, as a list or array."""
         self.timestamps = timestamps
+        self._ts_array = np.sort(np.asarray(timestamps, dtype=np.float32))
+        self._marker_pixmap = None
         self.update()
 
     def set_current_position(self, position: float):
         """Set the current playback position."""
+        # Only the strips under the old and new cursor need repainting
+        self.update(self._cursor_rect(self.current_position))
         self.current_position = position
-        self.update()
+        self.update(self._cursor_rect(position))
+
+    def _cursor_x(self, position: float) -> int:
+        """Pixel column of position on the timeline."""
+        return int((position / self.duration) * self.width())
+
+    def _cursor_rect(self, position: float) -> QRect:
+        """Area covered by the 3px cursor line at position."""
+        if self.duration <= 0:
+            return QRect()
+        return QRect(self._cursor_x(position) - 2, 0, 5, self.height())
 
     def paintEvent(self, event):
         """Custom paint to draw timeline with markers."""
         super().paintEvent(event)
 
+        # No antialiasing: every line is vertical at an integer x
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        width = self.width()
-        height = self.height()
+        # Blit the cached background and markers for the repainted area;
+        # the source rect is in the pixmap's device pixels
+        rect = QRectF(event.rect())
+        pixmap = self._marker_layer()
+        ratio = pixmap.devicePixelRatio()
+        source = QRectF(rect.topLeft() * ratio, rect.size() * ratio)
+        painter.drawPixmap(rect, pixmap, source)
 
-        # Draw background
-        painter.fillRect(0, 0, width, height, QColor("#2d2d2d"))
+        # Draw current position indicator
+        if self.duration > 0 and self.current_position > 0:
+            x = self._cursor_x(self.current_position)
+            painter.setPen(self._cursor_pen)
+            painter.drawLine(x, 0, x, self.height())
 
-        if self.duration <= 0:
-            painter.end()
-            return
+        painter.end()
 
-        # Draw timestamp markers
-        painter.setPen(QPen(QColor("#007acc"), 2))
-        for timestamp in self.timestamps:
-            x = int((timestamp / self.duration) * width)
-            painter.drawLine(x, 0, x, height)
+    def _marker_layer(self) -> QPixmap:
+        """
+        Background and marker lines, rendered only when the size, pixel
+        ratio, duration or timestamps change.
 
-        # Draw current position indicator
-        if self.current_position > 0:
-            x = int((self.current_position / self.duration) * width)
-            painter.setPen(QPen(QColor("#00ff00"), 3))
-            painter.drawLine(x, 0, x, height)
+        Timestamps landing on the same pixel share one line, so at most
+        width lines are drawn however many detections there are.
+        """
+        width, height = self.width(), self.height()
+        ratio = self.devicePixelRatioF()
+        key = (width, height, ratio, self.duration)
+        if self._marker_pixmap is not None and self._marker_key == key:
+            return self._marker_pixmap
+
+        pixmap = QPixmap(max(1, int(width * ratio)), max(1, int(height * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(self._background)
+
+        if self.duration > 0 and len(self._ts_array):
+            xs = np.unique((self._ts_array * (width / self.duration)).astype(np.int32))
+            painter = QPainter(pixmap)
+            painter.setPen(self._marker_pen)
+            painter.drawLines([QLineF(x, 0, x, height) for x in xs.tolist()])
+            painter.end()
 
-        painter.end()
+        self._marker_pixmap = pixmap
+        self._marker_key = key
+        return pixmap
 
     def mousePressEvent(self, event):
         """Handle click to seek to position."""
@@ -93,12 +379,25 @@ class VideoPlayerWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_video_path = None
-        self.person_timestamps = []
+        self.person_timestamps = np.empty(0)  # Sorted ascending
         self.cap = None
+        # Decodes ahead while playing; self.cap serves stills and seeks
+        self.decoder = None
+        # Pre-decoded jump targets, valid for _marker_cache_size
+        self.marker_loader = None
+        self._marker_cache = OrderedDict()
+        self._marker_cache_bytes = 0
+        self._marker_cache_size = None
         self.is_playing = False
         self.current_frame_number = 0
         self.total_frames = 0
         self.fps = 30
+        # Frame the decoder will return on the next read(), -1 if unknown
+        self._next_expected_frame = -1
+        # Reused display-size resize target and the QImage wrapping it
+        self._display_buf = None
+        self._display_image = None
+        self._last_timeline_update = 0.0
 
         self._setup_ui()
         self._setup_timer()
@@ -214,20 +513,44 @@ class VideoPlayerWidget(QWidget):
 
     def _setup_timer(self):
         """Set up playback timer."""
+        # Single-shot, re-armed per frame against the playback clock; the
+        # default coarse timer's ~5% jitter is visible at video frame rates
         self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.timer.timeout.connect(self._update_frame)
         self.slider_dragging = False
+        # Playback clock, started when _pace_origin was on screen
+        self._pace_clock = QElapsedTimer()
+        self._pace_origin = 0
+
+    def load_video(
+        self,
+        video_path: str,
+        timestamps: Optional[Sequence[float]] = None,
+        start_time: Optional[float] = None,
+    ):
+        """
+        Load a video file and optionally set person timestamps, given as a
+        list or numpy array.
 
-    def load_video(self, video_path: str, timestamps: List[float] = None):
-        """Load a video file and optionally set person timestamps."""
+        The first frame shown is at start_time when given, so callers that
+        jump straight to an appearance don't decode frame 0 first.
+        """
+        if self.is_playing:
+            self._toggle_playback()
+        self._stop_marker_loader()
         if self.cap:
             self.cap.release()
 
         self.current_video_path = video_path
-        self.person_timestamps = sorted(timestamps) if timestamps else []
+        self.person_timestamps = np.sort(
+            np.asarray(timestamps if timestamps is not None else (), dtype=np.float64)
+        )
 
         # Open video with OpenCV
         self.cap = cv2.VideoCapture(video_path)
+        self._next_expected_frame = 0
 
         if not self.cap.isOpened():
             self.video_label.setText("Error loading video")
@@ -243,69 +566,223 @@ class VideoPlayerWidget(QWidget):
         self.duration_label.setText(self._format_time(int(self.duration)))
         self.timeline.set_duration(self.duration)
 
-        if timestamps:
-            self.timeline.set_timestamps(timestamps)
+        if len(self.person_timestamps):
+            self.timeline.set_timestamps(self.person_timestamps)
             self.prev_button.setEnabled(True)
             self.next_button.setEnabled(True)
 
         self.play_button.setEnabled(True)
 
-        # Show first frame
+        # Show the first frame, or the requested starting point
         self.current_frame_number = 0
-        self._show_frame(0)
+        if start_time is not None:
+            self._seek_to_timestamp(start_time)
+        else:
+            self._show_frame(0)
+
+        self._prefetch_markers()
+
+    def _prefetch_markers(self):
+        """
+        Pre-decode the frames previous/next navigation can reach from the
+        current frame, nearest first, in the background.
+
+        Only as many jumps are requested as fit in MARKER_CACHE_BYTES, and
+        those already cached are marked recently used, so evictions only
+        ever drop frames outside the current neighbourhood.
+        """
+        if not len(self.person_timestamps) or not self.cap:
+            return
+
+        size = self._display_size()
+        if size != self._marker_cache_size:
+            # Cached frames are display-size; a resize invalidates them
+            self._stop_marker_loader()
+            self._marker_cache_size = size
+            self.marker_loader = MarkerFrameLoader(self.current_video_path, size)
+            self.marker_loader.frame_ready.connect(self._on_marker_frame)
+            self.marker_loader.start()
+
+        frame_bytes = max(1, size[0] * size[1] * 4)
+        steps = min(MARKER_PREFETCH_STEPS, MARKER_CACHE_BYTES // frame_bytes // 2)
+        hops = {}  # frame_number -> jumps away from the current frame
+        for step in (self._next_timestamp, self._previous_timestamp):
+            frame_number = self.current_frame_number
+            for hop in range(max(1, steps)):
+                frame_number = self._timestamp_frame(step(frame_number / self.fps))
+                if frame_number in hops:
+                    break  # Wrapped round to a target already listed
+                hops[frame_number] = hop
+        targets = sorted(hops, key=hops.get)
+
+        missing = []
+        for frame_number in reversed(targets):
+            if frame_number in self._marker_cache:
+                self._marker_cache.move_to_end(frame_number)
+            else:
+                missing.append(frame_number)
+        self.marker_loader.request(reversed(missing))
+
+    def _stop_marker_loader(self):
+        """Stop any marker pre-decode and drop its frames."""
+        if self.marker_loader:
+            self.marker_loader.frame_ready.disconnect(self._on_marker_frame)
+            self.marker_loader.stop()
+            self.marker_loader = None
+        self._marker_cache.clear()
+        self._marker_cache_bytes = 0
+        self._marker_cache_size = None
+
+    def _on_marker_frame(self, frame_number: int, bgr_frame: np.ndarray):
+        """Store a pre-decoded marker frame, evicting the least recently used."""
+        h, w = bgr_frame.shape[:2]
+        q_image = QImage(
+            bgr_frame.data, w, h, bgr_frame.strides[0], QImage.Format.Format_BGR888
+        )
+        pixmap = QPixmap.fromImage(q_image)
+        replaced = self._marker_cache.pop(frame_number, None)
+        if replaced is not None:
+            self._marker_cache_bytes -= _pixmap_bytes(replaced)
+        self._marker_cache[frame_number] = pixmap
+        self._marker_cache_bytes += _pixmap_bytes(pixmap)
+        while (
+            len(self._marker_cache) > 1
+            and self._marker_cache_bytes > MARKER_CACHE_BYTES
+        ):
+            _, evicted = self._marker_cache.popitem(last=False)
+            self._marker_cache_bytes -= _pixmap_bytes(evicted)
 
     def _show_frame(self, frame_number: int):
-        """Display a specific frame."""
+        """
+        Display a specific frame.
+
+        Only backward or long seeks go through CAP_PROP_POS_FRAMES; when the
+        decoder is already positioned at frame_number (sequential playback)
+        the frame is read directly, and short forward steps grab through
+        the gap, instead of re-decoding from the nearest keyframe.
+        """
         if not self.cap:
             return
 
-        self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+        gap = frame_number - self._next_expected_frame
+        if self._next_expected_frame >= 0 and 0 < gap <= GRAB_SKIP_LIMIT:
+            # Short step forward: skip the colour conversion of the frames
+            # in between rather than seeking back to a keyframe
+            for _ in range(gap):
+                if not self.cap.grab():
+                    break
+        elif gap:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
         ret, frame = self.cap.read()
+        self._next_expected_frame = frame_number + 1 if ret else -1
 
         if ret:
-            # Convert BGR to RGB
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_frame.shape
-            bytes_per_line = ch * w
-
-            # Create QImage and QPixmap
-            q_image = QImage(
-                rgb_frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888
+            # Qt reads BGR directly, so no colour conversion pass is needed
+            self._display_frame(frame, frame_number)
+
+    def _display_frame(self, bgr_frame: np.ndarray, frame_number: int):
+        """Show a BGR frame and update the position widgets."""
+        # Scale to fit label while maintaining aspect ratio. One cv2.resize
+        # is much cheaper than Qt's SmoothTransformation on every frame.
+        h, w = bgr_frame.shape[:2]
+        label_w, label_h = self._display_size()
+        scale = min(label_w / w, label_h / h)
+        target = (max(1, int(w * scale)), max(1, int(h * scale)))
+        if target != (w, h):
+            # Resize into a persistent buffer wrapped by a persistent QImage,
+            # reallocated only when the display size changes
+            if self._display_buf is None or self._display_buf.shape[1::-1] != target:
+                self._display_buf = np.empty((target[1], target[0], 3), np.uint8)
+                self._display_image = QImage(
+                    self._display_buf.data,
+                    target[0],
+                    target[1],
+                    self._display_buf.strides[0],
+                    QImage.Format.Format_BGR888,
+                )
+            cv2.resize(
+                bgr_frame,
+                target,
+                dst=self._display_buf,
+                interpolation=cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR,
             )
-            pixmap = QPixmap.fromImage(q_image)
-
-            # Scale to fit label while maintaining aspect ratio
-            scaled_pixmap = pixmap.scaled(
-                self.video_label.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
+            q_image = self._display_image
+        else:
+            # fromImage copies the pixels, so bgr_frame only has to outlive
+            # the QImage within this method
+            q_image = QImage(
+                bgr_frame.data, w, h, bgr_frame.strides[0], QImage.Format.Format_BGR888
             )
-
-            self.video_label.setPixmap(scaled_pixmap)
-
-            # Update position
-            self.current_frame_number = frame_number
-            timestamp = frame_number / self.fps
-
-            if not self.slider_dragging:
-                self.position_slider.setValue(frame_number)
-
-            self.position_label.setText(self._format_time(int(timestamp)))
+        self.video_label.setPixmap(QPixmap.fromImage(q_image))
+        self._update_position(frame_number)
+
+    def _display_size(self):
+        """(width, height) available for the frame inside the label's border."""
+        size = self.video_label.contentsRect().size()
+        return size.width(), size.height()
+
+    def _update_position(self, frame_number: int):
+        """Record frame_number as shown and update the position widgets."""
+        self.current_frame_number = frame_number
+        timestamp = frame_number / self.fps
+
+        if not self.slider_dragging:
+            self.position_slider.setValue(frame_number)
+
+        self.position_label.setText(self._format_time(int(timestamp)))
+        # While playing, move the timeline cursor at ~10 Hz rather than per
+        # frame; seeks and stills always update it
+        if (
+            not self.is_playing
+            or abs(timestamp - self._last_timeline_update) >= TIMELINE_UPDATE_INTERVAL
+        ):
             self.timeline.set_current_position(timestamp)
+            self._last_timeline_update = timestamp
 
     def _update_frame(self):
-        """Update frame during playback."""
-        if not self.cap or not self.is_playing:
+        """
+        Display the frame that is due during playback and schedule the next.
+
+        Frames are paced against a clock rather than a fixed interval, so
+        queued frames that are already late are dropped and a slow frame
+        shortens the wait for the one after it.
+        """
+        if not self.decoder or not self.is_playing:
             return
 
-        next_frame = self.current_frame_number + 1
+        self.decoder.target_size = self._display_size()
+        due_frame = self._pace_origin + int(
+            self._pace_clock.elapsed() * self.fps / 1000
+        )
+        item = None
+        while True:
+            try:
+                queued = self.decoder.frames.get_nowait()
+            except queue.Empty:
+                # Decoder is behind; keep showing the latest frame we have
+                break
+            if queued[0] != self.decoder.generation:
+                continue
+            item = queued
+            if item[2] is None or item[1] >= due_frame:
+                break
+
+        if item is None or item[1] < due_frame:
+            # Behind: have the decoder grab past the late frames
+            self.decoder.skip_to = due_frame
 
-        if next_frame >= self.total_frames:
-            # End of video
-            self._toggle_playback()
-            return
+        if item is not None:
+            _, frame_number, frame = item
+            if frame is None or frame_number >= self.total_frames:
+                # End of video
+                self._toggle_playback()
+                return
+            self._display_frame(frame, frame_number)
 
-        self._show_frame(next_frame)
+        next_due_ms = (self.current_frame_number + 1 - self._pace_origin) * (
+            1000 / self.fps
+        )
+        self.timer.start(max(1, int(next_due_ms - self._pace_clock.elapsed())))
 
     def _toggle_playback(self):
         """Toggle between play and pause."""
@@ -316,20 +793,51 @@ class VideoPlayerWidget(QWidget):
 
         if self.is_playing:
             self.play_button.setText("Pause")
-            interval = int(1000 / self.fps)  # milliseconds
-            self.timer.start(interval)
+            self.decoder = FrameDecoderThread(
+                self.current_video_path, self.current_frame_number + 1
+            )
+            self.decoder.start()
+            self._restart_pacing()
         else:
             self.play_button.setText("Play")
             self.timer.stop()
+            self.decoder.stop()
+            self.decoder = None
+            # Catch the throttled timeline cursor up to the paused frame
+            self.timeline.set_current_position(self.current_frame_number / self.fps)
+            self._prefetch_markers()
 
     def _seek_to_timestamp(self, timestamp: float):
         """Seek to a specific timestamp in seconds."""
         if not self.cap:
             return
 
-        frame_number = int(timestamp * self.fps)
-        frame_number = max(0, min(frame_number, self.total_frames - 1))
-        self._show_frame(frame_number)
+        frame_number = self._timestamp_frame(timestamp)
+
+        pixmap = None
+        if self._display_size() == self._marker_cache_size:
+            pixmap = self._marker_cache.get(frame_number)
+        if pixmap is not None:
+            # Pre-decoded person timestamp: show it without touching self.cap
+            self._marker_cache.move_to_end(frame_number)
+            self.video_label.setPixmap(pixmap)
+            self._update_position(frame_number)
+        else:
+            self._show_frame(frame_number)
+        if self.decoder:
+            self.decoder.seek(frame_number + 1)
+            self._restart_pacing()
+        self._prefetch_markers()
+
+    def _timestamp_frame(self, timestamp: float) -> int:
+        """Frame number shown for timestamp, clamped to the video."""
+        return max(0, min(int(timestamp * self.fps), self.total_frames - 1))
+
+    def _restart_pacing(self):
+        """Restart the playback clock from the frame currently shown."""
+        self._pace_origin = self.current_frame_number
+        self._pace_clock.start()
+        self.timer.start(int(1000 / self.fps))  # milliseconds
 
     def _on_slider_pressed(self):
         """Handle slider press."""
@@ -342,6 +850,7 @@ class VideoPlayerWidget(QWidget):
         self.slider_dragging = False
         if self.cap:
             self._show_frame(self.position_slider.value())
+            self._prefetch_markers()
 
     def _on_slider_moved(self, value):
         """Handle slider movement."""
@@ -351,48 +860,39 @@ class VideoPlayerWidget(QWidget):
 
     def _go_to_previous(self):
         """Jump to previous timestamp."""
-        if not self.person_timestamps:
+        if not len(self.person_timestamps):
             return
 
         current_time = self.current_frame_number / self.fps
-
-        # Find previous timestamp
-        prev_timestamp = None
-        for ts in reversed(self.person_timestamps):
-            if ts < current_time - 1:  # 1 second threshold
-                prev_timestamp = ts
-                break
-
-        if prev_timestamp is None and self.person_timestamps:
-            # Wrap to last timestamp
-            prev_timestamp = self.person_timestamps[-1]
-
-        if prev_timestamp is not None:
-            self._seek_to_timestamp(prev_timestamp)
+        self._seek_to_timestamp(self._previous_timestamp(current_time))
 
     def _go_to_next(self):
         """Jump to next timestamp."""
-        if not self.person_timestamps:
+        if not len(self.person_timestamps):
             return
 
         current_time = self.current_frame_number / self.fps
-
-        # Find next timestamp
-        next_timestamp = None
-        for ts in self.person_timestamps:
-            if ts > current_time + 1:  # 1 second threshold
-                next_timestamp = ts
-                break
-
-        if next_timestamp is None and self.person_timestamps:
-            # Wrap to first timestamp
-            next_timestamp = self.person_timestamps[0]
-
-        if next_timestamp is not None:
-            self._seek_to_timestamp(next_timestamp)
+        self._seek_to_timestamp(self._next_timestamp(current_time))
+
+    def _previous_timestamp(self, current_time: float) -> float:
+        """Timestamp _go_to_previous jumps to from current_time."""
+        # person_timestamps is sorted; 1 second threshold, and an index of
+        # -1 wraps to the last timestamp
+        idx = np.searchsorted(self.person_timestamps, current_time - 1) - 1
+        return float(self.person_timestamps[idx])
+
+    def _next_timestamp(self, current_time: float) -> float:
+        """Timestamp _go_to_next jumps to from current_time."""
+        # person_timestamps is sorted; wrap to the first timestamp
+        idx = np.searchsorted(self.person_timestamps, current_time + 1, side="right")
+        if idx == len(self.person_timestamps):
+            idx = 0
+        return float(self.person_timestamps[idx])
 
     def _format_time(self, seconds):
         """Format seconds to MM:SS."""
+        if 0 <= seconds < len(_TIME_STRINGS):
+            return _TIME_STRINGS[seconds]
         minutes = seconds // 60
         seconds = seconds % 60
         return f"{minutes:02d}:{seconds:02d}"
@@ -401,10 +901,12 @@ class VideoPlayerWidget(QWidget):
         """Stop playback and release resources."""
         if self.is_playing:
             self._toggle_playback()
+        self._stop_marker_loader()
 
         if self.cap:
             self.cap.release()
             self.cap = None
+        self._next_expected_frame = -1
 
     def cleanup(self):
         """Clean up resources."""
@@ -3,17 +3,177 @@ Background workers for heavy processing tasks.
 Keeps the UI responsive during video processing.
 """
 
+import mmap
 import os
+import queue
+import shutil
+import sqlite3
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import groupby
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Tuple
 
 import cv2
+import dlib
 import face_recognition
 import numpy as np
 from PyQt6.QtCore import QThread, pyqtSignal
+from scipy.sparse import csr_matrix
 from sklearn.cluster import DBSCAN
 
+from database import (
+    ENCODING_DIM,
+    ENCODING_DTYPE,
+    ENCODING_FORMAT_FLOAT32,
+    FACE_THUMBNAIL_PACK,
+    encodings_sidecar_path,
+)
+
+try:
+    import faiss
+except ImportError:  # Optional: exact neighbour search is used without it
+    faiss = None
+
+# Smallest face dlib's HOG and CNN detectors find without upsampling
+HOG_MIN_FACE_SIZE = 80
+
+# Faces whose aligned chips are encoded together in one dlib call
+ENCODE_BATCH_FACES = 128
+
+# Aligned chip dlib's face encoder expects; the same size and padding
+# compute_face_descriptor uses when it aligns a face itself
+FACE_CHIP_SIZE = 150
+FACE_CHIP_PADDING = 0.25
+
+# Sampled ROI frames decoded ahead of face detection
+DECODE_QUEUE_SIZE = 8
+
+# Faces (and their thumbnail bytes) handed to the database per insert
+SAVE_BATCH_FACES = 1024
+
+# Above this many faces, eps-neighbourhoods come from an approximate FAISS
+# inverted-file index when faiss is installed; nprobe is the number of its
+# lists searched per query
+FAISS_MIN_FACES = 5000
+FAISS_NPROBE = 16
+
+# Distance matrix entries computed per block by the exact eps-graph (64 MB)
+DISTANCE_BLOCK_ELEMENTS = 1 << 24
+
+# Longest side of the face crops kept for thumbnails; the gallery shows
+# them at 120px, so this leaves room for 2x displays
+FACE_IMAGE_MAX_SIZE = 240
+
+
+def _dlib_has_cuda() -> bool:
+    """True when dlib was compiled with CUDA and sees a GPU."""
+    if not getattr(dlib, "DLIB_USE_CUDA", False):
+        return False
+    try:
+        return dlib.cuda.get_num_devices() > 0
+    except (AttributeError, RuntimeError):
+        return False
+
+
+def _eps_neighbors_graph(encodings: np.ndarray, eps: float) -> csr_matrix:
+    """
+    Sparse distance graph of the encoding pairs within eps of each other.
+
+    Exact for small sets; large ones use a FAISS IVF index when available,
+    which may miss a few neighbours near inverted-list boundaries.
+    """
+    n = len(encodings)
+    encodings = np.ascontiguousarray(encodings, dtype=np.float32)
+    if faiss is None or n <= FAISS_MIN_FACES:
+        return _exact_eps_neighbors_graph(encodings, eps)
+
+    # FAISS wants 39 training points per inverted list
+    nlist = min(int(4 * np.sqrt(n)), n // 39)
+    quantizer = faiss.IndexFlatL2(ENCODING_DIM)
+    index = faiss.IndexIVFFlat(quantizer, ENCODING_DIM, nlist, faiss.METRIC_L2)
+    index.train(encodings)
+    index.add(encodings)
+    index.nprobe = FAISS_NPROBE
+
+    # L2 range search works on squared distances; its result offsets are
+    # already the CSR row pointers
+    lims, sq_distances, neighbors = index.range_search(encodings, eps * eps)
+    return csr_matrix(
+        (np.sqrt(sq_distances), neighbors, lims.astype(np.int64)), shape=(n, n)
+    )
+
+
+def _exact_eps_neighbors_graph(encodings: np.ndarray, eps: float) -> csr_matrix:
+    """
+    Exact eps-neighbourhood graph from blocks of the float32 distance matrix.
+
+    Squared distances are expanded as |x|^2 + |y|^2 - 2 x.y, so each block
+    of rows is a single float32 matrix product (BLAS sgemm) against all
+    encodings, and only the pairs within eps are kept.
+    """
+    n = len(encodings)
+    sq_norms = np.einsum("ij,ij->i", encodings, encodings)
+    block_rows = max(1, DISTANCE_BLOCK_ELEMENTS // n)
+    eps_sq = np.float32(eps * eps)
+
+    row_counts = []
+    indices = []
+    distances = []
+    for start in range(0, n, block_rows):
+        block = encodings[start : start + block_rows]
+        sq_dist = block @ encodings.T
+        sq_dist *= -2
+        sq_dist += sq_norms[start : start + block_rows, None]
+        sq_dist += sq_norms
+        rows, cols = np.nonzero(sq_dist <= eps_sq)
+        row_counts.append(np.bincount(rows, minlength=len(block)))
+        indices.append(cols)
+        # Rounding can push a near-duplicate's squared distance below zero
+        distances.append(np.sqrt(np.maximum(sq_dist[rows, cols], 0)))
+
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.concatenate(row_counts), out=indptr[1:])
+    return csr_matrix(
+        (np.concatenate(distances), np.concatenate(indices), indptr), shape=(n, n)
+    )
+
+
+def _thumbnail_crop(face_img: np.ndarray) -> np.ndarray:
+    """Copy of face_img, downscaled to FACE_IMAGE_MAX_SIZE on its longest side."""
+    h, w = face_img.shape[:2]
+    scale = FACE_IMAGE_MAX_SIZE / max(h, w)
+    if scale >= 1.0:
+        return face_img.copy()
+    return cv2.resize(
+        face_img,
+        (max(1, round(w * scale)), max(1, round(h * scale))),
+        interpolation=cv2.INTER_AREA,
+    )
+
+
+def _encode_jpeg(image: np.ndarray) -> np.ndarray:
+    """JPEG-encode image into a byte buffer."""
+    ok, jpeg = cv2.imencode(".jpg", image)
+    if not ok:
+        raise ValueError("Failed to encode face thumbnail")
+    return jpeg
+
+
+def group_cluster_indices(labels) -> dict:
+    """Map each cluster label to the ascending indices of its faces, in one pass."""
+    labels = np.asarray(labels)
+    order = np.argsort(labels, kind="stable")
+    unique_labels, starts, counts = np.unique(
+        labels[order], return_index=True, return_counts=True
+    )
+    return {
+        label: order[start : start + count]
+        for label, start, count in zip(unique_labels.tolist(), starts, counts)
+    }
+
 
 class FaceProcessingWorker(QThread):
     """
@@ -37,12 +197,14 @@ class FaceProcessingWorker(QThread):
         video_id: int,
         database,
         parent=None,
+        capture=None,
     ):
         super().__init__(parent)
         self.video_path = video_path
         self.roi = roi  # (x, y, w, h)
         self.video_id = video_id
         self.database = database
+        self.capture = capture  # Already-open cv2.VideoCapture to reuse
 
         # Processing parameters
         self.frame_skip = 15  # Process every Nth frame for speed
@@ -51,19 +213,33 @@ class FaceProcessingWorker(QThread):
         self.min_samples = 2  # Minimum faces to form a cluster
         self.start_time = 0.0  # Start time in seconds
         self.end_time = None  # End time in seconds (None = end of video)
+        # CNN detector when dlib was built with CUDA, HOG on the CPU otherwise
+        self.use_gpu = _dlib_has_cuda()
+        self.detection_model = "cnn" if self.use_gpu else "hog"
 
         # Data storage
         self.face_encodings = []
         self.face_locations = []
         self.face_timestamps = []
         self.face_frame_numbers = []
-        self.face_images = []
+        # Face crops are JPEG-encoded as they are found and appended to one
+        # pack file in thumbnail_dir, so only their (offset, length) spans
+        # stay in memory
+        self.face_thumbnail_spans = []
+        self._encode_pool = None
+        self._encoded = deque()  # JPEG futures not yet in the pack, in order
+        self._pack_file = None
+        # (face_chip, face_image, location, frame_num, timestamp) to encode
+        self._pending_faces = []
+        self._rgb_buffer = None  # Reused for every sampled frame
 
         # Thumbnail storage
         self.thumbnail_dir = Path("thumbnails") / str(video_id)
         self.thumbnail_dir.mkdir(parents=True, exist_ok=True)
+        self.face_thumbnail_pack = self.thumbnail_dir / FACE_THUMBNAIL_PACK
 
         self._is_running = True
+        self._is_running_decode = True
 
     def run(self):
         """Main processing loop - runs in background thread."""
@@ -93,7 +269,19 @@ class FaceProcessingWorker(QThread):
 
     def _detect_faces(self) -> bool:
         """Detect faces in video frames."""
-        cap = cv2.VideoCapture(self.video_path)
+        # Reuse a capture handed over by the caller instead of reopening
+        cap = self.capture
+        self.capture = None
+        if cap is None:
+            # Decode on NVDEC/VAAPI/etc. when FFmpeg has a device; it falls
+            # back to software decoding otherwise
+            cap = cv2.VideoCapture(
+                self.video_path,
+                cv2.CAP_FFMPEG,
+                [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+            )
+            if not cap.isOpened():
+                cap = cv2.VideoCapture(self.video_path)
 
         if not cap.isOpened():
             self.processing_finished.emit(False, "Failed to open video file")
@@ -109,45 +297,71 @@ class FaceProcessingWorker(QThread):
         else:
             end_frame = total_frames
 
-        # Seek to start frame
-        cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+        # Seek to start frame, unless the capture is already there
+        if int(cap.get(cv2.CAP_PROP_POS_FRAMES)) != start_frame:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
 
-        frame_num = start_frame
         processed_frames = 0
         faces_found = 0
 
-        while self._is_running and cap.isOpened() and frame_num < end_frame:
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            # Only process every Nth frame
-            if (frame_num - start_frame) % self.frame_skip == 0:
-                timestamp = frame_num / fps if fps > 0 else 0
-
-                # Crop to ROI
-                x, y, w, h = self.roi
-                roi_frame = frame[y : y + h, x : x + w]
-
-                # Detect faces in ROI
-                faces = self._detect_faces_in_frame(roi_frame, frame_num, timestamp)
-                faces_found += len(faces)
-
-                processed_frames += 1
-
-                # Update progress (0-80% for detection)
-                frames_in_range = end_frame - start_frame
-                progress = (
-                    int(((frame_num - start_frame) / frames_in_range) * 80)
-                    if frames_in_range > 0
-                    else 0
-                )
-                status = f"Detecting faces... Frame {frame_num}/{end_frame} ({faces_found} faces found)"
-                self.progress_update.emit(progress, status)
-
-            frame_num += 1
+        # Face crop JPEG encoding overlaps with decoding and detection
+        self._encode_pool = ThreadPoolExecutor(max_workers=4)
+        try:
+            self._pack_file = open(self.face_thumbnail_pack, "wb")
+
+            # Decoding runs on its own thread, a bounded queue ahead of detection;
+            # OpenCV releases the GIL while it decodes
+            frames = queue.Queue(maxsize=DECODE_QUEUE_SIZE)
+            decode_pool = ThreadPoolExecutor(max_workers=1)
+            decoding = decode_pool.submit(
+                self._decode_sampled_frames, cap, start_frame, end_frame, frames
+            )
 
-        cap.release()
+            try:
+                while self._is_running:
+                    item = frames.get()
+                    if item is None:
+                        break
+                    frame_num, roi_frame = item
+
+                    timestamp = frame_num / fps if fps > 0 else 0
+
+                    # Detect faces in ROI
+                    faces = self._detect_faces_in_frame(roi_frame, frame_num, timestamp)
+                    faces_found += len(faces)
+
+                    processed_frames += 1
+
+                    # Update progress (0-80% for detection)
+                    frames_in_range = end_frame - start_frame
+                    progress = (
+                        int(((frame_num - start_frame) / frames_in_range) * 80)
+                        if frames_in_range > 0
+                        else 0
+                    )
+                    status = f"Detecting faces... Frame {frame_num}/{end_frame} ({faces_found} faces found)"
+                    self.progress_update.emit(progress, status)
+            finally:
+                # Stopping early leaves the decoder waiting on a full queue
+                self._is_running_decode = False
+                decoding.result()
+                decode_pool.shutdown()
+
+            self._encode_pending_faces()
+
+            # Pack the remaining crops, surfacing any encode error before the
+            # pack is used
+            self._pack_encoded(wait=True)
+        finally:
+            # Released on errors too; faces not yet encoded are dropped
+            cap.release()
+            self._pending_faces.clear()
+            self._encoded.clear()
+            if self._pack_file is not None:
+                self._pack_file.close()
+                self._pack_file = None
+            self._encode_pool.shutdown(cancel_futures=True)
+            self._encode_pool = None
 
         if faces_found == 0:
             self.processing_finished.emit(
@@ -157,54 +371,171 @@ class FaceProcessingWorker(QThread):
 
         return True
 
+    def _decode_sampled_frames(
+        self, cap, start_frame: int, end_frame: int, frames: queue.Queue
+    ):
+        """
+        Decode every frame_skip-th frame in range and queue its ROI crop.
+
+        Runs on a helper thread; queues (frame_num, roi_frame) items and a
+        final None.
+        """
+        x, y, w, h = self.roi
+        roi_slice = (slice(y, y + h), slice(x, x + w))
+        frame_num = start_frame
+        try:
+            while (
+                self._is_running_decode and cap.isOpened() and frame_num < end_frame
+            ):
+                # Advance with grab(); only sampled frames pay for
+                # retrieve()'s conversion to a BGR array
+                if not cap.grab():
+                    break
+
+                # Only process every Nth frame
+                if (frame_num - start_frame) % self.frame_skip == 0:
+                    ret, frame = cap.retrieve()
+                    if not ret:
+                        break
+                    # Crop to ROI
+                    self._put_decoded(frames, (frame_num, frame[roi_slice]))
+
+                frame_num += 1
+        finally:
+            self._put_decoded(frames, None)
+
+    def _put_decoded(self, frames: queue.Queue, item):
+        """Queue item for detection, giving up once detection has stopped."""
+        while self._is_running_decode:
+            try:
+                frames.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
     def _detect_faces_in_frame(
         self, frame: np.ndarray, frame_num: int, timestamp: float
-    ) -> List[dict]:
-        """Detect faces in a single frame."""
-        # Convert BGR to RGB for face_recognition
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-        # Detect faces - using HOG model (faster, good for frontal faces)
-        # For better accuracy, use model='cnn' but it's much slower
-        face_locations = face_recognition.face_locations(rgb_frame, model="hog")
+    ) -> List[Tuple[int, int, int, int]]:
+        """
+        Detect faces in a single frame and queue them for encoding.
+
+        Returns the kept face locations; their encodings are computed in
+        batches by _encode_pending_faces.
+        """
+        # Convert BGR to RGB for face_recognition, into the previous frame's
+        # buffer; only aligned face chips outlive this call
+        rgb_frame = self._rgb_buffer
+        if rgb_frame is None or rgb_frame.shape != frame.shape:
+            rgb_frame = np.empty_like(frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+        self._rgb_buffer = rgb_frame
+
+        # Detect faces - HOG on the CPU (fast, good for frontal faces), or
+        # the more accurate CNN when dlib can run it on a CUDA GPU.
+        # Detection runs at the coarsest resolution that still finds
+        # min_face_size faces; encodings use the full-resolution frame.
+        scale, upsample = self._detection_scale()
+        if scale < 1.0:
+            small_frame = cv2.resize(
+                rgb_frame, (0, 0), fx=scale, fy=scale, interpolation=cv2.INTER_AREA
+            )
+        else:
+            small_frame = rgb_frame
+        face_locations = face_recognition.face_locations(
+            small_frame,
+            number_of_times_to_upsample=upsample,
+            model=self.detection_model,
+        )
 
         if not face_locations:
             return []
 
-        # Get face encodings
-        face_encodings = face_recognition.face_encodings(rgb_frame, face_locations)
+        # (top, right, bottom, left) rows, scaled back and filtered together
+        locs = np.array(face_locations, dtype=np.float32)
+        if scale < 1.0:
+            height, width = rgb_frame.shape[:2]
+            locs /= scale
+            np.clip(locs, 0, [height, width, height, width], out=locs)
+        locs = locs.astype(np.int32)
+
+        # Filter out small faces before paying for their encodings
+        keep = (locs[:, 1] - locs[:, 3] >= self.min_face_size) & (
+            locs[:, 2] - locs[:, 0] >= self.min_face_size
+        )
+        face_locations = [tuple(loc) for loc in locs[keep].tolist()]
+        # Align each face here (5-point landmarks, as face_recognition does)
+        # and keep only its chip and thumbnail crop, not frame, which is a
+        # view into the full decoded frame
+        pose_predictor = face_recognition.api.pose_predictor_5_point
+        for location in face_locations:
+            top, right, bottom, left = location
+            landmarks = pose_predictor(
+                rgb_frame, dlib.rectangle(left, top, right, bottom)
+            )
+            face_chip = dlib.get_face_chip(
+                rgb_frame, landmarks, size=FACE_CHIP_SIZE, padding=FACE_CHIP_PADDING
+            )
+            face_img = _thumbnail_crop(frame[top:bottom, left:right])
+            self._pending_faces.append(
+                (face_chip, face_img, location, frame_num, timestamp)
+            )
+        if len(self._pending_faces) >= ENCODE_BATCH_FACES:
+            self._encode_pending_faces()
+
+        return face_locations
 
-        detected_faces = []
+    def _encode_pending_faces(self):
+        """
+        Encode the queued face chips with one batched dlib call.
 
-        for location, encoding in zip(face_locations, face_encodings):
-            top, right, bottom, left = location
+        The chips are already aligned, so the ResNet descriptor model runs
+        once for up to ENCODE_BATCH_FACES faces; the descriptors match what
+        face_recognition.face_encodings computes from the whole frame.
+        """
+        if not self._pending_faces:
+            return
 
-            # Filter out small faces
-            face_width = right - left
-            face_height = bottom - top
-            if face_width < self.min_face_size or face_height < self.min_face_size:
-                continue
+        descriptors = face_recognition.api.face_encoder.compute_face_descriptor(
+            [pending[0] for pending in self._pending_faces], 1
+        )
 
-            # Extract face image for thumbnail
-            face_img = frame[top:bottom, left:right].copy()
+        for pending, descriptor in zip(self._pending_faces, descriptors):
+            _, face_img, location, frame_num, timestamp = pending
+            self._encoded.append(self._encode_pool.submit(_encode_jpeg, face_img))
 
-            # Store data
-            self.face_encodings.append(encoding)
+            # Store data; float32 is the storage dtype and halves the
+            # memory and clustering bandwidth of dlib's float64 vectors
+            self.face_encodings.append(np.asarray(descriptor, dtype=ENCODING_DTYPE))
             self.face_locations.append(location)
             self.face_timestamps.append(timestamp)
             self.face_frame_numbers.append(frame_num)
-            self.face_images.append(face_img)
-
-            detected_faces.append(
-                {
-                    "location": location,
-                    "encoding": encoding,
-                    "timestamp": timestamp,
-                    "frame_num": frame_num,
-                }
-            )
 
-        return detected_faces
+        self._pending_faces.clear()
+        self._pack_encoded()
+
+    def _pack_encoded(self, wait: bool = False):
+        """
+        Append encoded face crops to the pack file, in face order.
+
+        Stops at the first crop still being encoded unless wait is set.
+        """
+        while self._encoded and (wait or self._encoded[0].done()):
+            jpeg = self._encoded.popleft().result()
+            self.face_thumbnail_spans.append((self._pack_file.tell(), len(jpeg)))
+            self._pack_file.write(jpeg)
+
+    def _detection_scale(self) -> Tuple[float, int]:
+        """
+        Resize factor and HOG upsample count for face detection.
+
+        Each upsample halves the smallest face HOG can find, at four times
+        the pixels. Faces under min_face_size are discarded anyway, so the
+        default of 40px keeps the full-resolution single upsample, while
+        larger minimums detect on a smaller image.
+        """
+        needed = HOG_MIN_FACE_SIZE / max(self.min_face_size, 1)
+        upsample = 1 if needed > 1.0 else 0
+        return min(1.0, needed / (2**upsample)), upsample
 
     def _cluster_faces(self) -> bool:
         """Cluster detected faces using DBSCAN."""
@@ -212,103 +543,125 @@ class FaceProcessingWorker(QThread):
             return False
 
         # Convert to numpy array
-        encodings_array = np.array(self.face_encodings)
+        encodings_array = np.array(self.face_encodings, dtype=ENCODING_DTYPE)
 
-        # Perform clustering
+        # Perform clustering on a sparse graph of the pairs within eps, so
+        # memory follows the neighbourhood sizes rather than all pairs
+        graph = _eps_neighbors_graph(encodings_array, self.clustering_eps)
         clustering = DBSCAN(
-            eps=self.clustering_eps, min_samples=self.min_samples, metric="euclidean"
-        ).fit(encodings_array)
+            eps=self.clustering_eps, min_samples=self.min_samples, metric="precomputed"
+        ).fit(graph)
 
         self.labels = clustering.labels_
 
-        # Count unique clusters (excluding noise: label -1)
-        unique_labels = set(self.labels)
-        n_clusters = len(unique_labels) - (1 if -1 in unique_labels else 0)
+        # Face count of every cluster in one pass (excluding noise: label -1)
+        counts = np.bincount(self.labels[self.labels >= 0])
+        cluster_ids = np.flatnonzero(counts)
+        n_clusters = len(cluster_ids)
 
         # Prepare cluster info
-        cluster_info = []
-        for label in unique_labels:
-            if label == -1:
-                continue  # Skip noise
-
-            face_count = np.sum(self.labels == label)
-            cluster_info.append(
-                {"cluster_id": int(label), "face_count": int(face_count)}
+        cluster_info = [
+            {"cluster_id": label, "face_count": count}
+            for label, count in zip(
+                cluster_ids.tolist(), counts[cluster_ids].tolist()
             )
+        ]
 
         self.faces_clustered.emit(n_clusters, cluster_info)
         return True
 
     def _save_to_database(self):
         """Save clustered faces to database."""
-        # Get unique cluster labels
-        unique_labels = set(self.labels)
-
-        # Create person entries for each cluster
-        person_map = {}  # cluster_id -> person_id
+        # Write every row for this video in one transaction; on a first
+        # import the face indexes are built once at the end, not per row
+        saving = self.video_id != 0 and self.database
+        with self.database.bulk_ingest() if saving else nullcontext():
+            # Face crops are already JPEGs in the pack file; here they are
+            # only sliced out of a read-only map of it
+            pack_file = open(self.face_thumbnail_pack, "rb")
+            pack = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+            spans = self.face_thumbnail_spans
+
+            # Create person entries for each cluster
+            person_map = {}  # cluster_id -> person_id
+            person_rows = []
+
+            for cluster_id, cluster_indices in group_cluster_indices(
+                self.labels
+            ).items():
+                if cluster_id == -1:
+                    continue  # Skip noise
+
+                # Find a representative face for thumbnail (first occurrence)
+                first_idx = cluster_indices[0]
+
+                # Save thumbnail
+                thumbnail_path = self.thumbnail_dir / f"person_{cluster_id}.jpg"
+                offset, length = spans[first_idx]
+                thumbnail_path.write_bytes(pack[offset : offset + length])
 
-        for cluster_id in unique_labels:
-            if cluster_id == -1:
-                continue  # Skip noise
-
-            # Find a representative face for thumbnail (first occurrence)
-            cluster_indices = np.where(self.labels == cluster_id)[0]
-            first_idx = cluster_indices[0]
-
-            # Save thumbnail
-            thumbnail_path = self.thumbnail_dir / f"person_{cluster_id}.jpg"
-            cv2.imwrite(str(thumbnail_path), self.face_images[first_idx])
-
-            # Add person to database (only if video is saved)
-            if self.video_id != 0 and self.database:
-                person_id = self.database.add_person(
-                    video_id=self.video_id,
-                    cluster_id=int(cluster_id),
-                    name=f"Person {cluster_id + 1}",
-                    thumbnail_path=str(thumbnail_path),
-                )
-                person_map[cluster_id] = person_id
-            else:
                 # Use cluster_id as temporary person_id for unsaved videos
                 person_map[cluster_id] = cluster_id
+                person_rows.append(
+                    {
+                        "video_id": self.video_id,
+                        "cluster_id": int(cluster_id),
+                        "name": f"Person {cluster_id + 1}",
+                        "thumbnail_path": str(thumbnail_path),
+                    }
+                )
 
-        # Add all face instances
-        for idx, cluster_id in enumerate(self.labels):
-            if cluster_id == -1:
-                continue  # Skip noise
-
-            person_id = person_map[cluster_id]
-
-            # Save face thumbnail
-            face_thumbnail_path = self.thumbnail_dir / f"face_{idx}.jpg"
-            cv2.imwrite(str(face_thumbnail_path), self.face_images[idx])
-
-            # Get bbox (convert from face_recognition format)
-            top, right, bottom, left = self.face_locations[idx]
-            bbox = (left, top, right - left, bottom - top)
-
-            # Add to database (only if video is saved)
+            # Add persons to database in one insert (only if video is saved)
             if self.video_id != 0 and self.database:
-                self.database.add_face_instance(
-                    person_id=person_id,
-                    video_id=self.video_id,
-                    timestamp=self.face_timestamps[idx],
-                    frame_number=self.face_frame_numbers[idx],
-                    bbox=bbox,
-                    encoding=self.face_encodings[idx],
-                    confidence=1.0,
-                    thumbnail_path=str(face_thumbnail_path),
-                )
+                person_ids = self.database.add_persons(person_rows)
+                person_map = dict(zip(person_map, person_ids))
 
-        # Update video status (only if video is saved)
-        if self.video_id != 0 and self.database:
-            self.database.update_video_status(self.video_id, "completed")
+            # Add all face instances (only if video is saved), in batches so
+            # each appends its thumbnails to the database's pack in one write
+            if self.video_id != 0 and self.database:
+                # Person id of every face at once, through a label-indexed
+                # table; noise (label -1) gets no face row
+                person_ids = np.zeros(max(person_map, default=-1) + 1, dtype=np.int64)
+                for cluster_id, person_id in person_map.items():
+                    person_ids[cluster_id] = person_id
+                clustered = np.flatnonzero(self.labels >= 0)
+                face_person_ids = person_ids[self.labels[clustered]]
+
+                rows = []
+                for idx, person_id in zip(clustered.tolist(), face_person_ids.tolist()):
+                    # Get bbox (convert from face_recognition format)
+                    top, right, bottom, left = self.face_locations[idx]
+                    offset, length = spans[idx]
+                    rows.append(
+                        {
+                            "person_id": person_id,
+                            "video_id": self.video_id,
+                            "timestamp": self.face_timestamps[idx],
+                            "frame_number": self.face_frame_numbers[idx],
+                            "bbox": (left, top, right - left, bottom - top),
+                            "encoding": self.face_encodings[idx],
+                            "confidence": 1.0,
+                            "thumbnail": pack[offset : offset + length],
+                        }
+                    )
+                    if len(rows) >= SAVE_BATCH_FACES:
+                        self.database.add_face_instances(rows)
+                        rows.clear()
+                self.database.add_face_instances(rows)
+
+            pack.close()
+            pack_file.close()
+
+            # Update video status (only if video is saved)
+            if self.video_id != 0 and self.database:
+                self.database.update_video_status(self.video_id, "completed")
 
         # Emit complete cluster data for display (even if not saved to database)
         cluster_data = {
             "person_map": person_map,
             "labels": self.labels,
-            "face_images": self.face_images,
+            "face_thumbnail_pack": self.face_thumbnail_pack,
+            "face_thumbnail_spans": self.face_thumbnail_spans,
             "face_timestamps": self.face_timestamps,
             "face_locations": self.face_locations,
             "face_encodings": self.face_encodings,
@@ -322,6 +675,338 @@ class FaceProcessingWorker(QThread):
         self.wait()
 
 
+class ProjectSaveWorker(QThread):
+    """
+    Worker for saving the current session to a project file.
+    Runs in a separate thread so large projects don't freeze the UI.
+    """
+
+    progress_update = pyqtSignal(int, str)  # (percentage, status_message)
+    save_finished = pyqtSignal(bool, str)  # (success, message)
+
+    def __init__(
+        self,
+        cluster_data: dict,
+        video_info: dict,
+        roi: Tuple[int, int, int, int],
+        video_path: str,
+        dest_path: str,
+        person_names: dict,
+        database,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.cluster_data = cluster_data
+        self.video_info = video_info
+        self.roi = roi
+        self.video_path = video_path
+        self.dest_path = dest_path
+        self.person_names = dict(person_names)  # Snapshot of renames
+        self.database = database
+
+    def run(self):
+        """Write the project database and copy its thumbnails."""
+        try:
+            self._write_project()
+        except Exception as e:
+            self.save_finished.emit(False, f"Failed to save project:\n{str(e)}")
+            return
+
+        self.progress_update.emit(100, "Project saved!")
+        self.save_finished.emit(True, f"Project saved to {self.dest_path}")
+
+    def _write_project(self):
+        """
+        Write the project file, its encodings and thumbnails.
+
+        Every file, the copy pool and the project connection are released
+        before this returns or raises; on error the project transaction is
+        rolled back, so nothing is left open or locked.
+        """
+        project_db = None
+        copy_pool = None
+        src_pack_file = src_pack = dest_pack = None
+        try:
+            self.progress_update.emit(0, "Creating project file...")
+
+            # Create a new database for this project: backup() copies the
+            # current database's pages, schema included, in one C-level pass
+            # that ingest writes wait for
+            project_db = sqlite3.connect(self.dest_path)
+            project_db.row_factory = sqlite3.Row
+            self.database.backup(project_db)
+            # The copy inherits WAL mode; a project is one self-contained file
+            project_db.execute("PRAGMA journal_mode = DELETE")
+            project_db.execute("PRAGMA synchronous = NORMAL")
+
+            # Write the whole project in one transaction
+            project_db.execute("BEGIN")
+
+            # Only the schema is wanted from the copy
+            for table in ("face_instances", "persons", "videos"):
+                project_db.execute(f"DELETE FROM {table}")
+
+            # Store video metadata including path
+            cursor = project_db.cursor()
+            cursor.execute(
+                """
+                INSERT INTO videos (file_path, file_name, duration, fps, width, height,
+                                   roi_x, roi_y, roi_w, roi_h, processing_status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'completed')
+            """,
+                (
+                    self.video_path,
+                    Path(self.video_path).name,
+                    self.video_info["duration"],
+                    self.video_info["fps"],
+                    self.video_info["width"],
+                    self.video_info["height"],
+                    self.roi[0],
+                    self.roi[1],
+                    self.roi[2],
+                    self.roi[3],
+                ),
+            )
+            video_id = cursor.lastrowid
+
+            # Save persons and faces
+            cluster_data = self.cluster_data
+            person_map = cluster_data["person_map"]
+            labels = cluster_data["labels"]
+            face_timestamps = cluster_data["face_timestamps"]
+            face_locations = cluster_data["face_locations"]
+            thumbnail_dir = cluster_data["thumbnail_dir"]
+
+            # Encodings go to the project's raw float32 sidecar file, the
+            # layout Database reads; each face row only records its row there
+            face_encodings = np.ascontiguousarray(
+                cluster_data["face_encodings"], dtype=ENCODING_DTYPE
+            )
+            encoding_order = []  # face index of each sidecar row
+
+            # Create thumbnails directory in project file location
+            dest_path = Path(self.dest_path)
+            project_thumbnails = dest_path.parent / f"{dest_path.stem}_thumbnails"
+            project_thumbnails.mkdir(exist_ok=True)
+
+            # Person thumbnail paths are plain strings built from these
+            # prefixes, checked against one directory listing
+            src_prefix = os.path.join(str(thumbnail_dir), "")
+            dest_prefix = os.path.join(str(project_thumbnails), "")
+            with os.scandir(thumbnail_dir) as entries:
+                src_names = {entry.name for entry in entries}
+
+            # Face thumbnails are copied span by span from the session's pack
+            # file into a pack of the project's own, written sequentially
+            face_spans = cluster_data["face_thumbnail_spans"]
+            src_pack_file = open(cluster_data["face_thumbnail_pack"], "rb")
+            src_pack = mmap.mmap(src_pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+            dest_pack = open(dest_prefix + FACE_THUMBNAIL_PACK, "wb")
+
+            # Row ids are assigned here so faces can reference their person
+            # before the batched inserts run
+            next_person_id, next_face_id = cursor.execute(
+                """
+                SELECT (SELECT COALESCE(MAX(id), 0) FROM persons) + 1,
+                       (SELECT COALESCE(MAX(id), 0) FROM face_instances) + 1
+            """
+            ).fetchone()
+            person_rows = []
+            face_rows = []
+
+            # Person thumbnail copies run on a pool, overlapping with each
+            # other and with building the rows
+            copy_pool = ThreadPoolExecutor(max_workers=8)
+            copies = []
+
+            cluster_indices = group_cluster_indices(labels)
+            total_faces = sum(len(cluster_indices[c]) for c in person_map)
+
+            for cluster_id, person_id in person_map.items():
+                # Copy person thumbnail
+                thumb_name = f"person_{cluster_id}.jpg"
+                dest_thumb = dest_prefix + thumb_name
+                if thumb_name in src_names:
+                    copies.append(
+                        copy_pool.submit(
+                            shutil.copyfile, src_prefix + thumb_name, dest_thumb
+                        )
+                    )
+
+                # Get custom name if user renamed this person
+                person_name = self.person_names.get(
+                    person_id, f"Person {cluster_id + 1}"
+                )
+
+                db_person_id = next_person_id
+                next_person_id += 1
+                person_rows.append(
+                    (
+                        db_person_id,
+                        video_id,
+                        int(cluster_id),
+                        person_name,
+                        dest_thumb,
+                    )
+                )
+
+                # Add face instances
+                for idx in cluster_indices[cluster_id].tolist():
+                    face_id = next_face_id
+                    next_face_id += 1
+
+                    saved = len(face_rows)
+                    if saved % 64 == 0:
+                        self.progress_update.emit(
+                            saved * 90 // total_faces,
+                            f"Saving face {saved}/{total_faces}",
+                        )
+
+                    # Get bbox
+                    top, right, bottom, left = face_locations[idx]
+
+                    offset, length = face_spans[idx]
+                    thumb_offset = dest_pack.tell()
+                    dest_pack.write(src_pack[offset : offset + length])
+
+                    face_rows.append(
+                        (
+                            face_id,
+                            db_person_id,
+                            video_id,
+                            face_timestamps[idx],
+                            0,
+                            left,
+                            top,
+                            right - left,
+                            bottom - top,
+                            ENCODING_FORMAT_FLOAT32,
+                            len(encoding_order),
+                            ENCODING_DIM,
+                            thumb_offset,
+                            length,
+                            1.0,
+                        )
+                    )
+                    encoding_order.append(idx)
+
+            cursor.executemany(
+                """
+                INSERT INTO persons (id, video_id, cluster_id, name, thumbnail_path)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                person_rows,
+            )
+            cursor.executemany(
+                """
+                INSERT INTO face_instances (id, person_id, video_id, timestamp, frame_number,
+                                           bbox_x, bbox_y, bbox_w, bbox_h, encoding_dtype,
+                                           enc_offset, enc_dim, thumb_offset,
+                                           thumb_length, confidence)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                face_rows,
+            )
+            rows = face_encodings[np.asarray(encoding_order, dtype=np.intp)]
+            with open(encodings_sidecar_path(self.dest_path), "wb") as f:
+                f.write(np.ascontiguousarray(rows, dtype=np.float32).tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Wait for the copies and surface any copy error before commit
+            for copy in copies:
+                copy.result()
+            dest_pack.close()
+
+            self.progress_update.emit(95, "Writing project file...")
+            project_db.commit()
+
+        finally:
+            if copy_pool is not None:
+                copy_pool.shutdown(cancel_futures=True)
+            for handle in (dest_pack, src_pack, src_pack_file):
+                if handle is not None:
+                    handle.close()
+            if project_db is not None:
+                if project_db.in_transaction:
+                    project_db.rollback()
+                project_db.close()
+
+
+class GalleryLoadWorker(QThread):
+    """
+    Worker for reading a saved project's persons and face timestamps.
+    Runs in a separate thread so large projects don't stall the UI.
+    """
+
+    # (person rows, person_id -> sorted timestamp array)
+    persons_loaded = pyqtSignal(list, dict)
+    load_failed = pyqtSignal(str)  # error message
+
+    def __init__(self, project_path: str, video_id: int, parent=None):
+        super().__init__(parent)
+        self.project_path = project_path
+        self.video_id = video_id
+        self._connection = None
+        self._is_running = True
+
+    def run(self):
+        """Query the persons and their face timestamps."""
+        try:
+            self._connection = sqlite3.connect(self.project_path)
+            self._connection.row_factory = sqlite3.Row
+            try:
+                persons = [
+                    {
+                        "id": person["id"],
+                        "name": person["name"],
+                        "thumbnail_path": person["thumbnail_path"],
+                    }
+                    for person in self._connection.execute(
+                        "SELECT id, name, thumbnail_path FROM persons"
+                        " WHERE video_id = ?",
+                        (self.video_id,),
+                    )
+                ]
+
+                # Every face timestamp in one query, grouped per person
+                rows = self._connection.execute(
+                    """
+                    SELECT person_id, timestamp FROM face_instances
+                    WHERE video_id = ?
+                    ORDER BY person_id, timestamp
+                """,
+                    (self.video_id,),
+                ).fetchall()
+            finally:
+                self._connection.close()
+
+            timestamps_by_person = {
+                person_id: np.fromiter(
+                    (row["timestamp"] for row in person_rows), dtype=np.float64
+                )
+                for person_id, person_rows in groupby(
+                    rows, key=lambda row: row["person_id"]
+                )
+            }
+            if self._is_running:
+                self.persons_loaded.emit(persons, timestamps_by_person)
+
+        except Exception as e:
+            if self._is_running:
+                self.load_failed.emit(f"Failed to load project:\n{str(e)}")
+
+    def cancel(self):
+        """Stop loading without waiting; a running query is interrupted."""
+        self._is_running = False
+        connection = self._connection
+        if connection is not None:
+            try:
+                connection.interrupt()
+            except sqlite3.ProgrammingError:
+                pass  # Already closed
+
+
 class VideoExportWorker(QThread):
     """Worker for exporting video clips of a specific person."""
 